@@ -2,6 +2,7 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
+import re
 import sys
 from pathlib import Path
 
@@ -25,6 +26,13 @@ config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 # add your model's MetaData object here
 target_metadata = Base.metadata
 
+# Yearly archive partitions are created at runtime by the archiver, not by migrations
+ARCHIVE_PARTITION_RE = re.compile(r"^applications_archive_\d{4}$")
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate from proposing to drop runtime-created partitions"""
+    return not (type_ == "table" and reflected and ARCHIVE_PARTITION_RE.match(name))
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -33,6 +41,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -49,7 +58,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection, 
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,28 @@
+"""add_file_hash_to_resumes
+
+Revision ID: 0f93c6b8e4d1
+Revises: b4c58e17d2a0
+Create Date: 2026-10-19 14:08:11.273590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f93c6b8e4d1'
+down_revision: Union[str, None] = 'b4c58e17d2a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('file_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_resumes_user_id_file_hash', 'resumes', ['user_id', 'file_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumes_user_id_file_hash', table_name='resumes')
+    op.drop_column('resumes', 'file_hash')
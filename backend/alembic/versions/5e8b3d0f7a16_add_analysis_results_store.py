@@ -0,0 +1,38 @@
+"""add_analysis_results_store
+
+Revision ID: 5e8b3d0f7a16
+Revises: a9d27f6e1c84
+Create Date: 2026-10-19 11:20:05.104733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b3d0f7a16'
+down_revision: Union[str, None] = 'a9d27f6e1c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('analysis_results',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('resume_hash', sa.String(length=64), nullable=False),
+    sa.Column('job_hash', sa.String(length=64), nullable=False),
+    sa.Column('prompt_version', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('resume_hash', 'job_hash', 'prompt_version', 'model', name='uq_analysis_results_key')
+    )
+    op.create_index(op.f('ix_analysis_results_created_at'), 'analysis_results', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_analysis_results_created_at'), table_name='analysis_results')
+    op.drop_table('analysis_results')
@@ -0,0 +1,55 @@
+"""add_applications_archive
+
+Revision ID: 6a1f4e9d2c73
+Revises: 0f93c6b8e4d1
+Create Date: 2026-10-19 15:02:37.418266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a1f4e9d2c73'
+down_revision: Union[str, None] = '0f93c6b8e4d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('applications_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('date_applied', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('company_name', sa.String(), nullable=False),
+    sa.Column('job_title', sa.String(), nullable=False),
+    sa.Column('job_url', sa.String(), nullable=True),
+    sa.Column('job_description', sa.Text(), nullable=True),
+    sa.Column('location', sa.String(), nullable=True),
+    sa.Column('salary_range', sa.String(), nullable=True),
+    sa.Column('status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('best_resume_id', sa.UUID(), nullable=True),
+    sa.Column('best_resume_score', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('interactions', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    sa.Column('ai_analyses', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'date_applied'),
+    postgresql_partition_by='RANGE (date_applied)'
+    )
+    op.create_index('ix_applications_archive_user_id_date_applied', 'applications_archive', ['user_id', 'date_applied'], unique=False)
+    # Cold data: compress large values with lz4 (the archiver sets the same on each yearly partition)
+    for column in ('job_description', 'notes', 'interactions', 'ai_analyses'):
+        op.execute(f"ALTER TABLE applications_archive ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_archive_user_id_date_applied', table_name='applications_archive')
+    # Dropping the partitioned parent drops its yearly partitions too
+    op.drop_table('applications_archive')
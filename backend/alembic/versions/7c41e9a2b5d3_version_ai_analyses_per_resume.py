@@ -0,0 +1,31 @@
+"""version_ai_analyses_per_resume
+
+Revision ID: 7c41e9a2b5d3
+Revises: 3bc8e1d312a9
+Create Date: 2026-10-19 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41e9a2b5d3'
+down_revision: Union[str, None] = '3bc8e1d312a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One analysis per (application, resume) pair instead of one per application
+    op.drop_index('ix_ai_analyses_application_id', table_name='ai_analyses')
+    op.create_index(op.f('ix_ai_analyses_application_id'), 'ai_analyses', ['application_id'], unique=False)
+    op.create_unique_constraint('uq_ai_analyses_application_resume', 'ai_analyses', ['application_id', 'resume_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_ai_analyses_application_resume', 'ai_analyses', type_='unique')
+    op.drop_index(op.f('ix_ai_analyses_application_id'), table_name='ai_analyses')
+    op.create_index('ix_ai_analyses_application_id', 'ai_analyses', ['application_id'], unique=True)
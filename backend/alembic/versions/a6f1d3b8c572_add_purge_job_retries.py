@@ -0,0 +1,35 @@
+"""add_purge_job_retries
+
+Revision ID: a6f1d3b8c572
+Revises: c4d8a2f6e913
+Create Date: 2026-10-19 21:48:33.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6f1d3b8c572'
+down_revision: Union[str, None] = 'c4d8a2f6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('purge_jobs', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('purge_jobs', sa.Column('next_attempt_at', sa.DateTime(), nullable=True))
+
+    # Jobs that failed before retries existed get another round
+    op.execute("UPDATE purge_jobs SET status = 'pending', attempts = 1 WHERE status = 'failed'")
+
+    # The resume purge clears best_resume_id in batches by this column
+    op.create_index(op.f('ix_applications_best_resume_id'), 'applications', ['best_resume_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_applications_best_resume_id'), table_name='applications')
+    op.drop_column('purge_jobs', 'next_attempt_at')
+    op.drop_column('purge_jobs', 'attempts')
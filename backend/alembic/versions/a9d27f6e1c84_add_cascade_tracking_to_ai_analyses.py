@@ -0,0 +1,30 @@
+"""add_cascade_tracking_to_ai_analyses
+
+Revision ID: a9d27f6e1c84
+Revises: 7c41e9a2b5d3
+Create Date: 2026-10-19 10:03:17.552914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d27f6e1c84'
+down_revision: Union[str, None] = '7c41e9a2b5d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('ai_analyses', sa.Column('model_used', sa.String(), nullable=True))
+    op.add_column('ai_analyses', sa.Column('latency_ms', sa.Integer(), nullable=True))
+    op.add_column('ai_analyses', sa.Column('cost_usd', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('ai_analyses', 'cost_usd')
+    op.drop_column('ai_analyses', 'latency_ms')
+    op.drop_column('ai_analyses', 'model_used')
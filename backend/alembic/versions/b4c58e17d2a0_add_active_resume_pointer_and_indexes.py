@@ -0,0 +1,54 @@
+"""add_active_resume_pointer_and_indexes
+
+Revision ID: b4c58e17d2a0
+Revises: e2f06a4c9b37
+Create Date: 2026-10-19 13:35:28.907126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c58e17d2a0'
+down_revision: Union[str, None] = 'e2f06a4c9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_resumes_user_id'), 'resumes', ['user_id'], unique=False)
+    op.create_index(op.f('ix_ai_analyses_resume_id'), 'ai_analyses', ['resume_id'], unique=False)
+
+    # Keep only the newest active resume per user before enforcing uniqueness
+    op.execute("""
+        UPDATE resumes r SET is_active = false
+        WHERE r.is_active AND r.id <> (
+            SELECT r2.id FROM resumes r2
+            WHERE r2.user_id = r.user_id AND r2.is_active
+            ORDER BY r2.created_at DESC
+            LIMIT 1
+        )
+    """)
+    op.create_index(
+        'uq_resumes_one_active_per_user', 'resumes', ['user_id'],
+        unique=True, postgresql_where=sa.text('is_active')
+    )
+
+    op.add_column('users', sa.Column('active_resume_id', sa.UUID(), nullable=True))
+    op.create_foreign_key('fk_users_active_resume_id', 'users', 'resumes', ['active_resume_id'], ['id'], ondelete='SET NULL')
+    op.execute("""
+        UPDATE users u SET active_resume_id = r.id
+        FROM resumes r
+        WHERE r.user_id = u.id AND r.is_active
+    """)
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_users_active_resume_id', 'users', type_='foreignkey')
+    op.drop_column('users', 'active_resume_id')
+    op.drop_index('uq_resumes_one_active_per_user', table_name='resumes')
+    op.drop_index(op.f('ix_ai_analyses_resume_id'), table_name='ai_analyses')
+    op.drop_index(op.f('ix_resumes_user_id'), table_name='resumes')
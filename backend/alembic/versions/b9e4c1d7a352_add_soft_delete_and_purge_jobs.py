@@ -0,0 +1,51 @@
+"""add_soft_delete_and_purge_jobs
+
+Revision ID: b9e4c1d7a352
+Revises: f3b7e2a91d58
+Create Date: 2026-10-19 17:02:36.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e4c1d7a352'
+down_revision: Union[str, None] = 'f3b7e2a91d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: no table rewrite
+    op.add_column('users', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('applications', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('resumes', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    op.create_table('purge_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.Enum('pending', 'running', 'completed', 'failed', name='purgestatus'), nullable=False),
+    sa.Column('current_step', sa.String(), nullable=True),
+    sa.Column('processed_rows', sa.Integer(), nullable=False),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_purge_jobs_status_created_at', 'purge_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_purge_jobs_status_created_at', table_name='purge_jobs')
+    op.drop_table('purge_jobs')
+    op.execute("DROP TYPE IF EXISTS purgestatus")
+    op.drop_column('resumes', 'deleted_at')
+    op.drop_column('applications', 'deleted_at')
+    op.drop_column('users', 'deleted_at')
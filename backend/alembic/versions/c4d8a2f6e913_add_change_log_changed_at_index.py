@@ -0,0 +1,27 @@
+"""add_change_log_changed_at_index
+
+Revision ID: c4d8a2f6e913
+Revises: e7a3f9c2d481
+Create Date: 2026-10-19 21:12:07.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8a2f6e913'
+down_revision: Union[str, None] = 'e7a3f9c2d481'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Retention pruning deletes the oldest entries in batches
+    op.create_index('ix_change_log_changed_at', 'change_log', ['changed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_change_log_changed_at', table_name='change_log')
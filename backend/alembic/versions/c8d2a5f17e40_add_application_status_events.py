@@ -0,0 +1,55 @@
+"""add_application_status_events
+
+Revision ID: c8d2a5f17e40
+Revises: 6a1f4e9d2c73
+Create Date: 2026-10-19 15:41:09.652874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2a5f17e40'
+down_revision: Union[str, None] = '6a1f4e9d2c73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('application_status_events',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('application_id', sa.UUID(), nullable=False),
+    sa.Column('from_status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=True),
+    sa.Column('to_status', postgresql.ENUM(name='applicationstatus', create_type=False), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_application_status_events_user_id_changed_at', 'application_status_events', ['user_id', 'changed_at'], unique=False)
+    op.create_index('ix_application_status_events_application_id_changed_at', 'application_status_events', ['application_id', 'changed_at'], unique=False)
+
+    # Backfill what we know: every application was applied at creation, and anything
+    # past that reached its current status at its last update
+    for table in ('applications', 'applications_archive'):
+        op.execute(f"""
+            INSERT INTO application_status_events (user_id, application_id, from_status, to_status, changed_at)
+            SELECT user_id, id, NULL, 'applied', COALESCE(created_at, date_applied::timestamp)
+            FROM {table}
+        """)
+        op.execute(f"""
+            INSERT INTO application_status_events (user_id, application_id, from_status, to_status, changed_at)
+            SELECT user_id, id, 'applied', status, COALESCE(updated_at, created_at, date_applied::timestamp)
+            FROM {table}
+            WHERE status IS NOT NULL AND status <> 'applied'
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_status_events_application_id_changed_at', table_name='application_status_events')
+    op.drop_index('ix_application_status_events_user_id_changed_at', table_name='application_status_events')
+    op.drop_table('application_status_events')
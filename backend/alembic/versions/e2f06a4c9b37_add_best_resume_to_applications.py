@@ -0,0 +1,30 @@
+"""add_best_resume_to_applications
+
+Revision ID: e2f06a4c9b37
+Revises: 5e8b3d0f7a16
+Create Date: 2026-10-19 12:41:52.660381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f06a4c9b37'
+down_revision: Union[str, None] = '5e8b3d0f7a16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('best_resume_id', sa.UUID(), nullable=True))
+    op.add_column('applications', sa.Column('best_resume_score', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_applications_best_resume_id', 'applications', 'resumes', ['best_resume_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_applications_best_resume_id', 'applications', type_='foreignkey')
+    op.drop_column('applications', 'best_resume_score')
+    op.drop_column('applications', 'best_resume_id')
@@ -0,0 +1,84 @@
+"""add_reminders
+
+Revision ID: e7a3f9c2d481
+Revises: b9e4c1d7a352
+Create Date: 2026-10-19 18:24:51.730642
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3f9c2d481'
+down_revision: Union[str, None] = 'b9e4c1d7a352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reminders',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('application_id', sa.UUID(), nullable=False),
+    sa.Column('kind', sa.Enum('stale_application', 'follow_up', name='reminderkind'), nullable=False),
+    sa.Column('status', sa.Enum('pending', 'due', 'dismissed', name='reminderstatus'), nullable=False),
+    sa.Column('due_at', sa.DateTime(), nullable=False),
+    sa.Column('fired_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('application_id', 'kind', name='uq_reminders_application_id_kind')
+    )
+    op.create_index(
+        'ix_reminders_pending_due_at', 'reminders', ['due_at'],
+        unique=False, postgresql_where=sa.text("status = 'pending'")
+    )
+    op.create_index('ix_reminders_user_id_status_due_at', 'reminders', ['user_id', 'status', 'due_at'], unique=False)
+
+    # Backfill stale reminders for open applications, counted from when they entered their
+    # current status (default REMINDER_APPLIED_STALE_DAYS / REMINDER_SCREENING_STALE_DAYS)
+    op.execute("""
+        INSERT INTO reminders (id, user_id, application_id, kind, status, due_at, created_at, updated_at)
+        SELECT gen_random_uuid(), a.user_id, a.id, 'stale_application', 'pending',
+            COALESCE(
+                (SELECT max(e.changed_at) FROM application_status_events e WHERE e.application_id = a.id),
+                a.created_at,
+                a.date_applied::timestamp
+            ) + CASE a.status WHEN 'applied' THEN interval '14 days' ELSE interval '7 days' END,
+            now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+        FROM applications a
+        WHERE a.status IN ('applied', 'screening') AND a.deleted_at IS NULL
+    """)
+
+    # ...and follow-ups for interviews with no follow-up email logged since (default REMINDER_FOLLOW_UP_DAYS)
+    op.execute("""
+        INSERT INTO reminders (id, user_id, application_id, kind, status, due_at, created_at, updated_at)
+        SELECT gen_random_uuid(), a.user_id, a.id, 'follow_up', 'pending',
+            last_interview.interaction_date + interval '3 days',
+            now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+        FROM applications a
+        JOIN LATERAL (
+            SELECT max(i.interaction_date) AS interaction_date FROM interactions i
+            WHERE i.application_id = a.id
+                AND i.interaction_type IN ('phone_screen', 'technical_interview', 'behavioral_interview')
+        ) last_interview ON last_interview.interaction_date IS NOT NULL
+        WHERE a.status NOT IN ('rejected', 'withdrawn') AND a.deleted_at IS NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM interactions f
+                WHERE f.application_id = a.id AND f.interaction_type = 'follow_up_email'
+                    AND f.interaction_date >= last_interview.interaction_date
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reminders_user_id_status_due_at', table_name='reminders')
+    op.drop_index('ix_reminders_pending_due_at', table_name='reminders', postgresql_where=sa.text("status = 'pending'"))
+    op.drop_table('reminders')
+    op.execute("DROP TYPE IF EXISTS reminderstatus")
+    op.execute("DROP TYPE IF EXISTS reminderkind")
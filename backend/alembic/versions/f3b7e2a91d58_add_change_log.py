@@ -0,0 +1,96 @@
+"""add_change_log
+
+Revision ID: f3b7e2a91d58
+Revises: c8d2a5f17e40
+Create Date: 2026-10-19 16:17:52.904133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7e2a91d58'
+down_revision: Union[str, None] = 'c8d2a5f17e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> entity type reported to sync clients
+SYNCED_TABLES = {
+    'applications': 'application',
+    'ai_analyses': 'analysis',
+    'resumes': 'resume',
+    'interactions': 'interaction',
+}
+
+
+def upgrade() -> None:
+    op.create_table('change_log',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('txid', sa.BigInteger(), server_default=sa.text('pg_current_xact_id()::text::bigint'), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.UUID(), nullable=False),
+    sa.Column('operation', sa.String(length=10), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_user_id_txid_id', 'change_log', ['user_id', 'txid', 'id'], unique=False)
+
+    # Deleting an archived application is reported too (archiving itself is not).
+    # Children of a deleted application are skipped (their parent is already gone):
+    # clients drop them together with the application's tombstone.
+    # The archiver sets app.skip_change_log so archiving is not reported as deletes.
+    op.execute("""
+        CREATE FUNCTION record_change() RETURNS trigger AS $$
+        DECLARE
+            changed record;
+            owner uuid;
+        BEGIN
+            IF current_setting('app.skip_change_log', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+
+            IF TG_TABLE_NAME IN ('applications', 'applications_archive', 'resumes') THEN
+                owner := changed.user_id;
+            ELSE
+                SELECT user_id INTO owner FROM applications WHERE id = changed.application_id;
+            END IF;
+
+            IF owner IS NOT NULL THEN
+                INSERT INTO change_log (user_id, entity_type, entity_id, operation)
+                VALUES (owner, TG_ARGV[0], changed.id, CASE WHEN TG_OP = 'DELETE' THEN 'delete' ELSE 'upsert' END);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for table, entity_type in SYNCED_TABLES.items():
+        op.execute(f"""
+            CREATE TRIGGER {table}_change_log
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_change('{entity_type}')
+        """)
+    op.execute("""
+        CREATE TRIGGER applications_archive_change_log
+        AFTER DELETE ON applications_archive
+        FOR EACH ROW EXECUTE FUNCTION record_change('application')
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS applications_archive_change_log ON applications_archive")
+    for table in SYNCED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_change_log ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_change()")
+    op.drop_index('ix_change_log_user_id_txid_id', table_name='change_log')
+    op.drop_table('change_log')
@@ -1,14 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, get_replica_db, is_replica
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.services.redis_service import redis_service
 
 security = HTTPBearer()
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+    read_db: Session = Depends(get_replica_db),
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token"""
@@ -22,7 +24,12 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.email == email).first()
+    # Look the user up on the replica; go to the primary for users that are not
+    # replicated yet or who just wrote (e.g. switched their active resume)
+    user = read_db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
+    if is_replica(read_db) and (user is None or redis_service.has_recent_write(str(user.id))):
+        user = db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
+    
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,4 +37,14 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
\ No newline at end of file
+    return user
+
+def get_read_db(
+    current_user: User = Depends(get_current_user),
+    read_db: Session = Depends(get_replica_db),
+    db: Session = Depends(get_db)
+) -> Session:
+    """Session for read-only routes: the replica, unless the user was loaded from the primary (read-your-writes)"""
+    if Session.object_session(current_user) is db:
+        return db
+    return read_db
@@ -0,0 +1,92 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional, Tuple
+from fastapi import Request, Response, status
+from app.core.config import settings
+from app.services.redis_service import redis_service
+
+def make_etag(*parts) -> str:
+    """Weak ETag derived from the values that determine a response"""
+    digest = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def http_date(value: Optional[datetime]) -> Optional[str]:
+    """Format a naive UTC datetime for Last-Modified"""
+    if value is None:
+        return None
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against the current validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+def _validator_headers(etag: str, last_modified: Optional[str]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+class ResponseCache:
+    """
+    Per-user cache of serialized GET responses in Redis.
+    Keys are namespaced by the user's data version, so any write for the user
+    (redis_service.bump_user_version) invalidates all of their cached responses.
+    """
+
+    def __init__(self, expiry: int = None):
+        self.expiry = expiry or settings.RESPONSE_CACHE_TTL_SECONDS
+
+    def lookup(self, request: Request, user_id) -> Tuple[Optional[str], Optional[Response]]:
+        """Return (cache_key, cached response or 304) for the request"""
+        version = redis_service.get_user_version(str(user_id))
+        if version is None:
+            return None, None
+
+        cache_key = f"{user_id}:{version}:{request.url.path}?{request.url.query}"
+        entry = redis_service.get_cached_response(cache_key)
+        if not entry:
+            return cache_key, None
+
+        headers = _validator_headers(entry["etag"], entry.get("last_modified"))
+        if is_not_modified(request, entry["etag"], entry.get("last_modified")):
+            return cache_key, Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return cache_key, Response(content=entry["body"], media_type="application/json", headers=headers)
+
+    def respond(
+        self,
+        request: Request,
+        cache_key: Optional[str],
+        serialize: Callable[[], bytes],
+        etag: str,
+        last_modified: Optional[datetime] = None
+    ) -> Response:
+        """Answer 304 without serializing when the client is current, otherwise serialize, cache and return"""
+        last_modified = http_date(last_modified)
+        headers = _validator_headers(etag, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        body = serialize()
+        if cache_key:
+            redis_service.cache_response(cache_key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body.decode("utf-8")
+            }, self.expiry)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+# Singleton instance
+response_cache = ResponseCache()
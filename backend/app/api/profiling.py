@@ -0,0 +1,66 @@
+import hmac
+import asyncio
+import functools
+from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.config import settings
+from app.core.profiling import current_profile, profiler
+
+PROFILE_HEADER = "x-profile"
+
+def _route_name(request: Request) -> str:
+    """Per-route profile name, e.g. "GET list_applications" (path when no route matched)"""
+    route = request.scope.get("route")
+    return f"{request.method} {route.name if route else request.url.path}"
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Sampling profiler for API requests: a PROFILING_SAMPLE_RATE fraction of requests, plus
+    any request sending `X-Profile: <PROFILING_TOKEN>`. Only added when PROFILING_ENABLED.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if not (self._flagged(request) or profiler.should_sample()):
+            return await call_next(request)
+
+        # Sampling starts once the endpoint binds the thread it runs on
+        with profiler.profile(request.url.path) as profile:
+            response = await call_next(request)
+            profile.name = _route_name(request)
+        response.headers["X-Profile-Samples"] = str(sum(profile.stacks.values()))
+        return response
+
+    def _flagged(self, request: Request) -> bool:
+        token = request.headers.get(PROFILE_HEADER)
+        return bool(token and settings.PROFILING_TOKEN and hmac.compare_digest(token, settings.PROFILING_TOKEN))
+
+def _bind_thread(call):
+    """Wrap an endpoint so a profiled request samples the thread running it, while it runs"""
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            profile = current_profile.get()
+            if profile is None:
+                return await call(*args, **kwargs)
+            with profile.bound():
+                return await call(*args, **kwargs)
+    else:
+        @functools.wraps(call)
+        def wrapper(*args, **kwargs):
+            profile = current_profile.get()
+            if profile is None:
+                return call(*args, **kwargs)
+            with profile.bound():
+                return call(*args, **kwargs)
+    return wrapper
+
+def bind_endpoint_threads(app: FastAPI):
+    """
+    Make every route's endpoint bind its thread to the request's profile. FastAPI runs sync
+    endpoints on a threadpool thread with the request's context, so the ContextVar set by
+    ProfilingMiddleware is visible there. Call after all routers are included.
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            route.dependant.call = _bind_thread(route.dependant.call)
@@ -0,0 +1,23 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.query_stats import track_queries, check_queries
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Counts and times the SQL behind each request, reports it in X-Query-Count and
+    X-Query-Time-Ms, and checks it against the route's @query_budget.
+    Only added when QUERY_STATS_ENABLED.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        route = request.scope.get("route")
+        if route is not None:
+            endpoint = request.scope.get("endpoint")
+            check_queries(f"{request.method} {route.path}", stats, getattr(endpoint, "query_budget", None))
+
+        response.headers["X-Query-Count"] = str(stats.count)
+        response.headers["X-Query-Time-Ms"] = f"{stats.duration_ms:.1f}"
+        return response
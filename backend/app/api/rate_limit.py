@@ -0,0 +1,189 @@
+import re
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from fastapi import HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.config import settings
+from app.core.security import decode_access_token
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+ROUTE_DEFAULT = "default"
+ROUTE_ANALYSIS = "analysis"
+ROUTE_UPLOAD = "upload"
+ROUTE_BULK = "bulk"  # charged per item by the route itself (see charge_items)
+
+# (method, path) patterns for the expensive route classes; everything else under /api/ is default
+_ROUTE_CLASSES = [
+    (ROUTE_ANALYSIS, "POST", re.compile(r"^/api/v1/applications/?$")),
+    (ROUTE_BULK, "POST", re.compile(r"^/api/v1/applications/bulk$")),
+    (ROUTE_ANALYSIS, "POST", re.compile(r"^/api/v1/applications/[^/]+/(analysis|best-resume)$")),
+    (ROUTE_UPLOAD, "POST", re.compile(r"^/api/v1/resumes/upload$")),
+]
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class for a request, or None for paths that are not rate limited"""
+    if not path.startswith("/api/"):
+        return None
+    for route_class, route_method, pattern in _ROUTE_CLASSES:
+        if method == route_method and pattern.match(path):
+            return route_class
+    return ROUTE_DEFAULT
+
+def _limits(route_class: str) -> Tuple[float, int]:
+    """(tokens per second, bucket size) for a route class"""
+    per_minute, burst = {
+        ROUTE_ANALYSIS: (settings.RATE_LIMIT_ANALYSIS_PER_MINUTE, settings.RATE_LIMIT_ANALYSIS_BURST),
+        ROUTE_UPLOAD: (settings.RATE_LIMIT_UPLOAD_PER_MINUTE, settings.RATE_LIMIT_UPLOAD_BURST),
+        ROUTE_BULK: (settings.RATE_LIMIT_BULK_ITEMS_PER_MINUTE, settings.RATE_LIMIT_BULK_ITEMS_BURST),
+    }.get(route_class, (settings.RATE_LIMIT_DEFAULT_PER_MINUTE, settings.RATE_LIMIT_DEFAULT_BURST))
+    return per_minute / 60, burst
+
+class LocalTokenBuckets:
+    """
+    In-process token buckets used while Redis is unavailable.
+    Limits are per API process rather than global, which is good enough to stay protected.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, capacity: int, cost: int = 1) -> Tuple[bool, float, float]:
+        """Same contract as RedisService.take_token"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - ts) * rate)
+            allowed = tokens >= cost
+            retry_after = 0.0
+            if allowed:
+                tokens -= cost
+            else:
+                retry_after = (cost - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, tokens, retry_after
+
+# Singleton instance
+local_buckets = LocalTokenBuckets()
+
+def _take(route_class: str, identity: str, cost: int = 1) -> Tuple[bool, float, float]:
+    """Take `cost` tokens from the caller's bucket for a route class, in Redis or locally while it is down"""
+    rate, capacity = _limits(route_class)
+    key = f"{route_class}:{identity}"
+    result = redis_service.take_token(key, rate, capacity, cost)
+    if result is None:
+        result = local_buckets.take(key, rate, capacity, cost)
+    return result
+
+class BacklogGauge:
+    """Analysis backlog reported by the worker, re-read from Redis at most once per second"""
+
+    def __init__(self, refresh_seconds: float = 1.0):
+        self.refresh_seconds = refresh_seconds
+        self._depth: Optional[int] = None
+        self._read_at = 0.0
+
+    def depth(self) -> Optional[int]:
+        now = time.monotonic()
+        if now - self._read_at >= self.refresh_seconds:
+            self._depth = redis_service.get_analysis_backlog()
+            self._read_at = now
+        return self._depth
+
+def _identity(request: Request) -> str:
+    """Rate limit key for the caller: the token subject when present, else the client address"""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        email = decode_access_token(token)
+        if email:
+            return f"user:{email}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+def _too_many_requests(detail: str, retry_after: float, headers: dict = None) -> ORJSONResponse:
+    headers = dict(headers or {})
+    headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return ORJSONResponse({"detail": detail}, status_code=status.HTTP_429_TOO_MANY_REQUESTS, headers=headers)
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Per-user token bucket limits by route class, plus load shedding for analysis routes.
+    Buckets live in Redis (atomic Lua script) and fall back to in-process buckets when
+    Redis is down. Analysis requests are rejected while the worker backlog is too deep,
+    before they can enqueue more paid work.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.backlog = BacklogGauge()
+
+    async def dispatch(self, request: Request, call_next):
+        route_class = classify(request.method, request.url.path)
+        if route_class is None or not settings.RATE_LIMIT_ENABLED:
+            return await call_next(request)
+
+        # Redis calls are blocking, keep them off the event loop
+        rejection, headers = await run_in_threadpool(self._admit, request, route_class)
+        if rejection is not None:
+            return rejection
+
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
+
+    def _admit(self, request: Request, route_class: str) -> Tuple[Optional[ORJSONResponse], dict]:
+        """Return (429 response or None, rate limit headers) for a request"""
+        # Shed analysis work first: no point spending a token on a request we would queue forever
+        if route_class in (ROUTE_ANALYSIS, ROUTE_BULK):
+            depth = self.backlog.depth()
+            if depth is not None and depth >= settings.ANALYSIS_BACKLOG_SHED_THRESHOLD:
+                logger.warning(f"Shedding {request.method} {request.url.path}: analysis backlog {depth}")
+                return _too_many_requests(
+                    "Analysis queue is busy, please retry shortly",
+                    settings.ANALYSIS_BACKLOG_REPORT_SECONDS
+                ), {}
+
+        # The body isn't read here: bulk creates are charged per item by the route
+        if route_class == ROUTE_BULK:
+            return None, {}
+
+        allowed, tokens, retry_after = _take(route_class, _identity(request))
+        _, capacity = _limits(route_class)
+        headers = {
+            "X-RateLimit-Limit": str(capacity),
+            "X-RateLimit-Remaining": str(int(tokens)),
+        }
+        if not allowed:
+            return _too_many_requests("Rate limit exceeded", retry_after, headers), headers
+        return None, headers
+
+def charge_items(request: Request, count: int):
+    """
+    Charge a bulk create one token per item, each of which queues an analysis like a single
+    create does; raises 429 when the caller's bulk bucket can't cover the batch.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    allowed, tokens, retry_after = _take(ROUTE_BULK, _identity(request), count)
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={
+                "Retry-After": str(max(1, math.ceil(retry_after))),
+                "X-RateLimit-Limit": str(_limits(ROUTE_BULK)[1]),
+                "X-RateLimit-Remaining": str(int(tokens)),
+            }
+        )
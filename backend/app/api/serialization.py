@@ -0,0 +1,25 @@
+from typing import Any, Iterable, List, Optional, Sequence
+import orjson
+from fastapi import HTTPException, status
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str], default: Sequence[str]) -> List[str]:
+    """Resolve a `?fields=a,b,c` sparse fieldset against the allowed field names"""
+    if not fields:
+        return list(default)
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return requested
+
+def dump_rows(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> bytes:
+    """Serialize SQL row tuples straight to a JSON array of objects (no ORM or Pydantic round-trip)"""
+    return orjson.dumps([dict(zip(fields, row)) for row in rows])
+
+def dump_object(obj: Any, fields: Sequence[str]) -> bytes:
+    """Serialize selected attributes of an ORM object to a JSON object"""
+    return orjson.dumps({field: getattr(obj, field) for field in fields})
@@ -0,0 +1,203 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import date, timedelta
+
+from app.api.deps import get_current_user, get_read_db
+from app.core.query_stats import query_budget
+from app.models.user import User
+from app.models.application import Application, ApplicationStatus
+from app.models.archived_application import ArchivedApplication
+from app.models.application_status_event import ApplicationStatusEvent as Event
+from app.schemas.analytics import AnalyticsSummary, FunnelStage, StageConversion, StageDuration
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+# Forward stages of the pipeline, in order
+FUNNEL_STAGES = [
+    ApplicationStatus.applied,
+    ApplicationStatus.screening,
+    ApplicationStatus.interviewing,
+    ApplicationStatus.offered,
+]
+
+# Statuses that mean the company got back to the applicant
+RESPONSE_STATUSES = [
+    ApplicationStatus.screening,
+    ApplicationStatus.interviewing,
+    ApplicationStatus.offered,
+    ApplicationStatus.rejected,
+]
+
+def _days(interval):
+    return func.extract("epoch", interval) / 86400
+
+def _events(db: Session, user: User, since: date | None, *columns):
+    query = db.query(*columns).filter(Event.user_id == user.id)
+    if since:
+        query = query.filter(Event.changed_at >= since)
+    return query
+
+@router.get("/summary", response_model=AnalyticsSummary)
+@query_budget(6)
+def get_summary(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Application counts plus response rate and time to first response from the status history"""
+    statuses = db.query(Application.status.label("status")).filter(
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).union_all(
+        db.query(ArchivedApplication.status.label("status")).filter(ArchivedApplication.user_id == current_user.id)
+    ).subquery()
+    by_status = {status: count for status, count in db.query(statuses.c.status, func.count()).group_by(statuses.c.status)}
+
+    # One row per application: when it was applied and when the company first responded
+    per_application = _events(
+        db, current_user, None,
+        Event.application_id,
+        func.min(Event.changed_at).label("applied_at"),
+        func.min(Event.changed_at).filter(Event.to_status.in_(RESPONSE_STATUSES)).label("responded_at")
+    ).group_by(Event.application_id).subquery()
+    tracked, responded, avg_days = db.query(
+        func.count(),
+        func.count(per_application.c.responded_at),
+        func.avg(_days(per_application.c.responded_at - per_application.c.applied_at))
+    ).one()
+
+    today = date.today()
+    this_week, this_month = db.query(
+        func.count().filter(Application.date_applied >= today - timedelta(days=today.weekday())),
+        func.count().filter(Application.date_applied >= today.replace(day=1))
+    ).filter(
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).one()
+
+    return AnalyticsSummary(
+        total_applications=sum(by_status.values()),
+        by_status=by_status,
+        response_rate=round(responded / tracked, 3) if tracked else 0.0,
+        avg_days_to_response=round(float(avg_days), 1) if avg_days is not None else None,
+        applications_this_week=this_week,
+        applications_this_month=this_month
+    )
+
+@router.get("/funnel", response_model=List[FunnelStage])
+@query_budget(3)
+def get_funnel(
+    since: date | None = Query(None, description="Only count status changes from this date"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """How many applications reached each stage (skipped stages count as reached) and stage-to-stage conversion"""
+    stage_rank = case(
+        {stage: rank for rank, stage in enumerate(FUNNEL_STAGES, start=1)},
+        value=Event.to_status,
+        else_=0
+    )
+    furthest = _events(
+        db, current_user, since,
+        Event.application_id,
+        func.max(stage_rank).label("rank")
+    ).group_by(Event.application_id).subquery()
+    per_rank = db.query(
+        furthest.c.rank,
+        func.count().label("applications")
+    ).group_by(furthest.c.rank).subquery()
+
+    # Reaching a later stage implies reaching every earlier one: cumulative sum from the end
+    reached = func.sum(per_rank.c.applications).over(order_by=per_rank.c.rank.desc())
+    reached_by_rank = dict(db.query(per_rank.c.rank, reached).filter(per_rank.c.rank > 0))
+
+    # A stage nobody stopped at has no row; it was reached by everyone who got further
+    counts = []
+    for rank in range(len(FUNNEL_STAGES), 0, -1):
+        counts.insert(0, int(reached_by_rank.get(rank, counts[0] if counts else 0)))
+
+    stages = []
+    previous = None
+    for stage, count in zip(FUNNEL_STAGES, counts):
+        stages.append(FunnelStage(
+            status=stage,
+            reached=count,
+            conversion_rate=round(count / previous, 3) if previous else None
+        ))
+        previous = count
+    return stages
+
+@router.get("/conversion", response_model=List[StageConversion])
+@query_budget(3)
+def get_conversion(
+    since: date | None = Query(None, description="Only count status changes from this date"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Where applications went next from each status, as counts and shares of that status"""
+    next_status = func.lead(Event.to_status).over(
+        partition_by=Event.application_id,
+        order_by=(Event.changed_at, Event.id)
+    )
+    transitions = _events(
+        db, current_user, since,
+        Event.to_status.label("from_status"),
+        next_status.label("to_status")
+    ).subquery()
+
+    applications = func.count()
+    rate = applications * 1.0 / func.sum(applications).over(partition_by=transitions.c.from_status)
+    rows = db.query(
+        transitions.c.from_status,
+        transitions.c.to_status,
+        applications,
+        rate
+    ).group_by(
+        transitions.c.from_status,
+        transitions.c.to_status
+    ).order_by(transitions.c.from_status, applications.desc()).all()
+
+    return [
+        StageConversion(from_status=from_status, to_status=to_status, applications=count, rate=round(float(share), 3))
+        for from_status, to_status, count, share in rows
+    ]
+
+@router.get("/time-in-stage", response_model=List[StageDuration])
+@query_budget(3)
+def get_time_in_stage(
+    since: date | None = Query(None, description="Only count status changes from this date"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Average and median days spent in each status before moving on"""
+    left_at = func.lead(Event.changed_at).over(
+        partition_by=Event.application_id,
+        order_by=(Event.changed_at, Event.id)
+    )
+    stays = _events(
+        db, current_user, since,
+        Event.to_status.label("status"),
+        Event.changed_at.label("entered_at"),
+        left_at.label("left_at")
+    ).subquery()
+
+    duration = _days(stays.c.left_at - stays.c.entered_at)
+    rows = db.query(
+        stays.c.status,
+        func.count(),
+        func.count(stays.c.left_at),
+        func.avg(duration),
+        func.percentile_cont(0.5).within_group(duration)
+    ).group_by(stays.c.status).all()
+
+    return [
+        StageDuration(
+            status=status,
+            entered=entered,
+            exited=exited,
+            avg_days=round(float(avg_days), 1) if avg_days is not None else None,
+            median_days=round(float(median_days), 1) if median_days is not None else None
+        )
+        for status, entered, exited, avg_days, median_days in rows
+    ]
@@ -1,25 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from typing import List
+import uuid
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
+from app.api.rate_limit import charge_items
+from app.core.query_stats import query_budget
+from app.api.http_cache import response_cache, make_etag
+from app.api.serialization import parse_fields, dump_rows, dump_object
 from app.models.user import User
 from app.models.application import Application, ApplicationStatus
+from app.models.archived_application import ArchivedApplication
+from app.models.ai_analysis import AIAnalysis
+from app.models.resume import Resume
 from app.schemas.application import (
     ApplicationCreate,
+    ApplicationBulkCreate,
+    ApplicationBulkResponse,
+    BulkCreateResult,
     ApplicationUpdate,
     ApplicationStatusUpdate,
     ApplicationResponse,
-    ApplicationListResponse
+    ApplicationListResponse,
+    ResumeFit,
+    BestResumeResponse,
+    APPLICATION_FIELDS,
+    APPLICATION_LIST_FIELDS
 )
 from app.services.kafka_producer import kafka_producer
+from app.services.redis_service import redis_service
+from app.services.match_engine import match_engine
+from app.services.analysis_result_store import content_hash
+from app.services.resume_ranker import rank_resumes
+from app.services.resume_service import get_active_resume
+from app.services.analysis_debouncer import analysis_debouncer, ANALYSIS_FIELDS
+from app.services.reanalysis_planner import OPEN_STATUSES
+from app.services.application_archiver import application_archiver
+from app.services.status_history import record_status_change
+from app.services.purge_service import purger, ENTITY_APPLICATION
 from app.schemas.ai_analysis import AIAnalysisResponse
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
+def fit_scores_for(db: Session, user: User, job_descriptions: List[str | None]) -> List[float | None]:
+    """Score job descriptions against the active resume in one batch"""
+    resume = get_active_resume(db, user.id)
+    
+    if not resume:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload a resume to sort by fit"
+        )
+    
+    return match_engine.fit_scores(resume.content, job_descriptions)
+
+def posting_key(job_url: str | None, company_name: str, job_title: str, date_applied: date) -> tuple:
+    """Identity of a job posting for bulk dedup: its URL, or company/title/date when there is none"""
+    if job_url:
+        return ("url", job_url)
+    return ("job", company_name.strip().lower(), job_title.strip().lower(), date_applied)
+
+def publish_created(topic: str, application_id, user_id, job_description: str | None, job_url: str | None):
+    """Queue analysis of a new application, fetching its posting from job_url first when the description is missing"""
+    event = {
+        "application_id": str(application_id),
+        "user_id": str(user_id),
+        "job_hash": content_hash(job_description) if job_description else None,
+        "event_type": "application_created"
+    }
+    if not job_description and job_url and settings.ENRICHMENT_ENABLED:
+        # The enrichment worker fills in the description and forwards the event to `topic`
+        return kafka_producer.publish_event(settings.ENRICHMENT_TOPIC, {**event, "analysis_topic": topic})
+    return kafka_producer.publish_event(topic, event)
+
+def archived_analyses(db: Session, application_id: UUID, user_id) -> List[AIAnalysisResponse]:
+    """Analysis versions kept in an archived application's JSONB snapshot (404 when it is not archived either)"""
+    archived = application_archiver.find(db, application_id, user_id)
+    if not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    return [AIAnalysisResponse.model_validate(analysis) for analysis in archived.ai_analyses]
+
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 def create_application(
     data: ApplicationCreate,
@@ -41,54 +109,197 @@ def create_application(
     )
     
     db.add(new_application)
+    db.flush()
+    record_status_change(db, new_application, None)
     db.commit()
     db.refresh(new_application)
+    redis_service.bump_user_version(str(current_user.id))
     
-    # TODO: Publish Kafka event for AI analysis
-    kafka_producer.publish_event("application-created", {
-        "application_id": str(new_application.id),
-        "user_id": str(current_user.id),
-        "company_name": new_application.company_name,
-        "job_title": new_application.job_title,
-        "job_description": new_application.job_description,
-        "event_type": "application_created"
-    })
+    # Publish Kafka event for AI analysis on the interactive lane
+    publish_created(
+        settings.ANALYSIS_INTERACTIVE_TOPIC,
+        new_application.id,
+        current_user.id,
+        new_application.job_description,
+        new_application.job_url
+    )
     
     return new_application
 
+@router.post("/bulk", response_model=ApplicationBulkResponse)
+@query_budget(8)
+def bulk_create_applications(
+    data: ApplicationBulkCreate,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create a batch of applications (the extension's capture queue) in one transaction.
+    Postings already saved are returned instead of duplicated, so retrying a batch is safe.
+    """
+    if len(data.items) > settings.BULK_CREATE_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BULK_CREATE_MAX_ITEMS} items per batch"
+        )
+    
+    # Every item queues an analysis: charge the batch like that many single creates
+    charge_items(request, len(data.items))
+    
+    # Serialize concurrent batches of the same user (on their row, as activate_resume does)
+    # so a retry racing the original can't double-insert
+    db.query(User.id).filter(User.id == current_user.id).with_for_update().one()
+    
+    # Postings this user already has
+    urls = {item.job_url for item in data.items if item.job_url}
+    dates = {item.date_applied for item in data.items if not item.job_url}
+    existing = db.query(
+        Application.id,
+        Application.job_url,
+        Application.company_name,
+        Application.job_title,
+        Application.date_applied
+    ).filter(
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None),
+        or_(
+            Application.job_url.in_(urls),
+            and_(Application.job_url.is_(None), Application.date_applied.in_(dates))
+        )
+    ).all()
+    saved = {
+        posting_key(row.job_url, row.company_name, row.job_title, row.date_applied): row.id
+        for row in existing
+    }
+    
+    results = []
+    created = []
+    for item in data.items:
+        key = posting_key(item.job_url, item.company_name, item.job_title, item.date_applied)
+        if key in saved:
+            results.append(BulkCreateResult(client_id=item.client_id, application_id=saved[key], created=False))
+            continue
+        
+        # Ids are assigned here so the whole batch is inserted in one flush at commit
+        application = Application(
+            id=uuid.uuid4(),
+            user_id=current_user.id,
+            status=ApplicationStatus.applied,
+            **item.model_dump(exclude={"client_id"})
+        )
+        db.add(application)
+        record_status_change(db, application, None)
+        saved[key] = application.id
+        created.append((application.id, item.job_description, item.job_url))
+        results.append(BulkCreateResult(client_id=item.client_id, application_id=application.id, created=True))
+    
+    db.commit()
+    if created:
+        redis_service.bump_user_version(str(current_user.id))
+    
+    # A single save is someone waiting on the result; real batches are background work
+    topic = settings.ANALYSIS_INTERACTIVE_TOPIC if len(data.items) == 1 else settings.ANALYSIS_BULK_TOPIC
+    for application_id, job_description, job_url in created:
+        publish_created(topic, application_id, current_user.id, job_description, job_url)
+    
+    return ApplicationBulkResponse(results=results)
+
 @router.get("", response_model=List[ApplicationListResponse])
+@query_budget(4)
 def list_applications(
+    request: Request,
     status_filter: ApplicationStatus | None = Query(None, alias="status"),
     date_from: date | None = Query(None),
     date_to: date | None = Query(None),
-    db: Session = Depends(get_db),
+    sort: str = Query("date", pattern="^(date|fit)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all applications for current user with optional filters"""
-    query = db.query(Application).filter(Application.user_id == current_user.id)
+    """List all applications for current user with optional filters, newest first or by resume fit"""
+    default_fields = APPLICATION_LIST_FIELDS + (["fit_score"] if sort == "fit" else [])
+    fields = parse_fields(fields, APPLICATION_FIELDS + ["fit_score"], default_fields)
+    
+    cache_key, cached = response_cache.lookup(request, current_user.id)
+    if cached:
+        return cached
+    
+    # Select only the columns we return (plus what ordering, the ETag and fit sort need) as plain row tuples
+    columns = [field for field in fields if field != "fit_score"]
+    extra = ["date_applied", "updated_at"] + (["job_description"] if sort == "fit" else [])
+    columns += [column for column in extra if column not in columns]
+    position = {column: i for i, column in enumerate(columns)}
+    
+    def filtered(model):
+        query = db.query(*[getattr(model, column) for column in columns]).filter(
+            model.user_id == current_user.id
+        )
+        if model is Application:
+            query = query.filter(Application.deleted_at.is_(None))
+        
+        # Apply filters
+        if status_filter:
+            query = query.filter(model.status == status_filter)
+        if date_from:
+            query = query.filter(model.date_applied >= date_from)
+        if date_to:
+            query = query.filter(model.date_applied <= date_to)
+        return query
+    
+    query = filtered(Application)
+    # Old closed applications live in the archive; only read it when the filters can reach it
+    if application_archiver.reaches_archive(date_from, status_filter):
+        query = query.union_all(filtered(ArchivedApplication))
+    
+    rows = query.order_by(Application.date_applied.desc()).all()
+    
+    # The ETag only depends on cheap columns (and the active resume for fit sort),
+    # so a conditional request is answered before anything is scored
+    last_modified = max((row[position["updated_at"]] for row in rows), default=None)
+    etag = make_etag(
+        request.url.query,
+        len(rows),
+        last_modified,
+        current_user.active_resume_id if sort == "fit" else None
+    )
     
-    # Apply filters
-    if status_filter:
-        query = query.filter(Application.status == status_filter)
-    if date_from:
-        query = query.filter(Application.date_applied >= date_from)
-    if date_to:
-        query = query.filter(Application.date_applied <= date_to)
+    def serialize() -> bytes:
+        ordered, scores = rows, [None] * len(rows)
+        if sort == "fit":
+            scores = fit_scores_for(db, current_user, [row[position["job_description"]] for row in rows])
+            order = sorted(range(len(rows)), key=lambda i: scores[i] if scores[i] is not None else -1, reverse=True)
+            ordered = [rows[i] for i in order]
+            scores = [scores[i] for i in order]
+        return dump_rows(
+            ([score if field == "fit_score" else row[position[field]] for field in fields]
+             for row, score in zip(ordered, scores)),
+            fields
+        )
     
-    applications = query.order_by(Application.date_applied.desc()).all()
-    return applications
+    return response_cache.respond(request, cache_key, serialize, etag, last_modified)
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
+@query_budget(4)
 def get_application(
     application_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a single application by ID"""
+    fields = parse_fields(fields, APPLICATION_FIELDS, APPLICATION_FIELDS)
+    
+    cache_key, cached = response_cache.lookup(request, current_user.id)
+    if cached:
+        return cached
+    
     application = db.query(Application).filter(
         Application.id == application_id,
-        Application.user_id == current_user.id
-    ).first()
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).first() or application_archiver.find(db, application_id, current_user.id)
     
     if not application:
         raise HTTPException(
@@ -96,7 +307,13 @@ def get_application(
             detail="Application not found"
         )
     
-    return application
+    return response_cache.respond(
+        request,
+        cache_key,
+        lambda: dump_object(application, fields),
+        make_etag(application.id, application.updated_at, request.url.query),
+        application.updated_at
+    )
 
 @router.put("/{application_id}", response_model=ApplicationResponse)
 def update_application(
@@ -108,9 +325,14 @@ def update_application(
     """Update an application"""
     application = db.query(Application).filter(
         Application.id == application_id,
-        Application.user_id == current_user.id
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
     ).first()
     
+    # Editing an archived application brings it back to the hot table
+    if not application and application_archiver.restore(db, application_id, current_user.id):
+        application = db.query(Application).filter(Application.id == application_id).first()
+    
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,11 +341,22 @@ def update_application(
     
     # Update fields if provided
     update_data = data.model_dump(exclude_unset=True)
+    analysis_changed = any(
+        field in ANALYSIS_FIELDS and getattr(application, field) != value
+        for field, value in update_data.items()
+    )
+    previous_status = application.status
     for field, value in update_data.items():
         setattr(application, field, value)
+    record_status_change(db, application, previous_status)
     
     db.commit()
     db.refresh(application)
+    redis_service.bump_user_version(str(current_user.id))
+    
+    # Re-analyze once edits to analysis-relevant fields settle
+    if analysis_changed and application.status in OPEN_STATUSES:
+        analysis_debouncer.schedule(str(application.id), str(current_user.id))
     
     return application
 
@@ -137,18 +370,26 @@ def update_application_status(
     """Update only the status of an application"""
     application = db.query(Application).filter(
         Application.id == application_id,
-        Application.user_id == current_user.id
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
     ).first()
     
+    # Editing an archived application brings it back to the hot table
+    if not application and application_archiver.restore(db, application_id, current_user.id):
+        application = db.query(Application).filter(Application.id == application_id).first()
+    
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found"
         )
     
+    previous_status = application.status
     application.status = data.status
+    record_status_change(db, application, previous_status)
     db.commit()
     db.refresh(application)
+    redis_service.bump_user_version(str(current_user.id))
     
     return application
 
@@ -158,10 +399,89 @@ def delete_application(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Delete an application"""
+    """Delete an application (its interactions, analyses and history are purged in the background)"""
     application = db.query(Application).filter(
         Application.id == application_id,
-        Application.user_id == current_user.id
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).first()
+    
+    if not application:
+        if not application_archiver.delete(db, application_id, current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Application not found"
+            )
+    else:
+        application.deleted_at = datetime.utcnow()
+    purger.enqueue(db, ENTITY_APPLICATION, application_id, current_user.id)
+    db.commit()
+    redis_service.bump_user_version(str(current_user.id))
+    
+    return None
+
+@router.get("/{application_id}/analysis", response_model=AIAnalysisResponse)
+@query_budget(4)
+def get_application_analysis(
+    application_id: UUID,
+    request: Request,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get AI analysis for an application"""
+    cache_key, cached = response_cache.lookup(request, current_user.id)
+    if cached:
+        return cached
+    
+    application = db.query(Application).filter(
+        Application.id == application_id,
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).first()
+    
+    if application:
+        # Prefer the analysis against the active resume, then the most recent version
+        analysis = db.query(AIAnalysis).outerjoin(
+            Resume, AIAnalysis.resume_id == Resume.id
+        ).filter(
+            AIAnalysis.application_id == application.id
+        ).order_by(
+            Resume.is_active.desc().nullslast(),
+            AIAnalysis.created_at.desc()
+        ).first()
+    else:
+        # Same preference over the analyses snapshotted into the archive row
+        analysis = max(
+            archived_analyses(db, application_id, current_user.id),
+            key=lambda version: (version.resume_id == current_user.active_resume_id, version.created_at),
+            default=None
+        )
+    
+    if not analysis:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis not yet available"
+        )
+    
+    return response_cache.respond(
+        request,
+        cache_key,
+        lambda: AIAnalysisResponse.model_validate(analysis).model_dump_json().encode(),
+        make_etag(analysis.id, analysis.analysis_status.value, analysis.analyzed_at),
+        analysis.analyzed_at or analysis.created_at
+    )
+
+@router.post("/{application_id}/analysis", status_code=status.HTTP_202_ACCEPTED)
+def request_detailed_analysis(
+    application_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue a detailed analysis that skips the cheaper cascade tiers"""
+    application = db.query(Application).filter(
+        Application.id == application_id,
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
     ).first()
     
     if not application:
@@ -170,21 +490,26 @@ def delete_application(
             detail="Application not found"
         )
     
-    db.delete(application)
-    db.commit()
+    kafka_producer.publish_event(settings.ANALYSIS_INTERACTIVE_TOPIC, {
+        "application_id": str(application.id),
+        "user_id": str(current_user.id),
+        "detailed": True,
+        "event_type": "detailed_analysis_requested"
+    })
     
-    return None
+    return {"message": "Detailed analysis queued"}
 
-@router.get("/{application_id}/analysis", response_model=AIAnalysisResponse)
-def get_application_analysis(
+@router.post("/{application_id}/best-resume", response_model=BestResumeResponse, status_code=status.HTTP_202_ACCEPTED)
+def find_best_resume(
     application_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get AI analysis for an application"""
+    """Rank all resumes locally and queue LLM analysis of the top candidates"""
     application = db.query(Application).filter(
         Application.id == application_id,
-        Application.user_id == current_user.id
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
     ).first()
     
     if not application:
@@ -193,10 +518,46 @@ def get_application_analysis(
             detail="Application not found"
         )
     
-    if not application.ai_analysis:
+    if not application.job_description:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Application has no job description"
+        )
+    
+    ranked = rank_resumes(db, current_user.id, application.job_description)
+    if not ranked:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Analysis not yet available"
+            detail="No resumes found"
         )
     
-    return application.ai_analysis
\ No newline at end of file
+    queued = kafka_producer.publish_event(settings.ANALYSIS_INTERACTIVE_TOPIC, {
+        "application_id": str(application.id),
+        "user_id": str(current_user.id),
+        "event_type": "best_resume_requested"
+    })
+    
+    return BestResumeResponse(
+        application_id=application.id,
+        candidates=[ResumeFit(resume_id=resume_id, fit_score=score) for resume_id, score in ranked],
+        queued=queued
+    )
+
+@router.get("/{application_id}/analyses", response_model=List[AIAnalysisResponse])
+@query_budget(4)
+def list_application_analyses(
+    application_id: UUID,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List every analysis version (one per resume) for an application"""
+    application = db.query(Application).filter(
+        Application.id == application_id,
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).first()
+    
+    if not application:
+        return archived_analyses(db, application_id, current_user.id)
+    
+    return application.ai_analyses
\ No newline at end of file
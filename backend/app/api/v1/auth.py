@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from datetime import timedelta
-from app.core.database import get_db
+from datetime import datetime, timedelta
+from app.core.database import get_db, get_replica_db, first_with_fallback
 from app.core.security import verify_password, get_password_hash, create_access_token
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserRegister, UserLogin, UserResponse, Token
+from app.schemas.purge_job import PurgeJobResponse
 from app.api.deps import get_current_user
+from app.core.query_stats import query_budget
+from app.services.redis_service import redis_service
+from app.services.purge_service import purger, ENTITY_USER
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -15,6 +19,11 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user exists
     existing_user = db.query(User).filter(User.email == user_data.email).first()
+    if existing_user and existing_user.deleted_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This account is being deleted, try again in a few minutes"
+        )
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -35,10 +44,17 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
     return new_user
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+def login(
+    user_data: UserLogin,
+    read_db: Session = Depends(get_replica_db),
+    db: Session = Depends(get_db)
+):
     """Login and get access token"""
-    # Find user
-    user = db.query(User).filter(User.email == user_data.email).first()
+    # Find user (on the primary too, in case they only just registered)
+    user = first_with_fallback(read_db, db, lambda session: session.query(User).filter(
+        User.email == user_data.email,
+        User.deleted_at.is_(None)
+    ))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,6 +78,24 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
     return Token(access_token=access_token, token_type="bearer")
 
 @router.get("/me", response_model=UserResponse)
+@query_budget(2)
 def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
-    return current_user
\ No newline at end of file
+    return current_user
+
+@router.delete("/me", response_model=PurgeJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def delete_account(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete the current user: sign-in stops immediately, their data is purged in the background"""
+    # current_user may come from the replica session: mark the row on the primary
+    db.query(User).filter(User.id == current_user.id).update(
+        {"deleted_at": datetime.utcnow()}, synchronize_session=False
+    )
+    job = purger.enqueue(db, ENTITY_USER, current_user.id, current_user.id)
+    db.commit()
+    db.refresh(job)
+    redis_service.bump_user_version(str(current_user.id))
+    
+    return job
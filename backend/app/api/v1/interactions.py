@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.application import Application
+from app.models.interaction import Interaction
+from app.schemas.interaction import InteractionCreate, InteractionResponse
+from app.services.redis_service import redis_service
+from app.services.reminder_scheduler import reminder_scheduler
+
+router = APIRouter(prefix="/interactions", tags=["Interactions"])
+
+@router.post("", response_model=InteractionResponse, status_code=status.HTTP_201_CREATED)
+def create_interaction(
+    data: InteractionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Log an interview, follow-up email or other interaction on an application"""
+    application = db.query(Application).filter(
+        Application.id == data.application_id,
+        Application.user_id == current_user.id,
+        Application.deleted_at.is_(None)
+    ).first()
+    
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    
+    interaction = Interaction(**data.model_dump())
+    db.add(interaction)
+    reminder_scheduler.on_interaction(db, application, interaction)
+    db.commit()
+    db.refresh(interaction)
+    redis_service.bump_user_version(str(current_user.id))
+    
+    return interaction
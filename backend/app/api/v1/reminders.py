@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+from uuid import UUID
+
+from app.core.database import get_db
+from app.api.deps import get_current_user, get_read_db
+from app.core.query_stats import query_budget
+from app.models.user import User
+from app.models.application import Application
+from app.models.reminder import Reminder, ReminderStatus
+from app.schemas.reminder import ReminderResponse
+from app.services.redis_service import redis_service
+
+router = APIRouter(prefix="/reminders", tags=["Reminders"])
+
+@router.get("", response_model=List[ReminderResponse])
+@query_budget(3)
+def list_reminders(
+    include_upcoming: bool = Query(False, description="Also return reminders that are not due yet"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Reminders that have come due (oldest first), with the application each one is about"""
+    statuses = [ReminderStatus.due]
+    if include_upcoming:
+        statuses.append(ReminderStatus.pending)
+    
+    return db.query(
+        Reminder.id,
+        Reminder.application_id,
+        Reminder.kind,
+        Reminder.status,
+        Reminder.due_at,
+        Reminder.fired_at,
+        Application.company_name,
+        Application.job_title,
+        Application.status.label("application_status")
+    ).join(
+        Application, Application.id == Reminder.application_id
+    ).filter(
+        Reminder.user_id == current_user.id,
+        Reminder.status.in_(statuses),
+        Application.deleted_at.is_(None)
+    ).order_by(Reminder.due_at).all()
+
+@router.post("/{reminder_id}/dismiss", status_code=status.HTTP_204_NO_CONTENT)
+def dismiss_reminder(
+    reminder_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Dismiss a reminder (it is re-armed if the application's status changes or another interview is logged)"""
+    dismissed = db.query(Reminder).filter(
+        Reminder.id == reminder_id,
+        Reminder.user_id == current_user.id,
+        Reminder.status != ReminderStatus.dismissed
+    ).update({Reminder.status: ReminderStatus.dismissed}, synchronize_session=False)
+    
+    if not dismissed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reminder not found"
+        )
+    db.commit()
+    redis_service.bump_user_version(str(current_user.id))
+    
+    return None
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
 import PyPDF2
+import hashlib
 import io
+from datetime import datetime
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
+from app.core.query_stats import query_budget
+from app.api.http_cache import response_cache, make_etag
 from app.models.user import User
 from app.models.resume import Resume
 from app.schemas.resume import ResumeCreate, ResumeResponse, ResumeListResponse
 from app.services.redis_service import redis_service
+from app.services.reanalysis_planner import reanalysis_planner
+from app.services.resume_service import activate_resume, get_active_resume
+from app.services.local_scorer import extract_skills
+from app.services.purge_service import purger, ENTITY_RESUME
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
@@ -28,11 +36,13 @@ def extract_text_from_pdf(pdf_file: bytes) -> str:
 
 @router.post("/upload", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def upload_resume(
+    response: Response,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Upload resume PDF and extract text"""
+    """Upload resume PDF and extract text (identical files re-activate the existing resume)"""
     # Validate file type
     if not file.filename.endswith('.pdf'):
         raise HTTPException(
@@ -50,78 +60,119 @@ async def upload_resume(
             detail="File size too large. Maximum 5MB allowed"
         )
     
-    # Extract text from PDF
-    resume_text = extract_text_from_pdf(pdf_content)
+    file_hash = hashlib.sha256(pdf_content).hexdigest()
     
-    if not resume_text:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Could not extract text from PDF. Please ensure it's a valid PDF with readable text"
-        )
-    
-    # Deactivate all other resumes
-    db.query(Resume).filter(Resume.user_id == current_user.id).update({"is_active": False})
-    
-    # Create new resume
+    # Identical re-upload: re-activate the existing resume and reuse its extraction and analyses
+    existing = db.query(Resume).filter(
+        Resume.user_id == current_user.id,
+        Resume.file_hash == file_hash,
+        Resume.deleted_at.is_(None)
+    ).order_by(Resume.created_at.desc()).first()
+    
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        if not existing.is_active:
+            activate_resume(db, current_user.id, existing)
+            db.commit()
+            db.refresh(existing)
+            redis_service.invalidate_user_resume_cache(str(current_user.id))
+            redis_service.bump_user_version(str(current_user.id))
+            background_tasks.add_task(reanalysis_planner.run, str(current_user.id), str(existing.id))
+        return existing
+    
+    # Extract text from PDF (shared cache by content hash covers cross-user duplicates)
+    extracted = redis_service.get_cached_extracted_resume(file_hash)
+    if extracted:
+        resume_text = extracted["content"]
+        parsed_skills = extracted["parsed_skills"]
+    else:
+        resume_text = extract_text_from_pdf(pdf_content)
+        
+        if not resume_text:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Could not extract text from PDF. Please ensure it's a valid PDF with readable text"
+            )
+        
+        parsed_skills = {"skills": extract_skills(resume_text)}
+        redis_service.cache_extracted_resume(file_hash, {
+            "content": resume_text,
+            "parsed_skills": parsed_skills
+        })
+    
+    # Create new resume and make it the active one
     new_resume = Resume(
         user_id=current_user.id,
         content=resume_text,
+        parsed_skills=parsed_skills,
         file_url=file.filename,  # Store filename for now
-        is_active=True
+        file_hash=file_hash
     )
     
-    db.add(new_resume)
+    activate_resume(db, current_user.id, new_resume)
     db.commit()
     db.refresh(new_resume)
 
     redis_service.invalidate_user_resume_cache(str(current_user.id))
+    redis_service.bump_user_version(str(current_user.id))
+
+    # Re-score open applications against the new active resume
+    background_tasks.add_task(reanalysis_planner.run, str(current_user.id), str(new_resume.id))
     
     return new_resume
 
 @router.post("", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 def create_resume(
     data: ResumeCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create/upload a resume"""
-    # Deactivate all other resumes
-    db.query(Resume).filter(Resume.user_id == current_user.id).update({"is_active": False})
-    
     new_resume = Resume(
         user_id=current_user.id,
         content=data.content,
-        file_url=data.file_url,
-        is_active=True
+        file_url=data.file_url
     )
     
-    db.add(new_resume)
+    activate_resume(db, current_user.id, new_resume)
     db.commit()
     db.refresh(new_resume)
 
     redis_service.invalidate_user_resume_cache(str(current_user.id))
+    redis_service.bump_user_version(str(current_user.id))
+
+    # Re-score open applications against the new active resume
+    background_tasks.add_task(reanalysis_planner.run, str(current_user.id), str(new_resume.id))
     
     return new_resume
 
 @router.get("", response_model=List[ResumeListResponse])
+@query_budget(3)
 def list_resumes(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all resumes for current user"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).order_by(Resume.created_at.desc()).all()
+    resumes = db.query(Resume).filter(
+        Resume.user_id == current_user.id,
+        Resume.deleted_at.is_(None)
+    ).order_by(Resume.created_at.desc()).all()
     return resumes
 
 @router.get("/active", response_model=ResumeResponse)
-def get_active_resume(
-    db: Session = Depends(get_db),
+@query_budget(3)
+def read_active_resume(
+    request: Request,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get current active resume"""
-    resume = db.query(Resume).filter(
-        Resume.user_id == current_user.id,
-        Resume.is_active == True
-    ).first()
+    cache_key, cached = response_cache.lookup(request, current_user.id)
+    if cached:
+        return cached
+    
+    resume = get_active_resume(db, current_user.id)
     
     if not resume:
         raise HTTPException(
@@ -129,7 +180,13 @@ def get_active_resume(
             detail="No active resume found"
         )
     
-    return resume
+    return response_cache.respond(
+        request,
+        cache_key,
+        lambda: ResumeResponse.model_validate(resume).model_dump_json().encode(),
+        make_etag(resume.id, resume.updated_at),
+        resume.updated_at
+    )
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_resume(
@@ -137,10 +194,11 @@ def delete_resume(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Delete a resume"""
+    """Delete a resume (its analyses are purged in the background)"""
     resume = db.query(Resume).filter(
         Resume.id == resume_id,
-        Resume.user_id == current_user.id
+        Resume.user_id == current_user.id,
+        Resume.deleted_at.is_(None)
     ).first()
     
     if not resume:
@@ -149,7 +207,16 @@ def delete_resume(
             detail="Resume not found"
         )
     
-    db.delete(resume)
+    resume.deleted_at = datetime.utcnow()
+    resume.is_active = False
+    # current_user may come from the replica session: update the pointer on the primary
+    db.query(User).filter(
+        User.id == current_user.id,
+        User.active_resume_id == resume.id
+    ).update({"active_resume_id": None}, synchronize_session=False)
+    purger.enqueue(db, ENTITY_RESUME, resume.id, current_user.id)
     db.commit()
+    redis_service.invalidate_user_resume_cache(str(current_user.id))
+    redis_service.bump_user_version(str(current_user.id))
     
     return None
\ No newline at end of file
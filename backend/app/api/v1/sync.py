@@ -0,0 +1,177 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Dict, Set, Tuple
+
+from app.core.config import settings
+from app.api.deps import get_current_user, get_read_db
+from app.core.query_stats import query_budget
+from app.models.user import User
+from app.models.application import Application
+from app.models.archived_application import ArchivedApplication
+from app.models.ai_analysis import AIAnalysis
+from app.models.resume import Resume
+from app.models.interaction import Interaction
+from app.models.change_log import ChangeLogEntry
+from app.schemas.ai_analysis import AIAnalysisResponse
+from app.schemas.interaction import InteractionResponse
+from app.schemas.sync import SyncResponse, SyncTombstones
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+# Oldest transaction still running: every change log entry below it is committed (or gone)
+VISIBLE_HORIZON_SQL = text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
+# Response field for each change log entity type
+ENTITY_FIELDS = {
+    "application": "applications",
+    "analysis": "analyses",
+    "resume": "resumes",
+    "interaction": "interactions",
+}
+
+# Archived analyses and interactions with some of the given ids, from the JSONB snapshots
+ARCHIVED_CHILDREN_SQL = text("""
+    SELECT 'analysis' AS entity_type, child FROM applications_archive, jsonb_array_elements(ai_analyses) AS child
+    WHERE user_id = :user_id AND child->>'id' = ANY(:analysis_ids)
+    UNION ALL
+    SELECT 'interaction', child FROM applications_archive, jsonb_array_elements(interactions) AS child
+    WHERE user_id = :user_id AND child->>'id' = ANY(:interaction_ids)
+""")
+
+# Schema used to send each kind of archived child
+ARCHIVED_CHILD_SCHEMAS = {
+    "analysis": AIAnalysisResponse,
+    "interaction": InteractionResponse,
+}
+
+def format_cursor(txid: int, entry_id: int, issued_at: int = None) -> str:
+    return f"{txid}-{entry_id}-{issued_at or int(datetime.utcnow().timestamp())}"
+
+def parse_cursor(cursor: str) -> Tuple[int, int, int]:
+    """Split a cursor from a previous /sync response into (txid, entry id, issued at)"""
+    try:
+        txid, entry_id, issued_at = (int(part) for part in cursor.split("-"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor, start over without `since`"
+        )
+
+    # Entries it still needs may already be pruned from change_log (a day of slack for long transactions)
+    horizon = datetime.utcnow() - timedelta(days=settings.SYNC_CHANGE_LOG_RETENTION_DAYS - 1)
+    if datetime.utcfromtimestamp(issued_at) < horizon:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Sync cursor expired, start over without `since`"
+        )
+    return txid, entry_id, issued_at
+
+def _archived_children(archived: list) -> Dict[str, list]:
+    """Analyses and interactions kept in the snapshots of archived applications"""
+    return {
+        "analysis": [AIAnalysisResponse.model_validate(child) for row in archived for child in row.ai_analyses],
+        "interaction": [InteractionResponse.model_validate(child) for row in archived for child in row.interactions],
+    }
+
+def _fetch(db: Session, user: User, ids: Dict[str, Set] = None) -> Dict[str, list]:
+    """Current rows of each entity type owned by the user, optionally limited to some ids"""
+    def wanted(entity_type, column, query):
+        if ids is None:
+            return query.all()
+        if not ids.get(entity_type):
+            return []
+        return query.filter(column.in_(ids[entity_type])).all()
+
+    # Soft-deleted rows are left out, so the change that deleted them turns into a tombstone
+    owned_applications = db.query(Application.id).filter(Application.user_id == user.id, Application.deleted_at.is_(None))
+    archived = wanted("application", ArchivedApplication.id, db.query(ArchivedApplication).filter(ArchivedApplication.user_id == user.id))
+    rows = {
+        "application": (
+            wanted("application", Application.id, db.query(Application).filter(Application.user_id == user.id, Application.deleted_at.is_(None)))
+            + archived
+        ),
+        "analysis": wanted("analysis", AIAnalysis.id, db.query(AIAnalysis).filter(AIAnalysis.application_id.in_(owned_applications))),
+        "resume": wanted("resume", Resume.id, db.query(Resume).filter(Resume.user_id == user.id, Resume.deleted_at.is_(None))),
+        "interaction": wanted("interaction", Interaction.id, db.query(Interaction).filter(Interaction.application_id.in_(owned_applications))),
+    }
+
+    # Children of archived applications live in the archive snapshots, not in the hot tables
+    if ids is None:
+        for entity_type, children in _archived_children(archived).items():
+            rows[entity_type] += children
+        return rows
+
+    # A change logged before its application was archived: look the child up in the snapshots
+    missing = {
+        entity_type: [str(entity_id) for entity_id in ids.get(entity_type, set()) - {row.id for row in rows[entity_type]}]
+        for entity_type in ARCHIVED_CHILD_SCHEMAS
+    }
+    if any(missing.values()):
+        for entity_type, child in db.execute(ARCHIVED_CHILDREN_SQL, {
+            "user_id": user.id,
+            "analysis_ids": missing["analysis"],
+            "interaction_ids": missing["interaction"],
+        }):
+            rows[entity_type].append(ARCHIVED_CHILD_SCHEMAS[entity_type].model_validate(child))
+    return rows
+
+def _response(cursor: str, has_more: bool, full: bool, rows: Dict[str, list], deleted: Dict[str, Set] = None) -> SyncResponse:
+    deleted = deleted or {}
+    return SyncResponse(
+        cursor=cursor,
+        has_more=has_more,
+        full=full,
+        deleted=SyncTombstones(**{field: sorted(deleted.get(entity_type, ()), key=str) for entity_type, field in ENTITY_FIELDS.items()}),
+        **{field: rows[entity_type] for entity_type, field in ENTITY_FIELDS.items()}
+    )
+
+@router.get("", response_model=SyncResponse)
+@query_budget(10)
+def sync(
+    since: str | None = Query(None, description="Cursor from the previous response; omit for a full snapshot"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Applications, analyses, resumes and interactions changed since a cursor, with tombstones for deletes"""
+    horizon = db.execute(VISIBLE_HORIZON_SQL).scalar()
+
+    # First sync: everything the user has, and a cursor to continue from
+    if since is None:
+        return _response(format_cursor(horizon, 0), False, True, _fetch(db, current_user))
+
+    txid, entry_id, issued_at = parse_cursor(since)
+    after = (txid, entry_id)
+    entries = db.query(
+        ChangeLogEntry.id,
+        ChangeLogEntry.txid,
+        ChangeLogEntry.entity_type,
+        ChangeLogEntry.entity_id
+    ).filter(
+        ChangeLogEntry.user_id == current_user.id,
+        tuple_(ChangeLogEntry.txid, ChangeLogEntry.id) > after,
+        ChangeLogEntry.txid < horizon
+    ).order_by(
+        ChangeLogEntry.txid,
+        ChangeLogEntry.id
+    ).limit(settings.SYNC_PAGE_SIZE + 1).all()
+
+    has_more = len(entries) > settings.SYNC_PAGE_SIZE
+    entries = entries[:settings.SYNC_PAGE_SIZE]
+    if has_more:
+        # Mid-backlog: the rest is as old as the cursor the client came with
+        cursor = format_cursor(entries[-1].txid, entries[-1].id, issued_at)
+    else:
+        cursor = format_cursor(max(horizon, after[0]), 0)
+
+    # Send the current state of every touched entity; the ones that no longer exist are tombstones
+    touched: Dict[str, Set] = {entity_type: set() for entity_type in ENTITY_FIELDS}
+    for entry in entries:
+        touched[entry.entity_type].add(entry.entity_id)
+    rows = _fetch(db, current_user, touched)
+    deleted = {
+        entity_type: touched[entity_type] - {row.id for row in rows[entity_type]}
+        for entity_type in ENTITY_FIELDS
+    }
+    return _response(cursor, has_more, False, rows, deleted)
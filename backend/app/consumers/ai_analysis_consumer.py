@@ -1,74 +1,131 @@
-from kafka import KafkaConsumer
-import json
+from kafka import KafkaConsumer, ConsumerRebalanceListener
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+import time
+from opentelemetry.trace import SpanKind
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, engine, replica_engine, get_read_session, first_with_fallback
+from app.core.tracing import tracer, setup_tracing, extract_context
+from app.core.profiling import profiled
+from app.core.query_stats import track_queries, check_queries, instrument_queries
 from app.models.application import Application
 from app.models.resume import Resume
 from app.models.ai_analysis import AIAnalysis, AnalysisStatus
-from app.services.gemini_service import gemini_service
+from app.services.analysis_cascade import analysis_cascade, TIER_LOCAL
+from app.services.analysis_result_store import analysis_result_store
+from app.services.resume_ranker import rank_resumes
+from app.services.resume_service import get_active_resume
 from app.services.redis_service import redis_service
+from app.services.events import decode_event
+from app.consumers.fair_scheduler import FairScheduler, INTERACTIVE, BULK
+from app.consumers.offset_tracker import OffsetTracker
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def process_application_created(event_data: dict, db: Session):
+def get_or_create_analysis(db: Session, application_id: str, resume_id: str | None) -> AIAnalysis:
+    """Return the analysis version for an (application, resume) pair, creating it if needed"""
+    analysis = db.query(AIAnalysis).filter(
+        AIAnalysis.application_id == application_id,
+        AIAnalysis.resume_id == resume_id
+    ).first()
+    
+    if not analysis:
+        analysis = AIAnalysis(application_id=application_id, resume_id=resume_id)
+        db.add(analysis)
+    
+    analysis.analysis_status = AnalysisStatus.pending
+    analysis.error_message = None
+    return analysis
+
+@tracer.start_as_current_span("resolve_resume")
+def resolve_resume(db: Session, user_id: str, requested_resume_id: str | None, read_db: Session = None) -> tuple:
+    """Return (resume_id, content) for the requested resume or the user's active one, or (None, None)"""
+    if requested_resume_id:
+        # Re-analysis against a specific resume (resumes are immutable, so the replica is fine once it has the row)
+        resume = first_with_fallback(read_db or db, db, lambda session: session.query(Resume).filter(
+            Resume.id == requested_resume_id,
+            Resume.user_id == user_id,
+            Resume.deleted_at.is_(None)
+        ))
+        if not resume:
+            return None, None
+        return str(resume.id), resume.content
+    
+    # Check cache for active resume first
+    cached_resume = redis_service.get_cached_active_resume(user_id)
+    if cached_resume:
+        logger.info(f"Using cached resume for user {user_id}")
+        return cached_resume.get('id'), cached_resume.get('content')
+    
+    # Fetch from the primary: the active pointer may have just moved
+    resume = get_active_resume(db, user_id)
+    if not resume:
+        return None, None
+    
+    # Cache the resume
+    redis_service.cache_active_resume(user_id, {
+        'id': str(resume.id),
+        'content': resume.content
+    })
+    return str(resume.id), resume.content
+
+@tracer.start_as_current_span("process_application_created")
+@profiled("process_application_created")
+def process_application_created(event_data: dict, db: Session, read_db: Session = None):
     """Process application-created event and run AI analysis"""
+    read_db = read_db or db
     try:
         application_id = event_data.get("application_id")
         user_id = event_data.get("user_id")
+        requested_resume_id = event_data.get("resume_id")
+        detailed = bool(event_data.get("detailed"))
+        # Edited applications must be re-analyzed even if the pair was analyzed before
+        force = detailed or event_data.get("event_type") == "application_updated"
         
         logger.info(f"Processing application {application_id}")
         
         # Fetch application
-        application = db.query(Application).filter(Application.id == application_id).first()
+        with tracer.start_as_current_span("load_application"):
+            # Usually a replica read; just-created applications fall back to the primary
+            application = first_with_fallback(
+                read_db, db, lambda session: session.query(Application).filter(
+                    Application.id == application_id,
+                    Application.deleted_at.is_(None)
+                )
+            )
+            # A description filled in by the enrichment worker may not have replicated yet
+            if application and event_data.get("job_hash") and not application.job_description and read_db is not db:
+                application = db.query(Application).filter(Application.id == application_id).first()
         if not application:
             logger.error(f"Application {application_id} not found")
             return
         
-        # Check cache for active resume first
-        cached_resume = redis_service.get_cached_active_resume(user_id)
-        
-        if cached_resume:
-            resume_id = cached_resume.get('id')
-            resume_content = cached_resume.get('content')
-            logger.info(f"Using cached resume for user {user_id}")
-        else:
-            # Fetch from database
-            resume = db.query(Resume).filter(
-                Resume.user_id == user_id,
-                Resume.is_active == True
-            ).first()
-            
-            if not resume:
-                logger.warning(f"No active resume found for user {user_id}")
-                analysis = AIAnalysis(
-                    application_id=application_id,
-                    resume_id=None,
-                    analysis_status=AnalysisStatus.failed,
-                    error_message="No active resume found"
-                )
-                db.add(analysis)
-                db.commit()
+        resume_id, resume_content = resolve_resume(db, user_id, requested_resume_id, read_db)
+        if not resume_id:
+            if requested_resume_id:
+                logger.warning(f"Resume {requested_resume_id} not found for user {user_id}")
                 return
-            
-            resume_id = str(resume.id)
-            resume_content = resume.content
-            
-            # Cache the resume
-            redis_service.cache_active_resume(user_id, {
-                'id': resume_id,
-                'content': resume_content
-            })
-        
-        # Create pending analysis
-        analysis = AIAnalysis(
-            application_id=application_id,
-            resume_id=resume_id,
-            analysis_status=AnalysisStatus.pending
-        )
-        db.add(analysis)
+            logger.warning(f"No active resume found for user {user_id}")
+            analysis = get_or_create_analysis(db, application_id, None)
+            analysis.analysis_status = AnalysisStatus.failed
+            analysis.error_message = "No active resume found"
+            db.commit()
+            return
+        
+        # Skip pairs that already have a completed analysis (re-deliveries, overlapping plans)
+        existing = db.query(AIAnalysis.analysis_status).filter(
+            AIAnalysis.application_id == application_id,
+            AIAnalysis.resume_id == resume_id
+        ).first()
+        if existing and existing.analysis_status == AnalysisStatus.completed and not force:
+            logger.info(f"Application {application_id} already analyzed against resume {resume_id}")
+            return
+        
+        # Create (or reset) the pending analysis version for this pair
+        analysis = get_or_create_analysis(db, application_id, resume_id)
         db.commit()
         
         # Check if job description exists
@@ -79,64 +136,252 @@ def process_application_created(event_data: dict, db: Session):
             db.commit()
             return
         
-        # Check cache for AI analysis
-        cached_analysis = redis_service.get_cached_ai_analysis(resume_id, application.job_description)
-        
-        if cached_analysis:
-            # Use cached analysis
-            logger.info(f"Using cached AI analysis for application {application_id}")
-            result = cached_analysis
-        else:
-            # Run AI analysis
-            logger.info(f"Running AI analysis for application {application_id}")
-            result = gemini_service.analyze_application(
-                resume_text=resume_content,
-                job_description=application.job_description,
-                job_title=application.job_title,
-                company_name=application.company_name
-            )
-            
-            # Cache the result
-            redis_service.cache_ai_analysis(resume_id, application.job_description, result)
+        # Run AI analysis through the model cascade (LLM tiers are served from the result store when possible)
+        logger.info(f"Running AI analysis for application {application_id}")
+        result = analysis_cascade.analyze(
+            resume_text=resume_content,
+            job_description=application.job_description,
+            job_title=application.job_title,
+            company_name=application.company_name,
+            detailed=detailed
+        )
+        
+        if result.get("error"):
+            analysis.analysis_status = AnalysisStatus.failed
+            analysis.error_message = result["error"]
+            db.commit()
+            return
         
         # Update analysis with results
         analysis.match_score = result.get("match_score")
         analysis.matching_skills = {"skills": result.get("matching_skills", [])}
         analysis.missing_skills = {"skills": result.get("missing_skills", [])}
         analysis.suggestions = result.get("suggestions")
+        analysis.model_used = result.get("model_used")
+        analysis.latency_ms = result.get("latency_ms")
+        analysis.cost_usd = result.get("cost_usd")
         analysis.analysis_status = AnalysisStatus.completed
         
         from datetime import datetime
         analysis.analyzed_at = datetime.utcnow()
         
-        db.commit()
+        with tracer.start_as_current_span("save_analysis"):
+            db.commit()
         logger.info(f"Analysis completed for application {application_id}")
         
     except Exception as e:
         logger.error(f"Error processing event: {e}")
         db.rollback()
 
+@tracer.start_as_current_span("process_best_resume")
+def process_best_resume(event_data: dict, db: Session, read_db: Session = None):
+    """Rank every resume locally, analyze only the top-k with the cascade and record the best fit"""
+    read_db = read_db or db
+    try:
+        application_id = event_data.get("application_id")
+        user_id = event_data.get("user_id")
+        
+        application = db.query(Application).filter(
+            Application.id == application_id,
+            Application.deleted_at.is_(None)
+        ).first()
+        if not application or not application.job_description:
+            logger.error(f"Application {application_id} not found or has no job description")
+            return
+        
+        # Ranking reads every resume's content, so it runs on the read session
+        candidates = rank_resumes(read_db, user_id, application.job_description)[:settings.BEST_RESUME_TOP_K]
+        if not candidates:
+            logger.warning(f"No resumes found for user {user_id}")
+            return
+        
+        candidate_ids = [resume_id for resume_id, _ in candidates]
+        logger.info(f"Best-resume candidates for application {application_id}: {candidate_ids}")
+        
+        # Each candidate gets its own (application, resume) analysis version
+        for resume_id in candidate_ids:
+            process_application_created({
+                "application_id": application_id,
+                "user_id": user_id,
+                "resume_id": resume_id
+            }, db, read_db)
+        
+        analyses = db.query(AIAnalysis.resume_id, AIAnalysis.match_score, AIAnalysis.model_used).filter(
+            AIAnalysis.application_id == application_id,
+            AIAnalysis.resume_id.in_(candidate_ids),
+            AIAnalysis.analysis_status == AnalysisStatus.completed,
+            AIAnalysis.match_score.isnot(None)
+        ).all()
+        
+        # Local keyword scores and LLM match scores are on different scales: compare
+        # LLM-scored candidates only, unless the cascade stopped locally for all of them
+        local_model = analysis_cascade.tier_models[TIER_LOCAL]
+        comparable = [a for a in analyses if a.model_used != local_model] or analyses
+        best = max(comparable, key=lambda a: a.match_score, default=None)
+        
+        if not best:
+            logger.warning(f"No completed analysis among best-resume candidates for {application_id}")
+            return
+        
+        application.best_resume_id = best.resume_id
+        application.best_resume_score = best.match_score
+        db.commit()
+        logger.info(f"Best resume for application {application_id}: {best.resume_id} ({best.match_score})")
+        
+    except Exception as e:
+        logger.error(f"Error selecting best resume: {e}")
+        db.rollback()
+
+def handle_event(event_data: dict):
+    """Run a single analysis job with its own database session (worker thread entrypoint)"""
+    db = SessionLocal()
+    read_db = get_read_session()
+    try:
+        with track_queries() as stats:
+            if event_data.get("event_type") == "best_resume_requested":
+                process_best_resume(event_data, db, read_db)
+            else:
+                process_application_created(event_data, db, read_db)
+        check_queries(f"message {event_data.get('event_type')}", stats, settings.CONSUMER_QUERY_BUDGET)
+    finally:
+        read_db.close()
+        db.close()
+        # Analyses are part of the user's cached API responses
+        redis_service.bump_user_version(str(event_data.get("user_id")))
+
+def report_backlog(consumer: KafkaConsumer, scheduler: FairScheduler):
+    """Publish unconsumed Kafka messages plus buffered jobs, which the API uses for load shedding"""
+    try:
+        partitions = list(consumer.assignment())
+        end_offsets = consumer.end_offsets(partitions) if partitions else {}
+        lag = sum(max(0, end_offsets[tp] - consumer.position(tp)) for tp in partitions)
+        redis_service.set_analysis_backlog(
+            lag + scheduler.pending(),
+            expiry=settings.ANALYSIS_BACKLOG_REPORT_SECONDS * 6
+        )
+    except Exception as e:
+        logger.error(f"Failed to report analysis backlog: {e}")
+
+def commit_finished(consumer: KafkaConsumer, tracker: OffsetTracker):
+    """Commit each partition up to its oldest message that has not finished"""
+    offsets = tracker.committable()
+    if not offsets:
+        return
+    try:
+        consumer.commit(offsets)
+        tracker.committed(offsets)
+    except Exception as e:
+        logger.error(f"Offset commit failed: {e}")
+
+class CommitOnRevoke(ConsumerRebalanceListener):
+    """Commit finished work before partitions move to another worker, then stop tracking them"""
+
+    def __init__(self, consumer: KafkaConsumer, tracker: OffsetTracker):
+        self.consumer = consumer
+        self.tracker = tracker
+
+    def on_partitions_revoked(self, revoked):
+        commit_finished(self.consumer, self.tracker)
+        self.tracker.forget(revoked)
+
+    def on_partitions_assigned(self, assigned):
+        pass
+
 def start_consumer():
     """Start Kafka consumer for AI analysis"""
+    lanes = {
+        settings.ANALYSIS_INTERACTIVE_TOPIC: INTERACTIVE,
+        settings.ANALYSIS_BULK_TOPIC: BULK,
+        settings.ANALYSIS_UPDATED_TOPIC: INTERACTIVE,
+    }
+    # Offsets are committed by hand once jobs finish: buffered jobs must survive a restart
     consumer = KafkaConsumer(
-        'application-created',
         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-        value_deserializer=lambda m: json.loads(m.decode('utf-8')),
+        value_deserializer=decode_event,
         group_id='ai-analysis-worker',
-        auto_offset_reset='earliest'
+        auto_offset_reset='earliest',
+        enable_auto_commit=False
     )
+    tracker = OffsetTracker()
+    consumer.subscribe(list(lanes.keys()), listener=CommitOnRevoke(consumer, tracker))
+    scheduler = FairScheduler(
+        interactive_weight=settings.ANALYSIS_INTERACTIVE_WEIGHT,
+        bulk_weight=settings.ANALYSIS_BULK_WEIGHT,
+        max_in_flight_per_user=settings.ANALYSIS_MAX_IN_FLIGHT_PER_USER
+    )
+    executor = ThreadPoolExecutor(max_workers=settings.ANALYSIS_WORKER_CONCURRENCY)
+    slots = threading.Semaphore(settings.ANALYSIS_WORKER_CONCURRENCY)
+    
+    def run_job(user_id: str, job: dict):
+        try:
+            with tracer.start_as_current_span(
+                "analysis_job",
+                context=job["context"],
+                kind=SpanKind.CONSUMER,
+                attributes={
+                    "messaging.destination": job["topic"],
+                    "analysis.lane": job["lane"],
+                    "analysis.user_id": user_id,
+                    # Time spent in Kafka before being polled, then in the scheduler buffer
+                    "analysis.kafka_wait_ms": job["received_at"] - job["published_at"],
+                    "analysis.queue_wait_ms": int(time.time() * 1000) - job["received_at"],
+                }
+            ):
+                handle_event(job["event"])
+        finally:
+            scheduler.done(user_id)
+            tracker.done(job["partition"], job["offset"])
+            slots.release()
+    
+    setup_tracing("ai-analysis-worker", engines=[e for e in (engine, replica_engine) if e is not None])
+    instrument_queries()
+    
+    # Pre-load recent results so a cold Redis does not translate into Gemini calls
+    analysis_result_store.warm()
     
     logger.info("AI Analysis Consumer started. Listening for events...")
     
-    for message in consumer:
-        event_data = message.value
-        logger.info(f"Received event: {event_data}")
+    last_backlog_report = 0.0
+    while True:
+        if time.monotonic() - last_backlog_report >= settings.ANALYSIS_BACKLOG_REPORT_SECONDS:
+            report_backlog(consumer, scheduler)
+            last_backlog_report = time.monotonic()
         
-        db = SessionLocal()
-        try:
-            process_application_created(event_data, db)
-        finally:
-            db.close()
+        # Stop fetching a lane whose buffer is full so it cannot crowd out the other one
+        for topic, lane in lanes.items():
+            partitions = [tp for tp in consumer.assignment() if tp.topic == topic]
+            if scheduler.pending(lane) >= settings.ANALYSIS_MAX_BUFFERED_PER_LANE:
+                consumer.pause(*partitions)
+            else:
+                consumer.resume(*partitions)
+        
+        commit_finished(consumer, tracker)
+        records = consumer.poll(timeout_ms=500)
+        for topic_partition, messages in records.items():
+            lane = lanes[topic_partition.topic]
+            for message in messages:
+                event_data = message.value
+                logger.info(f"Received {lane} event: {event_data}")
+                tracker.received(topic_partition, message.offset)
+                scheduler.submit(lane, str(event_data.get("user_id")), {
+                    "event": event_data,
+                    "topic": topic_partition.topic,
+                    "lane": lane,
+                    "partition": topic_partition,
+                    "offset": message.offset,
+                    "context": extract_context(message.headers),
+                    "published_at": message.timestamp,
+                    "received_at": int(time.time() * 1000),
+                })
+        
+        # Dispatch as many jobs as there are free workers and eligible users
+        while slots.acquire(blocking=False):
+            job = scheduler.next()
+            if job is None:
+                slots.release()
+                break
+            _, user_id, queued_job = job
+            executor.submit(run_job, user_id, queued_job)
 
 if __name__ == "__main__":
     start_consumer()
\ No newline at end of file
@@ -0,0 +1,19 @@
+import time
+import logging
+from app.core.config import settings
+from app.services.application_archiver import application_archiver
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def start_archive_worker(interval: float = None):
+    """Periodically move old closed applications into the compressed archive"""
+    interval = interval or settings.ARCHIVE_INTERVAL_SECONDS
+    logger.info("Application archive worker started")
+    
+    while True:
+        application_archiver.run()
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    start_archive_worker()
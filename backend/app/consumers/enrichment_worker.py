@@ -0,0 +1,97 @@
+from kafka import KafkaConsumer
+import asyncio
+import logging
+from typing import List
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application
+from app.services.analysis_result_store import content_hash
+from app.services.job_page_fetcher import job_page_fetcher
+from app.services.kafka_producer import kafka_producer
+from app.services.redis_service import redis_service
+from app.services.events import decode_event
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def enrich_batch(loop: asyncio.AbstractEventLoop, events: List[dict]) -> int:
+    """
+    Fill in missing job descriptions from job_url for a batch of application_created events,
+    then forward every event to its analysis topic (enriched or not). Returns how many
+    applications got a description.
+    """
+    db = SessionLocal()
+    try:
+        # Only applications still missing a description; the user may have pasted one meanwhile
+        applications = db.query(Application).filter(
+            Application.id.in_([event["application_id"] for event in events]),
+            Application.deleted_at.is_(None),
+            Application.job_url.isnot(None),
+            Application.job_description.is_(None) | (Application.job_description == "")
+        ).all()
+        
+        urls = {application.job_url for application in applications}
+        cached = redis_service.get_cached_job_pages(urls)
+        pages = loop.run_until_complete(job_page_fetcher.fetch_many(urls, cached))
+        
+        # Cache what was (re)fetched, including pages without a usable posting so they are not retried
+        fresh = {url: page for url, page in pages.items() if page is not None and page is not cached.get(url)}
+        if fresh:
+            redis_service.cache_job_pages(fresh, settings.ENRICHMENT_CACHE_TTL_SECONDS)
+        
+        descriptions = {}
+        for application in applications:
+            page = pages.get(application.job_url)
+            if page and page.get("text"):
+                application.job_description = page["text"]
+                descriptions[str(application.id)] = page["text"]
+        db.commit()
+        
+        for user_id in {str(application.user_id) for application in applications if str(application.id) in descriptions}:
+            redis_service.bump_user_version(user_id)
+    except Exception as e:
+        logger.error(f"Enrichment failed for {len(events)} events: {e}")
+        db.rollback()
+        descriptions = {}
+    finally:
+        db.close()
+    
+    # Forward every event: without a description the analysis records why it could not run
+    for event in events:
+        topic = event.pop("analysis_topic", None) or settings.ANALYSIS_INTERACTIVE_TOPIC
+        description = descriptions.get(event["application_id"])
+        if description:
+            event["job_hash"] = content_hash(description)
+        kafka_producer.publish_event(topic, event)
+    
+    logger.info(f"Enriched {len(descriptions)} of {len(events)} applications")
+    return len(descriptions)
+
+def start_enrichment_worker():
+    """Fetch job postings for applications saved with only a job_url, in concurrent batches"""
+    consumer = KafkaConsumer(
+        settings.ENRICHMENT_TOPIC,
+        bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
+        value_deserializer=decode_event,
+        group_id='enrichment-worker',
+        auto_offset_reset='earliest',
+        enable_auto_commit=False  # committed once the batch is forwarded to analysis
+    )
+    # One loop for the worker's lifetime so the HTTP connection pool is reused across batches
+    loop = asyncio.new_event_loop()
+    logger.info("Enrichment worker started")
+    
+    try:
+        while True:
+            records = consumer.poll(timeout_ms=500, max_records=settings.ENRICHMENT_BATCH_SIZE)
+            events = [message.value for messages in records.values() for message in messages]
+            if events:
+                enrich_batch(loop, events)
+                # Only now are the events on the analysis topics: a crash before this redelivers the batch
+                consumer.commit()
+    finally:
+        loop.run_until_complete(job_page_fetcher.aclose())
+        loop.close()
+
+if __name__ == "__main__":
+    start_enrichment_worker()
@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional, Tuple
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+class FairScheduler:
+    """
+    In-memory dispatcher for analysis jobs.
+
+    Lanes are picked with smooth weighted round-robin, so the interactive lane gets
+    `interactive_weight` turns for every `bulk_weight` turn of the bulk lane. Inside a
+    lane, users are served round-robin (one job per turn), and a user is skipped while
+    they already have `max_in_flight_per_user` jobs running.
+    """
+
+    def __init__(self, interactive_weight: int = 4, bulk_weight: int = 1, max_in_flight_per_user: int = 1):
+        self.weights = {INTERACTIVE: interactive_weight, BULK: bulk_weight}
+        self.max_in_flight_per_user = max_in_flight_per_user
+        self._queues: Dict[str, "OrderedDict[str, deque]"] = {lane: OrderedDict() for lane in self.weights}
+        self._credits = {lane: 0 for lane in self.weights}
+        self._pending = {lane: 0 for lane in self.weights}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, lane: str, user_id: str, item: Any):
+        """Queue a job for a user in the given lane"""
+        with self._lock:
+            queue = self._queues[lane].setdefault(user_id, deque())
+            queue.append(item)
+            self._pending[lane] += 1
+
+    def pending(self, lane: Optional[str] = None) -> int:
+        """Number of queued (not yet dispatched) jobs, for one lane or all of them"""
+        with self._lock:
+            if lane:
+                return self._pending[lane]
+            return sum(self._pending.values())
+
+    def next(self) -> Optional[Tuple[str, str, Any]]:
+        """Pick the next dispatchable job as (lane, user_id, item), or None if nothing is eligible"""
+        with self._lock:
+            eligible = [lane for lane in self.weights if self._has_dispatchable(lane)]
+            if not eligible:
+                return None
+
+            # Smooth weighted round-robin across lanes that can make progress
+            total = sum(self.weights[lane] for lane in eligible)
+            for lane in eligible:
+                self._credits[lane] += self.weights[lane]
+            lane = max(eligible, key=lambda l: self._credits[l])
+            self._credits[lane] -= total
+
+            user_id, item = self._pop_round_robin(lane)
+            self._in_flight[user_id] = self._in_flight.get(user_id, 0) + 1
+            return lane, user_id, item
+
+    def done(self, user_id: str):
+        """Release a user's in-flight slot once their job has finished"""
+        with self._lock:
+            remaining = self._in_flight.get(user_id, 0) - 1
+            if remaining > 0:
+                self._in_flight[user_id] = remaining
+            else:
+                self._in_flight.pop(user_id, None)
+
+    def _has_capacity(self, user_id: str) -> bool:
+        return self._in_flight.get(user_id, 0) < self.max_in_flight_per_user
+
+    def _has_dispatchable(self, lane: str) -> bool:
+        return any(self._has_capacity(user_id) for user_id in self._queues[lane])
+
+    def _pop_round_robin(self, lane: str) -> Tuple[str, Any]:
+        queues = self._queues[lane]
+        for user_id in list(queues):
+            if not self._has_capacity(user_id):
+                continue
+
+            queue = queues.pop(user_id)
+            item = queue.popleft()
+            if queue:
+                # Move the user to the back of the rotation
+                queues[user_id] = queue
+            self._pending[lane] -= 1
+            return user_id, item
+
+        raise LookupError(f"No dispatchable job in lane {lane}")
@@ -0,0 +1,53 @@
+import threading
+from typing import Dict, Iterable, Set
+from kafka import TopicPartition
+from kafka.structs import OffsetAndMetadata
+
+class OffsetTracker:
+    """
+    Tracks which polled messages have finished so offsets can be committed by hand.
+    Jobs finish out of order (the scheduler reorders them and several run at once), so a
+    partition is only committed up to its lowest message still buffered or running.
+    """
+
+    def __init__(self):
+        self._unfinished: Dict[TopicPartition, Set[int]] = {}
+        self._next: Dict[TopicPartition, int] = {}  # offset after the last message received
+        self._committed: Dict[TopicPartition, int] = {}
+        self._lock = threading.Lock()
+
+    def received(self, partition: TopicPartition, offset: int):
+        """Record a polled message that has not been processed yet"""
+        with self._lock:
+            self._unfinished.setdefault(partition, set()).add(offset)
+            self._next[partition] = max(self._next.get(partition, 0), offset + 1)
+
+    def done(self, partition: TopicPartition, offset: int):
+        """Record that a message was processed (successfully or not)"""
+        with self._lock:
+            self._unfinished.get(partition, set()).discard(offset)
+
+    def committable(self) -> Dict[TopicPartition, OffsetAndMetadata]:
+        """Offsets that moved since the last commit: everything below them has finished"""
+        offsets = {}
+        with self._lock:
+            for partition, next_offset in self._next.items():
+                unfinished = self._unfinished.get(partition)
+                offset = min(unfinished) if unfinished else next_offset
+                if offset > self._committed.get(partition, -1):
+                    offsets[partition] = OffsetAndMetadata(offset, None)
+        return offsets
+
+    def committed(self, offsets: Dict[TopicPartition, OffsetAndMetadata]):
+        """Record offsets the broker accepted"""
+        with self._lock:
+            for partition, offset in offsets.items():
+                self._committed[partition] = max(self._committed.get(partition, -1), offset.offset)
+
+    def forget(self, partitions: Iterable[TopicPartition]):
+        """Drop partitions this consumer no longer owns (their jobs are redelivered elsewhere)"""
+        with self._lock:
+            for partition in partitions:
+                self._unfinished.pop(partition, None)
+                self._next.pop(partition, None)
+                self._committed.pop(partition, None)
@@ -0,0 +1,20 @@
+import time
+import logging
+from app.core.config import settings
+from app.services.purge_service import purger
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def start_purge_worker(interval: float = None):
+    """Periodically delete soft-deleted users, applications and resumes, and expired change log entries, in batches"""
+    interval = interval or settings.PURGE_INTERVAL_SECONDS
+    logger.info("Purge worker started")
+    
+    while True:
+        purger.run()
+        purger.prune_change_log()
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    start_purge_worker()
@@ -0,0 +1,19 @@
+import time
+import logging
+from app.services.reanalysis_planner import reanalysis_planner
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def start_reanalysis_worker(poll_interval: float = 1.0):
+    """Publish planned re-analyses to Kafka as their batches come due"""
+    logger.info("Re-analysis release worker started")
+    
+    while True:
+        published = reanalysis_planner.release_due()
+        if published:
+            logger.info(f"Released {published} planned re-analyses")
+        time.sleep(poll_interval)
+
+if __name__ == "__main__":
+    start_reanalysis_worker()
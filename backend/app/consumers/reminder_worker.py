@@ -0,0 +1,19 @@
+import time
+import logging
+from app.core.config import settings
+from app.services.reminder_scheduler import reminder_scheduler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def start_reminder_worker(interval: float = None):
+    """Periodically fire follow-up reminders that have come due"""
+    interval = interval or settings.REMINDER_INTERVAL_SECONDS
+    logger.info("Reminder worker started")
+    
+    while True:
+        reminder_scheduler.run()
+        time.sleep(interval)
+
+if __name__ == "__main__":
+    start_reminder_worker()
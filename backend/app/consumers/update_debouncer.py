@@ -0,0 +1,19 @@
+import time
+import logging
+from app.services.analysis_debouncer import analysis_debouncer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def start_debouncer(poll_interval: float = 1.0):
+    """Flush debounced application edits to Kafka once their window has elapsed"""
+    logger.info("Analysis update debouncer started")
+    
+    while True:
+        published = analysis_debouncer.flush_due()
+        if published:
+            logger.info(f"Published {published} debounced application updates")
+        time.sleep(poll_interval)
+
+if __name__ == "__main__":
+    start_debouncer()
@@ -3,12 +3,34 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: str | None = None  # read-only streaming replica for GET traffic
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+    READ_YOUR_WRITES_SECONDS: int = 10  # reads go to the primary this long after a user's write
     
     # Redis
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # seconds idle before a pooled connection is PINGed
+    REDIS_COMPRESSION_ENABLED: bool = True
+    REDIS_COMPRESSION_MIN_BYTES: int = 1024  # smaller values are stored as plain JSON
+    REDIS_COMPRESSION_LEVEL: int = 3
     
     # Kafka
     KAFKA_BOOTSTRAP_SERVERS: str
+    KAFKA_COMPRESSION_TYPE: str | None = "gzip"
+    
+    # Analysis lanes (interactive creates vs. bulk/background work)
+    ANALYSIS_INTERACTIVE_TOPIC: str = "application-created"
+    ANALYSIS_BULK_TOPIC: str = "application-created-bulk"
+    ANALYSIS_UPDATED_TOPIC: str = "application-updated"
+    ANALYSIS_UPDATE_DEBOUNCE_SECONDS: int = 30
+    ANALYSIS_INTERACTIVE_WEIGHT: int = 4
+    ANALYSIS_BULK_WEIGHT: int = 1
+    ANALYSIS_WORKER_CONCURRENCY: int = 4
+    ANALYSIS_MAX_IN_FLIGHT_PER_USER: int = 1
+    ANALYSIS_MAX_BUFFERED_PER_LANE: int = 200
     
     # Security
     SECRET_KEY: str
@@ -18,6 +40,110 @@ class Settings(BaseSettings):
     # OpenAI
     GEMINI_API_KEY: str
     
+    # AI model cascade: local scorer -> fast model -> detailed model
+    GEMINI_FAST_MODEL: str = "gemini-2.0-flash-lite"
+    GEMINI_DETAILED_MODEL: str = "gemini-2.0-flash-exp"
+    GEMINI_FAST_COST_PER_1K_TOKENS: float = 0.000075
+    GEMINI_DETAILED_COST_PER_1K_TOKENS: float = 0.0003
+    CASCADE_LOCAL_MIN_CONFIDENCE: float = 0.75
+    CASCADE_LOCAL_MIN_SIMILARITY: float = 0.03
+    CASCADE_LOCAL_REJECT_BELOW: int = 15
+    CASCADE_LOCAL_ACCEPT_ABOVE: int = 90
+    CASCADE_MIN_CONFIDENCE: float = 0.7
+    CASCADE_DECISION_BOUNDARY: int = 60
+    CASCADE_BOUNDARY_MARGIN: int = 10
+    
+    # Local match engine
+    MATCH_VECTOR_CACHE_SIZE: int = 5000
+    BEST_RESUME_TOP_K: int = 2
+    
+    # Durable analysis result store
+    ANALYSIS_RESULT_CACHE_TTL_SECONDS: int = 86400
+    ANALYSIS_RESULT_WARM_LIMIT: int = 1000
+    
+    # HTTP response cache
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    GZIP_MINIMUM_SIZE: int = 1024
+    
+    # Rate limiting (token bucket per user and route class; burst = bucket size)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_DEFAULT_PER_MINUTE: int = 120
+    RATE_LIMIT_DEFAULT_BURST: int = 60
+    RATE_LIMIT_ANALYSIS_PER_MINUTE: int = 10
+    RATE_LIMIT_ANALYSIS_BURST: int = 5
+    RATE_LIMIT_UPLOAD_PER_MINUTE: int = 4
+    RATE_LIMIT_UPLOAD_BURST: int = 2
+    RATE_LIMIT_BULK_ITEMS_PER_MINUTE: int = 50  # bulk creates are charged per application
+    RATE_LIMIT_BULK_ITEMS_BURST: int = 50  # at least BULK_CREATE_MAX_ITEMS, or full batches never fit
+    
+    # Load shedding: reject new analysis work while the worker backlog is this deep
+    ANALYSIS_BACKLOG_SHED_THRESHOLD: int = 1000
+    ANALYSIS_BACKLOG_REPORT_SECONDS: int = 5
+    
+    # Re-analysis planner
+    REANALYSIS_BATCH_SIZE: int = 20
+    REANALYSIS_BATCH_INTERVAL_SECONDS: float = 30.0
+    REANALYSIS_PENDING_STALE_SECONDS: int = 3600  # pending analyses older than this are planned again
+    
+    # Cold archival of closed applications
+    ARCHIVE_AFTER_MONTHS: int = 12
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+
+    # Job description enrichment from job_url
+    ENRICHMENT_ENABLED: bool = True
+    ENRICHMENT_TOPIC: str = "application-enrichment"
+    ENRICHMENT_BATCH_SIZE: int = 50  # events fetched concurrently per poll
+    ENRICHMENT_MAX_CONNECTIONS: int = 50
+    ENRICHMENT_PER_DOMAIN_CONCURRENCY: int = 2
+    ENRICHMENT_TIMEOUT_SECONDS: float = 10.0
+    ENRICHMENT_MAX_BYTES: int = 2_000_000
+    ENRICHMENT_MAX_REDIRECTS: int = 3
+    ENRICHMENT_CACHE_TTL_SECONDS: int = 604800
+    ENRICHMENT_MIN_DESCRIPTION_CHARS: int = 200
+    ENRICHMENT_MAX_DESCRIPTION_CHARS: int = 20000
+    ENRICHMENT_USER_AGENT: str = "JobTrackerBot/1.0"
+    ENRICHMENT_ALLOW_PRIVATE_HOSTS: bool = False  # only for local stub servers
+    
+    # Soft delete purge worker
+    PURGE_BATCH_SIZE: int = 1000
+    PURGE_INTERVAL_SECONDS: int = 30
+    PURGE_STALE_AFTER_SECONDS: int = 600  # re-claim running jobs without progress for this long
+    PURGE_MAX_ATTEMPTS: int = 5  # a job stays failed after this many failed runs
+    PURGE_RETRY_BASE_SECONDS: int = 60  # doubled after each failed run
+    
+    # Follow-up reminders
+    REMINDER_APPLIED_STALE_DAYS: int = 14
+    REMINDER_SCREENING_STALE_DAYS: int = 7
+    REMINDER_FOLLOW_UP_DAYS: int = 3  # after an interview without a follow-up email
+    REMINDER_BATCH_SIZE: int = 500
+    REMINDER_INTERVAL_SECONDS: int = 60
+    
+    # Bulk create (extension capture queue)
+    BULK_CREATE_MAX_ITEMS: int = 50
+
+    # Delta sync (change log entries per /sync page)
+    SYNC_PAGE_SIZE: int = 500
+    SYNC_CHANGE_LOG_RETENTION_DAYS: int = 30  # older cursors get a 400 and resync from scratch
+    
+    # Tracing
+    TRACING_ENABLED: bool = False
+    TRACING_OTLP_ENDPOINT: str | None = None  # e.g. http://localhost:4318/v1/traces
+    TRACING_FILE: str | None = None  # JSON lines span dump
+    
+    # Sampling profiler (folded stacks per route/job, see app/core/profiling.py)
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0  # fraction of requests/jobs profiled at random
+    PROFILING_TOKEN: str | None = None  # requests sending `X-Profile: <token>` are always profiled
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_DIR: str = "profiles"
+    
+    # Query statistics: per request/message counts, N+1 warnings and @query_budget checks
+    QUERY_STATS_ENABLED: bool = False
+    QUERY_BUDGET_STRICT: bool = False  # raise instead of warn when a route exceeds its budget (tests, CI)
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 5  # same statement this many times in one request = likely N+1
+    CONSUMER_QUERY_BUDGET: int = 15  # per analysis message
+    
     # App
     APP_NAME: str = "Job Tracker API"
     DEBUG: bool = True
@@ -1,15 +1,88 @@
-from sqlalchemy import create_engine
+import time
+import logging
+from typing import Callable
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Query, Session, sessionmaker
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 engine = create_engine(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Optional streaming replica for read-only traffic
+replica_engine = None
+ReplicaSessionLocal = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        settings.DATABASE_REPLICA_URL,
+        pool_pre_ping=True,
+        execution_options={"postgresql_readonly": True}
+    )
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+_replica_status = {"checked_at": 0.0, "healthy": False}
+
+def replica_healthy() -> bool:
+    """Whether the replica is reachable and within REPLICA_MAX_LAG_SECONDS (re-checked periodically)"""
+    if replica_engine is None:
+        return False
+
+    now = time.monotonic()
+    if now - _replica_status["checked_at"] < settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+        return _replica_status["healthy"]
+
+    try:
+        with replica_engine.connect() as conn:
+            lag = conn.execute(REPLICA_LAG_SQL).scalar()
+        healthy = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+        if not healthy:
+            logger.warning(f"Replica lag {lag}s is over the limit, reading from the primary")
+    except Exception as e:
+        logger.error(f"Replica lag check failed: {e}")
+        healthy = False
+
+    _replica_status.update(checked_at=now, healthy=healthy)
+    return healthy
+
+def get_read_session() -> Session:
+    """Session on the replica when it is healthy, otherwise on the primary"""
+    if replica_healthy():
+        return ReplicaSessionLocal()
+    return SessionLocal()
+
+def is_replica(db: Session) -> bool:
+    """Whether a session reads from the replica"""
+    return replica_engine is not None and db.get_bind() is replica_engine
+
+def first_with_fallback(read_db: Session, db: Session, build_query: Callable[[Session], Query]):
+    """Run a lookup on the read session, retrying on the primary when the row has not replicated yet"""
+    row = build_query(read_db).first()
+    if row is None and is_replica(read_db):
+        row = build_query(db).first()
+    return row
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_replica_db():
+    db = get_read_session()
+    try:
+        yield db
+    finally:
+        db.close()
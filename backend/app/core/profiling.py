@@ -0,0 +1,153 @@
+import os
+import re
+import sys
+import time
+import random
+import logging
+import threading
+import functools
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}.{getattr(code, 'co_qualname', code.co_name)}"
+
+# Profile of the request being handled, so its endpoint can bind the thread it runs on
+current_profile: ContextVar[Optional["Profile"]] = ContextVar("current_profile", default=None)
+
+class Profile:
+    """
+    Stack samples for one profiled request or job, as folded stacks ("a;b;c" -> count).
+    Samples only the thread it is bound to; endpoints bind their threadpool thread while
+    they run (see bind_endpoint_threads), so other requests on the same route are left out.
+    """
+
+    def __init__(self, name: str, thread_id: Optional[int] = None):
+        self.name = name
+        self.thread_id = thread_id
+        self.stacks: Counter = Counter()
+        self.started_at = time.perf_counter()
+        self.duration_ms = 0.0
+
+    @contextmanager
+    def bound(self):
+        """Sample the calling thread until the block exits"""
+        self.thread_id = threading.get_ident()
+        try:
+            yield
+        finally:
+            self.thread_id = None
+
+    def sample(self, frames: dict):
+        frame = frames.get(self.thread_id) if self.thread_id is not None else None
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if stack:
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+class SamplingProfiler:
+    """
+    Samples the stacks of active profiles every PROFILING_INTERVAL_MS from one background
+    thread, which only runs while something is being profiled. Profiles are appended to
+    PROFILING_DIR/<name>.folded, so each file aggregates every profile of one route or job;
+    flamegraph.pl, inferno and speedscope read the format directly.
+    """
+
+    def __init__(self, interval_ms: float = None, directory: str = None):
+        self.interval = (interval_ms or settings.PROFILING_INTERVAL_MS) / 1000
+        self.directory = directory or settings.PROFILING_DIR
+        self._active = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def should_sample(self) -> bool:
+        """Random PROFILING_SAMPLE_RATE draw for unflagged requests and jobs"""
+        return settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                profiles = list(self._active)
+
+            frames = sys._current_frames()
+            for profile in profiles:
+                profile.sample(frames)
+
+    def start(self, profile: Profile):
+        with self._lock:
+            self._active.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._thread.start()
+
+    def stop(self, profile: Profile):
+        with self._lock:
+            self._active.discard(profile)
+        profile.duration_ms = (time.perf_counter() - profile.started_at) * 1000
+        self.save(profile)
+
+    def save(self, profile: Profile):
+        """Append a profile's stacks to its route's folded file"""
+        if not profile.stacks:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, re.sub(r"[^\w.-]+", "_", profile.name) + ".folded")
+            # Outside the lock: one append-mode write per profile, so concurrent saves don't mix lines
+            with open(path, "a") as f:
+                f.write(profile.folded())
+            logger.info(
+                f"Profiled {profile.name}: {profile.duration_ms:.0f}ms, "
+                f"{sum(profile.stacks.values())} samples -> {path}"
+            )
+        except OSError as e:
+            logger.error(f"Could not write profile for {profile.name}: {e}")
+
+    @contextmanager
+    def profile(self, name: str, thread_id: Optional[int] = None):
+        profile = Profile(name, thread_id=thread_id)
+        token = current_profile.set(profile)
+        self.start(profile)
+        try:
+            yield profile
+        finally:
+            self.stop(profile)
+            current_profile.reset(token)
+
+# Singleton instance
+profiler = SamplingProfiler()
+
+def profiled(name: str = None):
+    """
+    Profile a sampled fraction of calls of a function on the calling thread.
+    Returns the function unchanged when profiling is disabled, so there is no overhead.
+    """
+    def decorator(func):
+        if not settings.PROFILING_ENABLED:
+            return func
+
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.should_sample():
+                return func(*args, **kwargs)
+            with profiler.profile(label, thread_id=threading.get_ident()):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,91 @@
+import time
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class QueryBudgetExceeded(RuntimeError):
+    """A route or job ran more queries than it declared (raised only with QUERY_BUDGET_STRICT)"""
+
+class QueryStats:
+    """Statements executed during one request or consumer message"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float):
+        with self._lock:
+            self.count += 1
+            self.duration_ms += duration_ms
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int = None) -> List[Tuple[str, int]]:
+        """Identical statements (same SQL, any parameters) run at least `threshold` times: likely N+1 loads"""
+        threshold = threshold or settings.QUERY_N_PLUS_ONE_THRESHOLD
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+@contextmanager
+def track_queries():
+    """Count and time every statement run in this context (threadpool calls inherit it)"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - started_at) * 1000)
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute: drop its start time so the
+    # connection's stack stays balanced when it goes back to the pool
+    if context.connection is not None and context.execution_context is not None:
+        started = context.connection.info.get("query_started_at")
+        if started:
+            started.pop()
+
+def instrument_queries():
+    """Attach the statement counters to every engine (no-op unless QUERY_STATS_ENABLED)"""
+    if not settings.QUERY_STATS_ENABLED or event.contains(Engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    logger.info("Query statistics enabled")
+
+def query_budget(max_queries: int):
+    """Declare the most queries a route may run, including authentication"""
+    def decorator(func):
+        func.query_budget = max_queries
+        return func
+    return decorator
+
+def check_queries(name: str, stats: QueryStats, budget: Optional[int] = None):
+    """Log N+1 patterns and budget overruns for a finished request or job; raise on overruns in strict mode"""
+    for statement, count in stats.repeated():
+        logger.warning(f"Possible N+1 in {name}: {count}x {' '.join(statement.split())[:200]}")
+
+    if budget is not None and stats.count > budget:
+        message = f"{name} ran {stats.count} queries, budget is {budget}"
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
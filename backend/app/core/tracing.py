@@ -0,0 +1,56 @@
+import logging
+from typing import Iterable, List, Optional, Tuple
+from opentelemetry import trace, propagate
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Proxy tracer: a no-op until setup_tracing installs a real provider
+tracer = trace.get_tracer("job-tracker")
+
+def setup_tracing(service_name: str, app=None, engines: Iterable = ()):
+    """Install the tracer provider, exporters and library instrumentation when tracing is enabled"""
+    if not settings.TRACING_ENABLED:
+        return
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+
+    if settings.TRACING_OTLP_ENDPOINT:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)))
+
+    if settings.TRACING_FILE:
+        # One JSON span per line, easy to grep or load into a notebook
+        span_file = open(settings.TRACING_FILE, "a")
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(
+            out=span_file,
+            formatter=lambda span: span.to_json(indent=None) + "\n"
+        )))
+
+    trace.set_tracer_provider(provider)
+
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    RedisInstrumentor().instrument()
+    for engine in engines:
+        SQLAlchemyInstrumentor().instrument(engine=engine)
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        FastAPIInstrumentor.instrument_app(app)
+
+    logger.info(f"Tracing enabled for {service_name}")
+
+def inject_headers() -> List[Tuple[str, bytes]]:
+    """Current trace context as Kafka message headers"""
+    carrier = {}
+    propagate.inject(carrier)
+    return [(key, value.encode("utf-8")) for key, value in carrier.items()]
+
+def extract_context(headers: Optional[Iterable[Tuple[str, bytes]]]) -> Context:
+    """Trace context carried in Kafka message headers"""
+    carrier = {key: value.decode("utf-8") for key, value in headers or [] if value is not None}
+    return propagate.extract(carrier)
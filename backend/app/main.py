@@ -1,9 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
-from app.api.v1 import auth, applications, resumes
+from app.core.database import engine, replica_engine
+from app.core.tracing import setup_tracing
+from app.core.query_stats import instrument_queries
+from app.api.rate_limit import RateLimitMiddleware
+from app.api.profiling import ProfilingMiddleware, bind_endpoint_threads
+from app.api.query_stats import QueryStatsMiddleware
+from app.api.v1 import auth, applications, resumes, analytics, sync, interactions, reminders
 
-app = FastAPI(title=settings.APP_NAME)
+app = FastAPI(title=settings.APP_NAME, default_response_class=ORJSONResponse)
+
+# SQL statement counts, N+1 warnings and query budgets
+if settings.QUERY_STATS_ENABLED:
+    instrument_queries()
+    app.add_middleware(QueryStatsMiddleware)
+
+# Sampling profiler (inside rate limiting, so it times the route and not the limiter)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Per-user rate limits and analysis load shedding
+# (added first so it runs inside CORS and 429s still carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
 
 # CORS
 app.add_middleware(
@@ -14,10 +35,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses for clients that send Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
+# Tracing (no-op unless TRACING_ENABLED)
+setup_tracing("job-tracker-api", app=app, engines=[e for e in (engine, replica_engine) if e is not None])
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(applications.router, prefix="/api/v1")
 app.include_router(resumes.router, prefix="/api/v1")
+app.include_router(analytics.router, prefix="/api/v1")
+app.include_router(sync.router, prefix="/api/v1")
+app.include_router(interactions.router, prefix="/api/v1")
+app.include_router(reminders.router, prefix="/api/v1")
 
 @app.get("/")
 def read_root():
@@ -30,4 +61,8 @@ def health_check():
         "database": "connected",
         "redis": "connected",
         "kafka": "connected"
-    }
\ No newline at end of file
+    }
+
+# Profiled requests sample only the thread running their endpoint
+if settings.PROFILING_ENABLED:
+    bind_endpoint_threads(app)
@@ -3,6 +3,12 @@ from app.models.resume import Resume
 from app.models.application import Application, ApplicationStatus
 from app.models.ai_analysis import AIAnalysis, AnalysisStatus
 from app.models.interaction import Interaction, InteractionType
+from app.models.analysis_result import AnalysisResult
+from app.models.archived_application import ArchivedApplication
+from app.models.application_status_event import ApplicationStatusEvent
+from app.models.change_log import ChangeLogEntry
+from app.models.purge_job import PurgeJob, PurgeStatus
+from app.models.reminder import Reminder, ReminderKind, ReminderStatus
 
 __all__ = [
     "User",
@@ -12,5 +18,14 @@ __all__ = [
     "AIAnalysis",
     "AnalysisStatus",
     "Interaction",
-    "InteractionType"
+    "InteractionType",
+    "AnalysisResult",
+    "ArchivedApplication",
+    "ApplicationStatusEvent",
+    "ChangeLogEntry",
+    "PurgeJob",
+    "PurgeStatus",
+    "Reminder",
+    "ReminderKind",
+    "ReminderStatus"
 ]
\ No newline at end of file
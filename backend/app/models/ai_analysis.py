@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Integer, Float, DateTime, ForeignKey, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -13,19 +13,26 @@ class AnalysisStatus(enum.Enum):
 
 class AIAnalysis(Base):
     __tablename__ = "ai_analyses"
+    __table_args__ = (
+        # One analysis version per (application, resume) pair
+        UniqueConstraint("application_id", "resume_id", name="uq_ai_analyses_application_resume"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=True)  # Changed to nullable=True
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, index=True)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=True, index=True)  # Changed to nullable=True
     match_score = Column(Integer, nullable=True)
     matching_skills = Column(JSONB, nullable=True)
     missing_skills = Column(JSONB, nullable=True)
     suggestions = Column(Text, nullable=True)
     analysis_status = Column(SQLEnum(AnalysisStatus), default=AnalysisStatus.pending)
     error_message = Column(Text, nullable=True)
+    model_used = Column(String, nullable=True)
+    latency_ms = Column(Integer, nullable=True)
+    cost_usd = Column(Float, nullable=True)
     analyzed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
-    application = relationship("Application", back_populates="ai_analysis")
+    application = relationship("Application", back_populates="ai_analyses")
     resume = relationship("Resume", back_populates="ai_analyses")
\ No newline at end of file
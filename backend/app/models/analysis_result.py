@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import uuid
+from app.core.database import Base
+
+class AnalysisResult(Base):
+    """Content-addressed store of model outputs, shared by every application with the same inputs"""
+    __tablename__ = "analysis_results"
+    __table_args__ = (
+        UniqueConstraint("resume_hash", "job_hash", "prompt_version", "model", name="uq_analysis_results_key"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resume_hash = Column(String(64), nullable=False)
+    job_hash = Column(String(64), nullable=False)  # description, title and company (see job_hash())
+    prompt_version = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    result = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
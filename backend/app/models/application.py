@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Integer, Date, DateTime, ForeignKey, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -28,10 +28,14 @@ class Application(Base):
     date_applied = Column(Date, nullable=False, index=True)
     status = Column(SQLEnum(ApplicationStatus), default=ApplicationStatus.applied, index=True)
     notes = Column(Text, nullable=True)
+    best_resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True, index=True)
+    best_resume_score = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    deleted_at = Column(DateTime, nullable=True)  # soft-deleted, waiting for the purge worker
     
     # Relationships
     user = relationship("User", back_populates="applications")
-    ai_analysis = relationship("AIAnalysis", back_populates="application", uselist=False)
+    best_resume = relationship("Resume", foreign_keys=[best_resume_id])
+    ai_analyses = relationship("AIAnalysis", back_populates="application", order_by="AIAnalysis.created_at.desc()")
     interactions = relationship("Interaction", back_populates="application", cascade="all, delete-orphan")
\ No newline at end of file
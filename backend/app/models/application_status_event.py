@@ -0,0 +1,24 @@
+from sqlalchemy import Column, BigInteger, DateTime, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from app.core.database import Base
+from app.models.application import ApplicationStatus
+
+class ApplicationStatusEvent(Base):
+    """
+    Append-only log of application status changes, written in the same transaction as the change.
+    Deliberately not a foreign key to applications: archival moves applications out of that
+    table and their history has to stay.
+    """
+    __tablename__ = "application_status_events"
+    __table_args__ = (
+        Index("ix_application_status_events_user_id_changed_at", "user_id", "changed_at"),
+        Index("ix_application_status_events_application_id_changed_at", "application_id", "changed_at"),
+    )
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    application_id = Column(UUID(as_uuid=True), nullable=False)
+    from_status = Column(SQLEnum(ApplicationStatus), nullable=True)  # None for the initial status
+    to_status = Column(SQLEnum(ApplicationStatus), nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Text, Integer, Date, DateTime, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+from app.core.database import Base
+from app.models.application import ApplicationStatus
+
+class ArchivedApplication(Base):
+    """
+    Closed applications moved out of the hot `applications` table.
+    Range-partitioned by date_applied (one partition per year, created by the archiver),
+    with child interactions and analyses kept as JSONB so the row can be restored.
+    """
+    __tablename__ = "applications_archive"
+    __table_args__ = (
+        Index("ix_applications_archive_user_id_date_applied", "user_id", "date_applied"),
+        {"postgresql_partition_by": "RANGE (date_applied)"},
+    )
+    
+    # The partition key has to be part of the primary key
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    date_applied = Column(Date, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    company_name = Column(String, nullable=False)
+    job_title = Column(String, nullable=False)
+    job_url = Column(String, nullable=True)
+    job_description = Column(Text, nullable=True)
+    location = Column(String, nullable=True)
+    salary_range = Column(String, nullable=True)
+    status = Column(SQLEnum(ApplicationStatus), nullable=True)
+    notes = Column(Text, nullable=True)
+    best_resume_id = Column(UUID(as_uuid=True), nullable=True)
+    best_resume_score = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    interactions = Column(JSONB, nullable=False, server_default="[]")
+    ai_analyses = Column(JSONB, nullable=False, server_default="[]")
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class ChangeLogEntry(Base):
+    """
+    One row per insert/update/delete of a synced entity, written by database triggers
+    (see the add_change_log migration) so every write path is covered, including FK cascades.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_user_id_txid_id", "user_id", "txid", "id"),
+        Index("ix_change_log_changed_at", "changed_at"),  # retention pruning
+    )
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # Writing transaction: sync only hands out entries from transactions that have finished
+    txid = Column(BigInteger, nullable=False, server_default=text("pg_current_xact_id()::text::bigint"))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity_type = Column(String(20), nullable=False)  # application, analysis, resume, interaction
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(String(10), nullable=False)  # upsert or delete
+    changed_at = Column(DateTime, nullable=False, server_default=text("(now() AT TIME ZONE 'utc')"))
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+import enum
+from app.core.database import Base
+
+class PurgeStatus(enum.Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+class PurgeJob(Base):
+    """Removal of a soft-deleted user, application or resume and everything under it, in batches"""
+    __tablename__ = "purge_jobs"
+    __table_args__ = (
+        Index("ix_purge_jobs_status_created_at", "status", "created_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    entity_type = Column(String(20), nullable=False)  # user, application, resume
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=False)  # no FK: purging a user removes the user row
+    status = Column(SQLEnum(PurgeStatus), nullable=False, default=PurgeStatus.pending)
+    current_step = Column(String, nullable=True)  # table being purged
+    processed_rows = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")  # failed runs so far
+    next_attempt_at = Column(DateTime, nullable=True)  # retry backoff: not claimed before this
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint, text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+import enum
+from app.core.database import Base
+
+class ReminderKind(enum.Enum):
+    stale_application = "stale_application"  # no progress in applied/screening for too long
+    follow_up = "follow_up"  # interviewed and no follow_up_email logged yet
+
+class ReminderStatus(enum.Enum):
+    pending = "pending"
+    due = "due"
+    dismissed = "dismissed"
+
+class Reminder(Base):
+    """
+    Follow-up reminder for an application, at most one per kind. Kept up to date on status
+    changes and interaction inserts; the reminder worker flips pending rows to due once
+    due_at passes, reading only the partial index over pending rows.
+    """
+    __tablename__ = "reminders"
+    __table_args__ = (
+        UniqueConstraint("application_id", "kind", name="uq_reminders_application_id_kind"),
+        Index("ix_reminders_pending_due_at", "due_at", postgresql_where=text("status = 'pending'")),
+        Index("ix_reminders_user_id_status_due_at", "user_id", "status", "due_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(SQLEnum(ReminderKind), nullable=False)
+    status = Column(SQLEnum(ReminderStatus), nullable=False, default=ReminderStatus.pending)
+    due_at = Column(DateTime, nullable=False)
+    fired_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -7,16 +7,23 @@ from app.core.database import Base
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # At most one active resume per user
+        Index("uq_resumes_one_active_per_user", "user_id", unique=True, postgresql_where=text("is_active")),
+        Index("ix_resumes_user_id_file_hash", "user_id", "file_hash"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     parsed_skills = Column(JSONB, nullable=True)
     file_url = Column(String, nullable=True)
+    file_hash = Column(String(64), nullable=True)  # SHA-256 of the uploaded file
     is_active = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    deleted_at = Column(DateTime, nullable=True)  # soft-deleted, waiting for the purge worker
     
     # Relationships
-    user = relationship("User", back_populates="resumes")
+    user = relationship("User", back_populates="resumes", foreign_keys=[user_id])
     ai_analyses = relationship("AIAnalysis", back_populates="resume")
\ No newline at end of file
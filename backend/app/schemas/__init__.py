@@ -13,10 +13,16 @@ from app.schemas.resume import (
 )
 from app.schemas.application import (
     ApplicationCreate,
+    ApplicationBulkItem,
+    ApplicationBulkCreate,
     ApplicationUpdate,
     ApplicationStatusUpdate,
     ApplicationResponse,
-    ApplicationListResponse
+    ApplicationListResponse,
+    ResumeFit,
+    BestResumeResponse,
+    BulkCreateResult,
+    ApplicationBulkResponse
 )
 from app.schemas.ai_analysis import AIAnalysisResponse
 from app.schemas.interaction import (
@@ -27,8 +33,14 @@ from app.schemas.interaction import (
 from app.schemas.analytics import (
     AnalyticsSummary,
     ApplicationTrend,
-    InsightResponse
+    InsightResponse,
+    FunnelStage,
+    StageConversion,
+    StageDuration
 )
+from app.schemas.sync import SyncTombstones, SyncResponse
+from app.schemas.purge_job import PurgeJobResponse
+from app.schemas.reminder import ReminderResponse
 
 __all__ = [
     # User
@@ -44,10 +56,16 @@ __all__ = [
     "ResumeListResponse",
     # Application
     "ApplicationCreate",
+    "ApplicationBulkItem",
+    "ApplicationBulkCreate",
     "ApplicationUpdate",
     "ApplicationStatusUpdate",
     "ApplicationResponse",
     "ApplicationListResponse",
+    "ResumeFit",
+    "BestResumeResponse",
+    "BulkCreateResult",
+    "ApplicationBulkResponse",
     # AI Analysis
     "AIAnalysisResponse",
     # Interaction
@@ -58,4 +76,14 @@ __all__ = [
     "AnalyticsSummary",
     "ApplicationTrend",
     "InsightResponse",
+    "FunnelStage",
+    "StageConversion",
+    "StageDuration",
+    # Sync
+    "SyncTombstones",
+    "SyncResponse",
+    # Purge
+    "PurgeJobResponse",
+    # Reminders
+    "ReminderResponse",
 ]
\ No newline at end of file
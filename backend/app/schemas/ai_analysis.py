@@ -7,15 +7,19 @@ from app.models.ai_analysis import AnalysisStatus
 class AIAnalysisResponse(BaseModel):
     id: UUID
     application_id: UUID
-    resume_id: UUID
+    resume_id: UUID | None
     match_score: int | None
     matching_skills: dict | None
     missing_skills: dict | None
     suggestions: str | None
     analysis_status: AnalysisStatus
     error_message: str | None
+    model_used: str | None = None
+    latency_ms: int | None = None
+    cost_usd: float | None = None
     analyzed_at: datetime | None
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+        protected_namespaces = ()
\ No newline at end of file
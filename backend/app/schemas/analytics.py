@@ -16,4 +16,22 @@ class ApplicationTrend(BaseModel):
 class InsightResponse(BaseModel):
     insight_type: str
     message: str
-    data: dict | None = None
\ No newline at end of file
+    data: dict | None = None
+
+class FunnelStage(BaseModel):
+    status: ApplicationStatus
+    reached: int
+    conversion_rate: float | None  # share of the previous stage that got this far
+
+class StageConversion(BaseModel):
+    from_status: ApplicationStatus
+    to_status: ApplicationStatus | None  # None: still in from_status
+    applications: int
+    rate: float
+
+class StageDuration(BaseModel):
+    status: ApplicationStatus
+    entered: int
+    exited: int
+    avg_days: float | None
+    median_days: float | None
@@ -14,6 +14,12 @@ class ApplicationCreate(BaseModel):
     date_applied: date
     notes: str | None = None
 
+class ApplicationBulkItem(ApplicationCreate):
+    client_id: str  # generated by the client to match results to its queued items
+
+class ApplicationBulkCreate(BaseModel):
+    items: list[ApplicationBulkItem]
+
 class ApplicationUpdate(BaseModel):
     company_name: str | None = None
     job_title: str | None = None
@@ -41,12 +47,31 @@ class ApplicationResponse(BaseModel):
     date_applied: date
     status: ApplicationStatus
     notes: str | None
+    best_resume_id: UUID | None = None
+    best_resume_score: int | None = None
     created_at: datetime
     updated_at: datetime
     
     class Config:
         from_attributes = True
 
+class ResumeFit(BaseModel):
+    resume_id: UUID
+    fit_score: float
+
+class BestResumeResponse(BaseModel):
+    application_id: UUID
+    candidates: list[ResumeFit]
+    queued: bool
+
+class BulkCreateResult(BaseModel):
+    client_id: str
+    application_id: UUID
+    created: bool  # False when the posting was already saved
+
+class ApplicationBulkResponse(BaseModel):
+    results: list[BulkCreateResult]
+
 class ApplicationListResponse(BaseModel):
     id: UUID
     company_name: str
@@ -54,6 +79,11 @@ class ApplicationListResponse(BaseModel):
     location: str | None
     date_applied: date
     status: ApplicationStatus
+    fit_score: float | None = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Field names for the fast serialization path and `?fields=` sparse fieldsets
+APPLICATION_FIELDS = list(ApplicationResponse.model_fields)
+APPLICATION_LIST_FIELDS = [field for field in ApplicationListResponse.model_fields if field != "fit_score"]
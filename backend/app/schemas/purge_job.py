@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from app.models.purge_job import PurgeStatus
+
+class PurgeJobResponse(BaseModel):
+    id: UUID
+    entity_type: str
+    entity_id: UUID
+    status: PurgeStatus
+    current_step: str | None
+    processed_rows: int
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
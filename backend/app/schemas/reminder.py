@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from app.models.application import ApplicationStatus
+from app.models.reminder import ReminderKind, ReminderStatus
+
+class ReminderResponse(BaseModel):
+    id: UUID
+    application_id: UUID
+    kind: ReminderKind
+    status: ReminderStatus
+    due_at: datetime
+    fired_at: datetime | None
+    company_name: str
+    job_title: str
+    application_status: ApplicationStatus
+    
+    class Config:
+        from_attributes = True
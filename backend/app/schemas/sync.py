@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from uuid import UUID
+from app.schemas.application import ApplicationResponse
+from app.schemas.ai_analysis import AIAnalysisResponse
+from app.schemas.resume import ResumeListResponse
+from app.schemas.interaction import InteractionResponse
+
+class SyncTombstones(BaseModel):
+    applications: list[UUID] = []
+    analyses: list[UUID] = []
+    resumes: list[UUID] = []
+    interactions: list[UUID] = []
+
+class SyncResponse(BaseModel):
+    cursor: str  # opaque; pass back as ?since=
+    has_more: bool  # call again straight away with the new cursor
+    full: bool  # True: this is a complete snapshot, replace the local copy
+    applications: list[ApplicationResponse] = []
+    analyses: list[AIAnalysisResponse] = []
+    resumes: list[ResumeListResponse] = []
+    interactions: list[InteractionResponse] = []
+    deleted: SyncTombstones = SyncTombstones()
@@ -0,0 +1,132 @@
+import time
+import logging
+from app.core.config import settings
+from app.core.tracing import tracer
+from app.services import local_scorer
+from app.services.gemini_service import gemini_service
+from app.services.analysis_result_store import analysis_result_store
+
+logger = logging.getLogger(__name__)
+
+TIER_LOCAL = "local"
+TIER_FAST = "fast"
+TIER_DETAILED = "detailed"
+
+class AnalysisCascade:
+    """
+    Tiered analysis: local keyword scorer -> fast Gemini model -> detailed Gemini model.
+    Each tier only hands off to the next one when its answer is not good enough.
+    """
+
+    def __init__(self):
+        self.tier_models = {
+            TIER_LOCAL: "local-keyword",
+            TIER_FAST: settings.GEMINI_FAST_MODEL,
+            TIER_DETAILED: settings.GEMINI_DETAILED_MODEL,
+        }
+        self.tier_costs = {
+            TIER_LOCAL: 0.0,
+            TIER_FAST: settings.GEMINI_FAST_COST_PER_1K_TOKENS,
+            TIER_DETAILED: settings.GEMINI_DETAILED_COST_PER_1K_TOKENS,
+        }
+
+    def analyze(self, resume_text: str, job_description: str, job_title: str, company_name: str, detailed: bool = False) -> dict:
+        """
+        Run the cascade and return the final tier's result, annotated with
+        `tier`, `model_used`, `latency_ms`, `cost_usd` and a per-tier `tiers` trace.
+        `detailed=True` skips straight to the detailed model.
+        """
+        trace = []
+
+        if not detailed:
+            result = self._run_tier(TIER_LOCAL, trace, lambda: local_scorer.score(resume_text, job_description))
+            if self._local_is_decisive(result):
+                return self._finish(result, trace)
+
+            result = self._run_model_tier(TIER_FAST, trace, resume_text, job_description, job_title, company_name)
+            if self._fast_is_decisive(result):
+                return self._finish(result, trace)
+
+        result = self._run_model_tier(TIER_DETAILED, trace, resume_text, job_description, job_title, company_name)
+        return self._finish(result, trace)
+
+    def _run_model_tier(self, tier: str, trace: list, resume_text: str, job_description: str, job_title: str, company_name: str) -> dict:
+        """Run an LLM tier, serving identical inputs from the durable result store"""
+        model = self.tier_models[tier]
+        stored = analysis_result_store.get(resume_text, job_description, job_title, company_name, model)
+        if stored:
+            trace.append({
+                "tier": tier,
+                "model": model,
+                "latency_ms": 0,
+                "cost_usd": 0.0,
+                "match_score": stored.get("match_score"),
+                "confidence": stored.get("confidence"),
+                "cached": True,
+            })
+            return dict(stored)
+
+        result = self._run_tier(tier, trace, lambda: gemini_service.analyze_application(
+            resume_text=resume_text,
+            job_description=job_description,
+            job_title=job_title,
+            company_name=company_name,
+            model_name=model
+        ))
+        if not result.get("error"):
+            analysis_result_store.put(resume_text, job_description, job_title, company_name, model, result)
+        return result
+
+    def _run_tier(self, tier: str, trace: list, run) -> dict:
+        with tracer.start_as_current_span(f"cascade.{tier}") as span:
+            span.set_attribute("cascade.model", self.tier_models[tier])
+            start = time.perf_counter()
+            result = run()
+            latency_ms = int((time.perf_counter() - start) * 1000)
+        cost_usd = result.pop("tokens", 0) / 1000 * self.tier_costs[tier]
+
+        trace.append({
+            "tier": tier,
+            "model": self.tier_models[tier],
+            "latency_ms": latency_ms,
+            "cost_usd": cost_usd,
+            "match_score": result.get("match_score"),
+            "confidence": result.get("confidence"),
+        })
+        return result
+
+    def _local_is_decisive(self, result: dict) -> bool:
+        """Clear mismatch or clear match on a job description with enough recognisable skills"""
+        if result.get("confidence", 0) < settings.CASCADE_LOCAL_MIN_CONFIDENCE:
+            return False
+        if result.get("similarity", 1.0) < settings.CASCADE_LOCAL_MIN_SIMILARITY:
+            # Texts share almost no vocabulary: unrelated role
+            return True
+        score = result.get("match_score", 0)
+        return score <= settings.CASCADE_LOCAL_REJECT_BELOW or score >= settings.CASCADE_LOCAL_ACCEPT_ABOVE
+
+    def _fast_is_decisive(self, result: dict) -> bool:
+        """Confident answer that is not sitting on the decision boundary"""
+        if result.get("error"):
+            return False
+        if (result.get("confidence") or 0) < settings.CASCADE_MIN_CONFIDENCE:
+            return False
+        score = result.get("match_score") or 0
+        return abs(score - settings.CASCADE_DECISION_BOUNDARY) > settings.CASCADE_BOUNDARY_MARGIN
+
+    def _finish(self, result: dict, trace: list) -> dict:
+        final = trace[-1]
+        result["tier"] = final["tier"]
+        result["model_used"] = final["model"]
+        result["latency_ms"] = sum(step["latency_ms"] for step in trace)
+        result["cost_usd"] = sum(step["cost_usd"] for step in trace)
+        result["tiers"] = trace
+
+        logger.info(
+            f"Cascade finished at tier {final['tier']} ({final['model']}) "
+            f"in {result['latency_ms']}ms, ${result['cost_usd']:.6f}"
+        )
+        return result
+
+# Singleton instance
+analysis_cascade = AnalysisCascade()
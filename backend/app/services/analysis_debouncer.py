@@ -0,0 +1,62 @@
+import time
+import logging
+from app.core.config import settings
+from app.services.kafka_producer import kafka_producer
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Application fields that feed the AI analysis prompt
+ANALYSIS_FIELDS = ("company_name", "job_title", "job_description")
+
+class AnalysisDebouncer:
+    """
+    Coalesces repeated application edits into one application-updated event.
+    Each edit (re)schedules the application in a Redis sorted set keyed by due time,
+    so only the last edit inside the debounce window is published.
+    """
+
+    def __init__(self, queue: str = "analysis_debounce", window_seconds: int = None):
+        self.queue = queue
+        self.window_seconds = (
+            window_seconds if window_seconds is not None
+            else settings.ANALYSIS_UPDATE_DEBOUNCE_SECONDS
+        )
+
+    def schedule(self, application_id: str, user_id: str) -> bool:
+        """Schedule (or push back) re-analysis of an edited application"""
+        due_at = time.time() + self.window_seconds
+        if redis_service.schedule_due(self.queue, {f"{user_id}:{application_id}": due_at}):
+            return True
+
+        # Redis unavailable: publish straight away rather than lose the update
+        logger.warning(f"Debounce unavailable, publishing update for {application_id} immediately")
+        return self.publish(application_id, user_id)
+
+    def publish(self, application_id: str, user_id: str) -> bool:
+        """Publish the application-updated event"""
+        return kafka_producer.publish_event(settings.ANALYSIS_UPDATED_TOPIC, {
+            "application_id": application_id,
+            "user_id": user_id,
+            "event_type": "application_updated"
+        })
+
+    def flush_due(self, now: float = None, limit: int = 100) -> int:
+        """Publish every application whose debounce window has elapsed; failed publishes are retried a window later"""
+        now = now or time.time()
+        due = redis_service.pop_due(self.queue, now, limit)
+        failed = {}
+        published = 0
+        for member in due:
+            user_id, application_id = member.split(":", 1)
+            if self.publish(application_id, user_id):
+                published += 1
+            else:
+                failed[member] = now + self.window_seconds
+        if failed:
+            # Kafka unavailable: put the edits back instead of dropping them
+            redis_service.schedule_due(self.queue, failed)
+        return published
+
+# Singleton instance
+analysis_debouncer = AnalysisDebouncer()
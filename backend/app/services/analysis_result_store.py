@@ -0,0 +1,113 @@
+import hashlib
+import logging
+from typing import Optional
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.core.tracing import tracer
+from app.core.database import SessionLocal
+from app.models.analysis_result import AnalysisResult
+from app.services.gemini_service import PROMPT_VERSION
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+def content_hash(text: str) -> str:
+    """SHA-256 of text, used to address stored results by content"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def job_hash(job_description: str, job_title: str, company_name: str) -> str:
+    """Hash of every job-side input of the analysis prompt, so editing any of them misses the store"""
+    return content_hash("\x1f".join((job_description, job_title or "", company_name or "")))
+
+class AnalysisResultStore:
+    """
+    Durable, content-addressed analysis results keyed by (resume hash, job hash,
+    prompt version, model), where the job hash covers description, title and company.
+    Postgres is the source of truth; Redis is a hot tier in front of it.
+    """
+
+    def __init__(self, prompt_version: str = PROMPT_VERSION):
+        self.prompt_version = prompt_version
+        self.cache_ttl = settings.ANALYSIS_RESULT_CACHE_TTL_SECONDS
+
+    def result_key(self, resume_hash: str, job_hash: str, model: str) -> str:
+        return f"{resume_hash}:{job_hash}:{self.prompt_version}:{model}"
+
+    @tracer.start_as_current_span("result_store.get")
+    def get(self, resume_text: str, job_description: str, job_title: str, company_name: str, model: str) -> Optional[dict]:
+        """Look up a stored result, promoting Postgres hits into Redis"""
+        resume_hash = content_hash(resume_text)
+        job_key = job_hash(job_description, job_title, company_name)
+        key = self.result_key(resume_hash, job_key, model)
+
+        cached = redis_service.get_cached_ai_analysis(key)
+        if cached:
+            return cached
+
+        db = SessionLocal()
+        try:
+            row = db.query(AnalysisResult.result).filter(
+                AnalysisResult.resume_hash == resume_hash,
+                AnalysisResult.job_hash == job_key,
+                AnalysisResult.prompt_version == self.prompt_version,
+                AnalysisResult.model == model
+            ).first()
+        finally:
+            db.close()
+
+        if not row:
+            return None
+
+        logger.info(f"Result store HIT for {key}")
+        redis_service.cache_ai_analysis(key, row.result, self.cache_ttl)
+        return row.result
+
+    @tracer.start_as_current_span("result_store.put")
+    def put(self, resume_text: str, job_description: str, job_title: str, company_name: str, model: str, result: dict):
+        """Persist a result and write it through to Redis"""
+        resume_hash = content_hash(resume_text)
+        job_key = job_hash(job_description, job_title, company_name)
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                insert(AnalysisResult)
+                .values(
+                    resume_hash=resume_hash,
+                    job_hash=job_key,
+                    prompt_version=self.prompt_version,
+                    model=model,
+                    result=result
+                )
+                .on_conflict_do_nothing(constraint="uq_analysis_results_key")
+            )
+            db.commit()
+        except Exception as e:
+            logger.error(f"Failed to store analysis result: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        redis_service.cache_ai_analysis(self.result_key(resume_hash, job_key, model), result, self.cache_ttl)
+
+    def warm(self, limit: int = None) -> int:
+        """Load the most recent results for the current prompt version into Redis"""
+        limit = limit or settings.ANALYSIS_RESULT_WARM_LIMIT
+        db = SessionLocal()
+        try:
+            rows = db.query(AnalysisResult).filter(
+                AnalysisResult.prompt_version == self.prompt_version
+            ).order_by(AnalysisResult.created_at.desc()).limit(limit).all()
+        finally:
+            db.close()
+
+        redis_service.cache_ai_analyses({
+            self.result_key(row.resume_hash, row.job_hash, row.model): row.result
+            for row in rows
+        }, self.cache_ttl)
+
+        logger.info(f"Warmed {len(rows)} analysis results into Redis")
+        return len(rows)
+
+# Singleton instance
+analysis_result_store = AnalysisResultStore()
@@ -0,0 +1,180 @@
+import logging
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import ApplicationStatus
+from app.models.archived_application import ArchivedApplication
+
+logger = logging.getLogger(__name__)
+
+# Applications that will not change anymore and can go to cold storage
+CLOSED_STATUSES = [ApplicationStatus.rejected, ApplicationStatus.withdrawn]
+
+# Columns shared by `applications` and `applications_archive`
+_COLUMNS = (
+    "id, user_id, company_name, job_title, job_url, job_description, location, salary_range, "
+    "date_applied, status, notes, best_resume_id, best_resume_score, created_at, updated_at"
+)
+_CLOSED = ", ".join(f"'{status.value}'" for status in CLOSED_STATUSES)
+_COMPRESSED_COLUMNS = ("job_description", "notes", "interactions", "ai_analyses")
+
+# Move one batch in a single statement: delete from the hot table (FK cascades remove the
+# children) and insert into the archive with the children snapshotted as JSONB. Every part
+# of a data-modifying WITH sees the same snapshot, so the children are still visible here.
+ARCHIVE_BATCH_SQL = text(f"""
+    WITH moved AS (
+        DELETE FROM applications
+        WHERE id IN (
+            SELECT id FROM applications
+            WHERE status IN ({_CLOSED}) AND date_applied < :cutoff AND deleted_at IS NULL
+            ORDER BY date_applied
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING {_COLUMNS}
+    )
+    INSERT INTO applications_archive ({_COLUMNS}, interactions, ai_analyses, archived_at)
+    SELECT moved.*,
+        COALESCE((SELECT jsonb_agg(to_jsonb(i)) FROM interactions i WHERE i.application_id = moved.id), '[]'::jsonb),
+        COALESCE((SELECT jsonb_agg(to_jsonb(a)) FROM ai_analyses a WHERE a.application_id = moved.id), '[]'::jsonb),
+        now() AT TIME ZONE 'utc'
+    FROM moved
+""")
+
+OLDEST_CANDIDATE_SQL = text(f"""
+    SELECT min(date_applied) FROM applications
+    WHERE status IN ({_CLOSED}) AND date_applied < :cutoff AND deleted_at IS NULL
+""")
+
+# Reverse of ARCHIVE_BATCH_SQL for one application. Analyses whose resume has since been
+# deleted (or soft-deleted) are dropped, and so is a best_resume_id pointing at one.
+RESTORE_SQL = text(f"""
+    WITH restored AS (
+        DELETE FROM applications_archive
+        WHERE id = :application_id AND user_id = :user_id
+        RETURNING *
+    ),
+    application AS (
+        INSERT INTO applications ({_COLUMNS})
+        SELECT id, user_id, company_name, job_title, job_url, job_description, location, salary_range,
+            date_applied, status, notes,
+            CASE WHEN EXISTS (SELECT 1 FROM resumes WHERE resumes.id = restored.best_resume_id AND resumes.deleted_at IS NULL)
+                THEN best_resume_id END,
+            best_resume_score, created_at, updated_at
+        FROM restored
+        RETURNING id
+    ),
+    interactions_restored AS (
+        INSERT INTO interactions
+        SELECT i.* FROM restored, jsonb_populate_recordset(NULL::interactions, restored.interactions) i
+    ),
+    analyses_restored AS (
+        INSERT INTO ai_analyses
+        SELECT a.* FROM restored, jsonb_populate_recordset(NULL::ai_analyses, restored.ai_analyses) a
+        WHERE a.resume_id IS NULL OR EXISTS (SELECT 1 FROM resumes WHERE resumes.id = a.resume_id AND resumes.deleted_at IS NULL)
+    )
+    SELECT id FROM application
+""")
+
+def months_before(day: date, months: int) -> date:
+    """Same day of the month `months` earlier (clamped to the 28th to stay valid)"""
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    return date(year, month + 1, min(day.day, 28))
+
+class ApplicationArchiver:
+    """
+    Moves closed applications older than ARCHIVE_AFTER_MONTHS from `applications` into the
+    lz4-compressed, yearly-partitioned `applications_archive`, keeping the hot table (and
+    every index scan behind the list endpoint) small.
+    """
+
+    def __init__(self, after_months: int = None, batch_size: int = None):
+        self.after_months = after_months or settings.ARCHIVE_AFTER_MONTHS
+        self.batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+    def cutoff(self, today: date = None) -> date:
+        """Applications dated before this day are eligible for the archive"""
+        return months_before(today or date.today(), self.after_months)
+
+    def reaches_archive(self, date_from: date | None, status_filter: ApplicationStatus | None) -> bool:
+        """Whether a list query's filters can match archived rows"""
+        if status_filter is not None and status_filter not in CLOSED_STATUSES:
+            return False
+        return date_from is None or date_from < self.cutoff()
+
+    def ensure_partition(self, db: Session, year: int):
+        """Create the archive partition for a year if it does not exist yet"""
+        name = f"applications_archive_{year}"
+        if db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+            return
+
+        db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF applications_archive "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01') "
+            f"WITH (toast_tuple_target = 128)"  # push large values into compressed TOAST early
+        ))
+        for column in _COMPRESSED_COLUMNS:
+            db.execute(text(f"ALTER TABLE {name} ALTER COLUMN {column} SET COMPRESSION lz4"))
+        logger.info(f"Created archive partition {name}")
+
+    def archive_batch(self, db: Session, cutoff: date) -> int:
+        """Archive up to batch_size eligible applications in the caller's transaction"""
+        oldest = db.execute(OLDEST_CANDIDATE_SQL, {"cutoff": cutoff}).scalar()
+        if oldest is None:
+            return 0
+
+        for year in range(oldest.year, cutoff.year + 1):
+            self.ensure_partition(db, year)
+
+        # Archived applications stay on sync clients: don't report the move as deletes
+        db.execute(text("SET LOCAL app.skip_change_log = 'on'"))
+        result = db.execute(ARCHIVE_BATCH_SQL, {"cutoff": cutoff, "batch_size": self.batch_size})
+        return result.rowcount
+
+    def run(self) -> int:
+        """Archive every eligible application, one committed batch at a time (worker entrypoint)"""
+        cutoff = self.cutoff()
+        archived = 0
+        db = SessionLocal()
+        try:
+            while True:
+                moved = self.archive_batch(db, cutoff)
+                db.commit()
+                archived += moved
+                if moved < self.batch_size:
+                    break
+        except Exception as e:
+            logger.error(f"Archival failed after {archived} applications: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        logger.info(f"Archived {archived} applications dated before {cutoff}")
+        return archived
+
+    def find(self, db: Session, application_id, user_id) -> ArchivedApplication | None:
+        """Look up an archived application owned by user_id"""
+        return db.query(ArchivedApplication).filter(
+            ArchivedApplication.id == application_id,
+            ArchivedApplication.user_id == user_id
+        ).first()
+
+    def restore(self, db: Session, application_id, user_id) -> bool:
+        """Move an archived application (with its interactions and analyses) back, in the caller's transaction"""
+        restored = db.execute(RESTORE_SQL, {"application_id": application_id, "user_id": user_id}).first()
+        if restored:
+            logger.info(f"Restored application {application_id} from the archive")
+        return restored is not None
+
+    def delete(self, db: Session, application_id, user_id) -> bool:
+        """Delete an archived application, in the caller's transaction"""
+        deleted = db.query(ArchivedApplication).filter(
+            ArchivedApplication.id == application_id,
+            ArchivedApplication.user_id == user_id
+        ).delete(synchronize_session=False)
+        return deleted > 0
+
+# Singleton instance
+application_archiver = ApplicationArchiver()
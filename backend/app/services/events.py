@@ -0,0 +1,18 @@
+import json
+import msgpack
+
+# v1: JSON payloads (full application fields); v2: msgpack payloads carrying only IDs and hashes
+EVENT_SCHEMA_VERSION = 2
+
+def encode_event(event: dict) -> bytes:
+    """Serialize an event with the current schema version"""
+    return msgpack.packb({"v": EVENT_SCHEMA_VERSION, **event}, use_bin_type=True)
+
+def decode_event(raw: bytes) -> dict:
+    """Deserialize an event of any supported schema version"""
+    if raw[:1] == b"{":
+        # v1 events were plain JSON objects without a version field
+        event = json.loads(raw.decode('utf-8'))
+        event.setdefault("v", 1)
+        return event
+    return msgpack.unpackb(raw, raw=False)
@@ -7,15 +7,31 @@ logger = logging.getLogger(__name__)
 # Configure Gemini
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Bump whenever the prompt or its output format changes so stored results are not reused
+PROMPT_VERSION = "v2"
+
 class GeminiService:
     def __init__(self):
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.default_model_name = settings.GEMINI_DETAILED_MODEL
+        self._models = {}
+    
+    def get_model(self, model_name: str) -> genai.GenerativeModel:
+        """Return a (cached) client for the given Gemini model"""
+        if model_name not in self._models:
+            self._models[model_name] = genai.GenerativeModel(model_name)
+        return self._models[model_name]
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Rough token estimate (~4 characters per token) used for cost tracking"""
+        return max(1, len(text) // 4)
     
-    def analyze_application(self, resume_text: str, job_description: str, job_title: str, company_name: str) -> dict:
+    def analyze_application(self, resume_text: str, job_description: str, job_title: str, company_name: str, model_name: str | None = None) -> dict:
         """
         Analyze resume against job description using Gemini
-        Returns: {match_score, matching_skills, missing_skills, suggestions}
+        Returns: {match_score, matching_skills, missing_skills, suggestions, confidence, tokens}
         """
+        model_name = model_name or self.default_model_name
         prompt = f"""
 You are an expert career advisor. Analyze this resume against the job description and provide insights.
 
@@ -33,14 +49,15 @@ Provide your analysis in this EXACT JSON format (no markdown, just raw JSON):
   "match_score": <number between 0-100>,
   "matching_skills": ["skill1", "skill2", "skill3"],
   "missing_skills": ["skill1", "skill2", "skill3"],
-  "suggestions": "Brief paragraph with 3-4 specific actionable suggestions to improve the resume for this role."
+  "suggestions": "Brief paragraph with 3-4 specific actionable suggestions to improve the resume for this role.",
+  "confidence": <number between 0 and 1 describing how certain you are about the match_score>
 }}
 
 Be specific and practical. Focus on technical skills, experience alignment, and resume improvements.
 """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = self.get_model(model_name).generate_content(prompt)
             result_text = response.text.strip()
             
             # Remove markdown code blocks if present
@@ -56,8 +73,9 @@ Be specific and practical. Focus on technical skills, experience alignment, and
             # Parse JSON
             import json
             analysis = json.loads(result_text)
+            analysis["tokens"] = self.estimate_tokens(prompt) + self.estimate_tokens(response.text)
             
-            logger.info(f"AI analysis completed for {company_name} - {job_title}")
+            logger.info(f"AI analysis completed for {company_name} - {job_title} ({model_name})")
             return analysis
             
         except Exception as e:
@@ -66,7 +84,10 @@ Be specific and practical. Focus on technical skills, experience alignment, and
                 "match_score": 0,
                 "matching_skills": [],
                 "missing_skills": [],
-                "suggestions": f"Analysis failed: {str(e)}"
+                "suggestions": f"Analysis failed: {str(e)}",
+                "confidence": 0.0,
+                "tokens": self.estimate_tokens(prompt),
+                "error": str(e)
             }
 
 gemini_service = GeminiService()
\ No newline at end of file
@@ -0,0 +1,239 @@
+import re
+import json
+import socket
+import asyncio
+import logging
+import ipaddress
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit
+import httpx
+import httpcore
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class _TextExtractor(HTMLParser):
+    """Readable text of an HTML document, plus the raw JSON-LD blocks it embeds"""
+
+    SKIPPED = {"script", "style", "noscript", "template", "svg", "nav", "header", "footer", "form", "button"}
+    BLOCKS = {"p", "div", "li", "ul", "ol", "br", "tr", "section", "article", "h1", "h2", "h3", "h4", "h5", "h6"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.json_ld: List[str] = []
+        self._skip_depth = 0
+        self._json_ld_parts: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script" and ("type", "application/ld+json") in attrs:
+            self._json_ld_parts = []
+        if tag in self.SKIPPED:
+            self._skip_depth += 1
+        if tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._json_ld_parts is not None:
+            self.json_ld.append("".join(self._json_ld_parts))
+            self._json_ld_parts = None
+        if tag in self.SKIPPED:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        if tag in self.BLOCKS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._json_ld_parts is not None:
+            self._json_ld_parts.append(data)
+        elif not self._skip_depth:
+            self.parts.append(data)
+
+    def text(self) -> str:
+        lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(self.parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+def _html_to_text(html: str) -> _TextExtractor:
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser
+
+def _job_postings(node):
+    """schema.org JobPosting objects anywhere in a JSON-LD document"""
+    if isinstance(node, list):
+        for item in node:
+            yield from _job_postings(item)
+    elif isinstance(node, dict):
+        types = node.get("@type")
+        if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+            yield node
+        yield from _job_postings(node.get("@graph"))
+
+def extract_job_text(html: str) -> Optional[str]:
+    """
+    Posting text from a job page: the JobPosting description most job boards embed as
+    JSON-LD, else the page's readable text. None when there is too little to analyze
+    (login walls, blocked or empty pages).
+    """
+    page = _html_to_text(html)
+
+    text = None
+    for block in page.json_ld:
+        try:
+            postings = list(_job_postings(json.loads(block)))
+        except ValueError:
+            continue
+        descriptions = [posting["description"] for posting in postings if isinstance(posting.get("description"), str)]
+        if descriptions:
+            text = _html_to_text(descriptions[0]).text()
+            break
+
+    text = text or page.text()
+    if len(text) < settings.ENRICHMENT_MIN_DESCRIPTION_CHARS:
+        return None
+    return text[:settings.ENRICHMENT_MAX_DESCRIPTION_CHARS]
+
+class UnsafeURL(ValueError):
+    """URL the server must not fetch (non-HTTP scheme or a private address)"""
+
+def _check_url(url: str):
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise UnsafeURL(f"Unsupported URL: {url}")
+
+class _PublicAddressBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves each host once, refuses non-public addresses and connects
+    to the address it checked, so a DNS answer that changes between check and connect
+    (DNS rebinding) can't point a fetch at an internal service. TLS still verifies the hostname.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend):
+        self._backend = backend
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if settings.ENRICHMENT_ALLOW_PRIVATE_HOSTS:
+            return await self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+
+        # User-supplied URLs must not reach internal services
+        addresses = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        for *_, sockaddr in addresses:
+            if not ipaddress.ip_address(sockaddr[0]).is_global:
+                raise UnsafeURL(f"Refusing to fetch from {host}: {sockaddr[0]} is not a public address")
+        return await self._backend.connect_tcp(addresses[0][4][0], port, timeout, local_address, socket_options)
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise UnsafeURL("Refusing to connect to a unix socket")
+
+    async def sleep(self, seconds: float):
+        await self._backend.sleep(seconds)
+
+def _public_transport(limits: httpx.Limits) -> httpx.AsyncHTTPTransport:
+    transport = httpx.AsyncHTTPTransport(limits=limits)
+    # httpx doesn't take a network backend; its connection pool does
+    transport._pool._network_backend = _PublicAddressBackend(transport._pool._network_backend)
+    return transport
+
+class JobPageFetcher:
+    """
+    Fetches job posting pages over one pooled async HTTP client with at most
+    ENRICHMENT_PER_DOMAIN_CONCURRENCY requests in flight per host. Previously fetched
+    pages are revalidated with conditional GETs (If-None-Match / If-Modified-Since).
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created on first use so it binds to the worker's event loop
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=settings.ENRICHMENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ENRICHMENT_MAX_CONNECTIONS
+            )
+            self._client = httpx.AsyncClient(
+                transport=self.transport or _public_transport(limits),
+                trust_env=False,  # environment proxies would bypass the address check
+                timeout=settings.ENRICHMENT_TIMEOUT_SECONDS,
+                headers={"User-Agent": settings.ENRICHMENT_USER_AGENT, "Accept": "text/html"},
+                follow_redirects=False  # followed by hand so every hop is checked
+            )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(settings.ENRICHMENT_PER_DOMAIN_CONCURRENCY)
+        return self._host_limits[host]
+
+    async def fetch(self, url: str, cached: dict = None) -> Optional[dict]:
+        """
+        Return {"text", "etag", "last_modified"} for a posting URL (text is None when the
+        page has no usable posting), the cached entry itself on 304, or None on failure.
+        """
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        for _ in range(settings.ENRICHMENT_MAX_REDIRECTS + 1):
+            _check_url(url)
+            async with self._host_limit(url):
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.has_redirect_location:
+                        location = urljoin(url, response.headers["location"])
+                        # The validators belong to the original host's copy of the page
+                        if urlsplit(location).hostname != urlsplit(url).hostname:
+                            headers = {}
+                        url = location
+                        continue
+                    if response.status_code == 304 and cached:
+                        return cached
+                    if response.status_code != 200:
+                        logger.info(f"Job page {url} returned {response.status_code}")
+                        return None
+                    if "html" not in response.headers.get("content-type", "text/html"):
+                        return {"text": None, "etag": None, "last_modified": None}
+
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= settings.ENRICHMENT_MAX_BYTES:
+                            break
+                    encoding = response.charset_encoding or "utf-8"
+
+            return {
+                "text": extract_job_text(body.decode(encoding, errors="replace")),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+
+        logger.info(f"Too many redirects for job page {url}")
+        return None
+
+    async def fetch_many(self, urls: Iterable[str], cached: Dict[str, dict] = None) -> Dict[str, Optional[dict]]:
+        """Fetch many pages concurrently (bounded per host); failures come back as None"""
+        cached = cached or {}
+        urls = list(urls)
+        results = await asyncio.gather(*(self.fetch(url, cached.get(url)) for url in urls), return_exceptions=True)
+
+        pages = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch job page {url}: {result!r}")
+                result = None
+            pages[url] = result
+        return pages
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+# Singleton instance
+job_page_fetcher = JobPageFetcher()
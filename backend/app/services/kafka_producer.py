@@ -1,7 +1,9 @@
 from kafka import KafkaProducer
-import json
 import logging
 from app.core.config import settings
+from app.services.events import encode_event
+from app.core.tracing import tracer, inject_headers
+from opentelemetry.trace import SpanKind
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,9 @@ class KafkaProducerService:
         try:
             self.producer = KafkaProducer(
                 bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-                api_version=(0, 10, 1)
+                value_serializer=encode_event,
+                compression_type=settings.KAFKA_COMPRESSION_TYPE,
+                api_version=(0, 11, 0)  # message headers (trace context) need >= 0.11
             )
             logger.info("Kafka producer connected successfully")
         except Exception as e:
@@ -29,8 +32,11 @@ class KafkaProducerService:
             return False
         
         try:
-            future = self.producer.send(topic, value=event_data)
-            future.get(timeout=10)  # Wait for confirmation
+            with tracer.start_as_current_span(f"{topic} publish", kind=SpanKind.PRODUCER) as span:
+                span.set_attribute("messaging.destination", topic)
+                # Carry the trace context to the consumer in message headers
+                future = self.producer.send(topic, value=event_data, headers=inject_headers())
+                future.get(timeout=10)  # Wait for confirmation
             logger.info(f"Event published to {topic}: {event_data}")
             return True
         except Exception as e:
@@ -0,0 +1,68 @@
+import re
+from typing import List
+from app.services.match_engine import match_engine
+
+# Skills we can reliably spot without an LLM. Kept deliberately small: the local tier
+# only needs to recognise clear matches and clear mismatches.
+SKILL_TERMS = [
+    "python", "java", "javascript", "typescript", "golang", "rust", "c++", "c#", "ruby",
+    "php", "scala", "kotlin", "swift", "sql", "nosql", "postgresql", "mysql", "mongodb",
+    "redis", "kafka", "rabbitmq", "elasticsearch", "spark", "hadoop", "airflow", "dbt",
+    "snowflake", "bigquery", "aws", "gcp", "azure", "docker", "kubernetes", "terraform",
+    "ansible", "linux", "git", "ci/cd", "jenkins", "react", "angular", "vue", "node.js",
+    "django", "flask", "fastapi", "spring", "rails", ".net", "graphql", "restful", "grpc",
+    "microservices", "html", "css", "tensorflow", "pytorch", "scikit-learn", "pandas",
+    "numpy", "machine learning", "deep learning", "nlp", "computer vision", "llm",
+    "data analysis", "statistics", "tableau", "power bi", "agile", "scrum",
+    "jira", "figma", "product management", "project management", "leadership",
+    "communication", "security", "networking", "distributed systems", "system design",
+]
+
+_SKILL_PATTERNS = {
+    skill: re.compile(r"(?<![\w+#.])" + re.escape(skill) + r"(?![\w+#])")
+    for skill in SKILL_TERMS
+}
+
+# Number of recognised JD skills at which the local score is considered fully trustworthy
+_CONFIDENT_SKILL_COUNT = 8
+
+def extract_skills(text: str) -> List[str]:
+    """Return known skill terms mentioned in text"""
+    lowered = text.lower()
+    return [skill for skill, pattern in _SKILL_PATTERNS.items() if pattern.search(lowered)]
+
+def score(resume_text: str, job_description: str) -> dict:
+    """
+    Cheap keyword-overlap score of a resume against a job description.
+    Returns the same shape as GeminiService.analyze_application plus a `confidence`
+    in [0, 1] reflecting how many skills the job description exposed, and the
+    n-gram cosine `similarity` of the two texts.
+    """
+    similarity = match_engine.similarity(resume_text, job_description)
+    job_skills = extract_skills(job_description)
+    if not job_skills:
+        return {
+            "match_score": 0,
+            "matching_skills": [],
+            "missing_skills": [],
+            "suggestions": "",
+            "confidence": 0.0,
+            "similarity": similarity
+        }
+
+    resume_skills = set(extract_skills(resume_text))
+    matching = [skill for skill in job_skills if skill in resume_skills]
+    missing = [skill for skill in job_skills if skill not in resume_skills]
+
+    suggestions = ""
+    if missing:
+        suggestions = f"Highlight experience with {', '.join(missing[:5])} if you have it, or consider building it."
+
+    return {
+        "match_score": round(100 * len(matching) / len(job_skills)),
+        "matching_skills": matching,
+        "missing_skills": missing,
+        "suggestions": suggestions,
+        "confidence": min(1.0, len(job_skills) / _CONFIDENT_SKILL_COUNT),
+        "similarity": similarity
+    }
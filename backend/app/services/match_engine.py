@@ -0,0 +1,100 @@
+import re
+import zlib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+import numpy as np
+from scipy import sparse
+from app.core.config import settings
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+class MatchEngine:
+    """
+    Local resume/job description similarity using hashed word n-gram vectors.
+
+    Texts are turned into L2-normalised sparse rows (log-scaled term frequency over a
+    fixed hashed feature space), so cosine similarity for a whole set of job
+    descriptions is a single sparse matrix-vector product. Vectors are cached by
+    content hash, so only new or edited texts are vectorized again.
+    """
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range: tuple = (1, 2), cache_size: int = None):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.cache_size = cache_size or settings.MATCH_VECTOR_CACHE_SIZE
+        self._cache: "OrderedDict[str, sparse.csr_matrix]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        low, high = self.ngram_range
+        features = []
+        for n in range(low, high + 1):
+            features.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return features
+
+    def _vectorize_one(self, text: str) -> sparse.csr_matrix:
+        features = self._features(text)
+        if not features:
+            return sparse.csr_matrix((1, self.n_features), dtype=np.float32)
+
+        # crc32 is stable across processes, unlike hash()
+        indices = np.fromiter(
+            (zlib.crc32(feature.encode("utf-8")) % self.n_features for feature in features),
+            dtype=np.int64,
+            count=len(features)
+        )
+        columns, counts = np.unique(indices, return_counts=True)
+        values = (1.0 + np.log(counts)).astype(np.float32)
+        values /= np.linalg.norm(values)
+        return sparse.csr_matrix(
+            (values, columns, np.array([0, len(columns)])),
+            shape=(1, self.n_features)
+        )
+
+    def vector(self, text: str) -> sparse.csr_matrix:
+        """Return the (cached) normalised vector for a text"""
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        row = self._vectorize_one(text)
+        with self._lock:
+            self._cache[key] = row
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return row
+
+    def matrix(self, texts: List[Optional[str]]) -> sparse.csr_matrix:
+        """Stack vectors for texts into one matrix; missing texts become empty rows"""
+        empty = sparse.csr_matrix((1, self.n_features), dtype=np.float32)
+        rows = [self.vector(text) if text else empty for text in texts]
+        return sparse.vstack(rows, format="csr")
+
+    def similarities(self, resume_text: str, job_descriptions: List[Optional[str]]) -> np.ndarray:
+        """Cosine similarity (0-1) of a resume against every job description in one batch"""
+        if not job_descriptions:
+            return np.zeros(0, dtype=np.float32)
+        resume_vector = self.vector(resume_text)
+        jobs = self.matrix(job_descriptions)
+        return np.asarray((jobs @ resume_vector.T).todense()).ravel()
+
+    def similarity(self, resume_text: str, job_description: str) -> float:
+        """Cosine similarity of a single resume/job description pair"""
+        return float(self.similarities(resume_text, [job_description])[0])
+
+    def fit_scores(self, resume_text: str, job_descriptions: List[Optional[str]]) -> List[Optional[float]]:
+        """Similarity as a 0-100 fit score, None where there is no job description"""
+        scores = self.similarities(resume_text, job_descriptions)
+        return [
+            round(float(score) * 100, 1) if text else None
+            for score, text in zip(scores, job_descriptions)
+        ]
+
+# Singleton instance
+match_engine = MatchEngine()
@@ -0,0 +1,173 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.purge_job import PurgeJob, PurgeStatus
+
+logger = logging.getLogger(__name__)
+
+ENTITY_USER = "user"
+ENTITY_APPLICATION = "application"
+ENTITY_RESUME = "resume"
+
+def _batched_delete(table: str, where: str) -> str:
+    return f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE {where} LIMIT :batch_size)"
+
+# Ordered (step, statement) per entity type. Each statement touches at most :batch_size rows
+# and is repeated until it touches fewer, one committed batch at a time, so no transaction
+# holds locks on more than a batch of rows. Children go first so the final delete of the
+# soft-deleted row itself has nothing left to cascade to.
+PURGE_STEPS = {
+    ENTITY_APPLICATION: [
+        ("interactions", _batched_delete("interactions", "application_id = :id")),
+        ("reminders", _batched_delete("reminders", "application_id = :id")),
+        ("ai_analyses", _batched_delete("ai_analyses", "application_id = :id")),
+        ("application_status_events", _batched_delete("application_status_events", "application_id = :id")),
+        ("applications", "DELETE FROM applications WHERE id = :id AND deleted_at IS NOT NULL"),
+    ],
+    ENTITY_RESUME: [
+        ("ai_analyses", _batched_delete("ai_analyses", "resume_id = :id")),
+        ("applications", """
+            UPDATE applications SET best_resume_id = NULL, best_resume_score = NULL
+            WHERE id IN (SELECT id FROM applications WHERE best_resume_id = :id LIMIT :batch_size)
+        """),
+        ("resumes", "DELETE FROM resumes WHERE id = :id AND deleted_at IS NOT NULL"),
+    ],
+    ENTITY_USER: [
+        ("interactions", _batched_delete(
+            "interactions", "application_id IN (SELECT id FROM applications WHERE user_id = :id)"
+        )),
+        ("ai_analyses", _batched_delete(
+            "ai_analyses", "application_id IN (SELECT id FROM applications WHERE user_id = :id)"
+        )),
+        ("reminders", _batched_delete("reminders", "user_id = :id")),
+        ("application_status_events", _batched_delete("application_status_events", "user_id = :id")),
+        ("change_log", _batched_delete("change_log", "user_id = :id")),
+        # Partitioned on date_applied: match the full key so each row is located directly
+        ("applications_archive", """
+            DELETE FROM applications_archive WHERE (id, date_applied) IN (
+                SELECT id, date_applied FROM applications_archive WHERE user_id = :id LIMIT :batch_size
+            )
+        """),
+        ("applications", _batched_delete("applications", "user_id = :id")),
+        ("users", "UPDATE users SET active_resume_id = NULL WHERE id = :id AND active_resume_id IS NOT NULL"),
+        ("resumes", _batched_delete("resumes", "user_id = :id")),
+        ("users", "DELETE FROM users WHERE id = :id AND deleted_at IS NOT NULL"),
+    ],
+}
+
+# Change log entries past the sync retention, one batch per statement (cursors that old are refused)
+PRUNE_CHANGE_LOG_SQL = text(_batched_delete("change_log", "changed_at < :cutoff"))
+
+class Purger:
+    """
+    Background removal of soft-deleted users, applications and resumes.
+    Requests only set deleted_at and enqueue a PurgeJob; this deletes the dependent
+    rows in bounded batches and records progress on the job.
+    """
+
+    def __init__(self, batch_size: int = None):
+        self.batch_size = batch_size or settings.PURGE_BATCH_SIZE
+
+    def enqueue(self, db: Session, entity_type: str, entity_id, user_id) -> PurgeJob:
+        """Schedule a purge in the caller's transaction (commit together with the soft delete)"""
+        job = PurgeJob(entity_type=entity_type, entity_id=entity_id, user_id=user_id)
+        db.add(job)
+        return job
+
+    def claim(self, db: Session) -> Optional[PurgeJob]:
+        """Take the oldest pending job whose retry is due, or one whose worker stopped reporting progress"""
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.PURGE_STALE_AFTER_SECONDS)
+        job = db.query(PurgeJob).filter(
+            or_(
+                (PurgeJob.status == PurgeStatus.pending) & or_(PurgeJob.next_attempt_at.is_(None), PurgeJob.next_attempt_at <= now),
+                (PurgeJob.status == PurgeStatus.running) & (PurgeJob.updated_at < stale_before)
+            )
+        ).order_by(PurgeJob.created_at).with_for_update(skip_locked=True).first()
+        if job is None:
+            return None
+
+        job.status = PurgeStatus.running
+        job.started_at = job.started_at or datetime.utcnow()
+        db.commit()
+        return job
+
+    def purge(self, db: Session, job: PurgeJob):
+        """Run every step of a job to completion (steps are idempotent, so resuming is safe)"""
+        for step, statement in PURGE_STEPS[job.entity_type]:
+            job.current_step = step
+            while True:
+                if job.entity_type == ENTITY_USER:
+                    # The whole account goes away: nothing to tell sync clients
+                    db.execute(text("SET LOCAL app.skip_change_log = 'on'"))
+                result = db.execute(text(statement), {"id": job.entity_id, "batch_size": self.batch_size})
+                job.processed_rows += result.rowcount
+                db.commit()
+                if result.rowcount < self.batch_size:
+                    break
+
+        job.status = PurgeStatus.completed
+        job.current_step = None
+        job.error_message = None
+        job.completed_at = datetime.utcnow()
+        db.commit()
+        logger.info(f"Purged {job.entity_type} {job.entity_id}: {job.processed_rows} rows")
+
+    def fail(self, db: Session, job: PurgeJob, error: Exception):
+        """Schedule a retry with exponential backoff, or give up after PURGE_MAX_ATTEMPTS failed runs"""
+        job.attempts += 1
+        job.error_message = str(error)
+        if job.attempts < settings.PURGE_MAX_ATTEMPTS:
+            # Steps are idempotent: the retry picks up where this run stopped
+            job.status = PurgeStatus.pending
+            job.next_attempt_at = datetime.utcnow() + timedelta(seconds=settings.PURGE_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+        else:
+            job.status = PurgeStatus.failed
+            logger.error(f"Giving up on purge of {job.entity_type} {job.entity_id} after {job.attempts} attempts")
+        db.commit()
+
+    def prune_change_log(self) -> int:
+        """Delete change log entries older than the sync retention, one committed batch at a time"""
+        cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_CHANGE_LOG_RETENTION_DAYS)
+        pruned = 0
+        db = SessionLocal()
+        try:
+            while True:
+                result = db.execute(PRUNE_CHANGE_LOG_SQL, {"cutoff": cutoff, "batch_size": self.batch_size})
+                db.commit()
+                pruned += result.rowcount
+                if result.rowcount < self.batch_size:
+                    break
+        except Exception as e:
+            logger.error(f"Change log pruning failed after {pruned} entries: {e}")
+            db.rollback()
+        finally:
+            db.close()
+        return pruned
+
+    def run(self) -> int:
+        """Process queued purge jobs until none are left (worker entrypoint)"""
+        completed = 0
+        db = SessionLocal()
+        try:
+            while True:
+                job = self.claim(db)
+                if job is None:
+                    break
+                try:
+                    self.purge(db, job)
+                    completed += 1
+                except Exception as e:
+                    logger.error(f"Purge of {job.entity_type} {job.entity_id} failed at {job.current_step}: {e}")
+                    db.rollback()
+                    self.fail(db, job, e)
+        finally:
+            db.close()
+        return completed
+
+# Singleton instance
+purger = Purger()
@@ -0,0 +1,122 @@
+import time
+import logging
+from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.ai_analysis import AIAnalysis, AnalysisStatus
+from app.services.kafka_producer import kafka_producer
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Applications that are still worth re-scoring against a new resume
+OPEN_STATUSES = [
+    ApplicationStatus.applied,
+    ApplicationStatus.screening,
+    ApplicationStatus.interviewing,
+    ApplicationStatus.offered,
+]
+
+class ReanalysisPlanner:
+    def __init__(self, queue: str = "reanalysis_plan", batch_size: int = None, batch_interval: float = None):
+        self.queue = queue
+        self.batch_size = batch_size or settings.REANALYSIS_BATCH_SIZE
+        self.batch_interval = (
+            batch_interval if batch_interval is not None
+            else settings.REANALYSIS_BATCH_INTERVAL_SECONDS
+        )
+
+    def plan(self, db: Session, user_id: str, resume_id: str) -> List[str]:
+        """
+        Return IDs of open applications that still need an analysis against resume_id,
+        newest first. Pairs that are already analyzed, or were queued less than
+        REANALYSIS_PENDING_STALE_SECONDS ago, are skipped; older pending ones were lost and go again.
+        """
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.REANALYSIS_PENDING_STALE_SECONDS)
+        rows = (
+            db.query(Application.id)
+            .outerjoin(
+                AIAnalysis,
+                and_(
+                    AIAnalysis.application_id == Application.id,
+                    AIAnalysis.resume_id == resume_id,
+                    or_(
+                        AIAnalysis.analysis_status == AnalysisStatus.completed,
+                        (AIAnalysis.analysis_status == AnalysisStatus.pending) & (AIAnalysis.created_at > stale_before)
+                    )
+                )
+            )
+            .filter(
+                Application.user_id == user_id,
+                Application.deleted_at.is_(None),
+                Application.status.in_(OPEN_STATUSES),
+                Application.job_description.isnot(None),
+                AIAnalysis.id.is_(None)
+            )
+            .order_by(Application.date_applied.desc(), Application.created_at.desc())
+            .all()
+        )
+        return [str(row.id) for row in rows]
+
+    def publish(self, user_id: str, resume_id: str, application_id: str) -> bool:
+        """Publish one re-analysis event on the bulk lane"""
+        return kafka_producer.publish_event(settings.ANALYSIS_BULK_TOPIC, {
+            "application_id": application_id,
+            "user_id": user_id,
+            "resume_id": resume_id,
+            "event_type": "reanalysis_requested"
+        })
+
+    def enqueue(self, user_id: str, resume_id: str, application_ids: List[str]) -> int:
+        """
+        Persist the plan in a Redis sorted set scored by release time, batch_size applications
+        every batch_interval seconds; the reanalysis worker publishes them as they come due.
+        """
+        now = time.time()
+        releases = {
+            f"{user_id}:{resume_id}:{application_id}": now + (index // self.batch_size) * self.batch_interval
+            for index, application_id in enumerate(application_ids)
+        }
+        if redis_service.schedule_due(self.queue, releases):
+            logger.info(f"Scheduled {len(releases)} re-analyses for user {user_id}")
+            return len(releases)
+
+        # Redis unavailable: publish straight away rather than lose the plan
+        logger.warning(f"Re-analysis queue unavailable, publishing {len(application_ids)} events for user {user_id} now")
+        return sum(self.publish(user_id, resume_id, application_id) for application_id in application_ids)
+
+    def release_due(self, now: float = None, limit: int = 100) -> int:
+        """Publish planned re-analyses whose release time has passed; failed publishes are retried later"""
+        now = now or time.time()
+        failed = {}
+        published = 0
+        for member in redis_service.pop_due(self.queue, now, limit):
+            user_id, resume_id, application_id = member.split(":", 2)
+            if self.publish(user_id, resume_id, application_id):
+                published += 1
+            else:
+                failed[member] = now + self.batch_interval
+        if failed:
+            redis_service.schedule_due(self.queue, failed)
+        return published
+
+    def run(self, user_id: str, resume_id: str) -> int:
+        """Plan and schedule re-analysis after the active resume changed (background task entrypoint)"""
+        db = SessionLocal()
+        try:
+            application_ids = self.plan(db, user_id, resume_id)
+        finally:
+            db.close()
+
+        if not application_ids:
+            logger.info(f"No applications need re-analysis for resume {resume_id}")
+            return 0
+
+        return self.enqueue(user_id, resume_id, application_ids)
+
+# Singleton instance
+reanalysis_planner = ReanalysisPlanner()
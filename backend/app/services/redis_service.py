@@ -1,29 +1,109 @@
 import redis
 import json
 import hashlib
-from typing import Optional
+import time
+import threading
+from typing import Dict, Iterable, List, Optional
+import msgpack
+import zstandard
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Read and remove due members in one step so a concurrent reschedule is never lost
+POP_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #due > 0 then
+    redis.call('ZREM', KEYS[1], unpack(due))
+end
+return due
+"""
+
+# Token bucket: refill by elapsed time, then try to take `cost` tokens.
+# Floats are returned as strings because Redis truncates Lua numbers to integers.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+# Prefix marking a zstd-compressed msgpack value; anything else is plain JSON
+_COMPRESSED_PREFIX = b"Z"
+
 class RedisService:
     def __init__(self):
         self.client = None
+        # Same server, but returns bytes: used for (possibly compressed) object values
+        self.binary_client = None
+        # zstd (de)compressors are not thread-safe: one pair per thread
+        self._codecs = threading.local()
         self._connect()
     
+    def _pool(self, decode_responses: bool) -> redis.ConnectionPool:
+        return redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=decode_responses,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_connect_timeout=5,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL
+        )
+    
     def _connect(self):
         try:
-            self.client = redis.from_url(
-                settings.REDIS_URL,
-                decode_responses=True,
-                socket_connect_timeout=5
-            )
+            self.client = redis.Redis(connection_pool=self._pool(decode_responses=True))
+            self.binary_client = redis.Redis(connection_pool=self._pool(decode_responses=False))
             self.client.ping()
             logger.info("Redis connected successfully")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.client = None
+            self.binary_client = None
+    
+    @property
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        if not hasattr(self._codecs, "compressor"):
+            self._codecs.compressor = zstandard.ZstdCompressor(level=settings.REDIS_COMPRESSION_LEVEL)
+        return self._codecs.compressor
+    
+    @property
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        if not hasattr(self._codecs, "decompressor"):
+            self._codecs.decompressor = zstandard.ZstdDecompressor()
+        return self._codecs.decompressor
+    
+    def _encode(self, value) -> bytes:
+        """JSON for small values, zstd-compressed msgpack for large ones"""
+        if settings.REDIS_COMPRESSION_ENABLED:
+            packed = msgpack.packb(value, use_bin_type=True)
+            if len(packed) >= settings.REDIS_COMPRESSION_MIN_BYTES:
+                return _COMPRESSED_PREFIX + self._compressor.compress(packed)
+        return json.dumps(value).encode("utf-8")
+    
+    def _decode(self, data: Optional[bytes]):
+        if data is None:
+            return None
+        if data.startswith(_COMPRESSED_PREFIX):
+            return msgpack.unpackb(self._decompressor.decompress(data[len(_COMPRESSED_PREFIX):]), raw=False)
+        return json.loads(data)
     
     def get(self, key: str) -> Optional[str]:
         """Get value from Redis"""
@@ -57,43 +137,135 @@ class RedisService:
             logger.error(f"Redis DELETE error: {e}")
             return False
     
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several values in one round-trip (MGET); missing keys come back as None"""
+        if not self.client or not keys:
+            return [None] * len(keys)
+        try:
+            return self.client.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis MGET error: {e}")
+            return [None] * len(keys)
+    
+    def set_many(self, values: Dict[str, str], expiry: int = 3600) -> bool:
+        """Set several values with the same expiry in one pipelined round-trip"""
+        if not self.client or not values:
+            return False
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.setex(key, expiry, value)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis pipelined SET error: {e}")
+            return False
+    
+    def get_object(self, key: str):
+        """Get a value stored with set_object"""
+        return self.get_objects([key]).get(key)
+    
+    def set_object(self, key: str, value, expiry: int = 3600) -> bool:
+        """Store a JSON-compatible value, compressing it when large"""
+        return self.set_objects({key: value}, expiry)
+    
+    def get_objects(self, keys: List[str]) -> Dict[str, object]:
+        """Get several objects in one MGET, returning only the keys that were found"""
+        if not self.binary_client or not keys:
+            return {}
+        try:
+            values = self.binary_client.mget(keys)
+            return {key: self._decode(value) for key, value in zip(keys, values) if value is not None}
+        except Exception as e:
+            logger.error(f"Redis MGET error: {e}")
+            return {}
+    
+    def set_objects(self, values: Dict[str, object], expiry: int = 3600) -> bool:
+        """Store several objects with the same expiry in one pipelined round-trip"""
+        if not self.binary_client or not values:
+            return False
+        try:
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.setex(key, expiry, self._encode(value))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis pipelined SET error: {e}")
+            return False
+    
     def hash_text(self, text: str) -> str:
         """Create hash of text for cache key"""
         return hashlib.md5(text.encode()).hexdigest()
     
     # Specific caching methods
     
-    def cache_ai_analysis(self, resume_id: str, job_description: str, analysis: dict, expiry: int = 86400):
-        """Cache AI analysis result (24 hour expiry)"""
-        job_hash = self.hash_text(job_description)
-        key = f"ai_analysis:{resume_id}:{job_hash}"
-        return self.set(key, json.dumps(analysis), expiry)
+    def cache_ai_analysis(self, result_key: str, analysis: dict, expiry: int = 86400):
+        """Cache AI analysis result under its content-addressed key (24 hour expiry)"""
+        return self.cache_ai_analyses({result_key: analysis}, expiry)
     
-    def get_cached_ai_analysis(self, resume_id: str, job_description: str) -> Optional[dict]:
+    def get_cached_ai_analysis(self, result_key: str) -> Optional[dict]:
         """Get cached AI analysis"""
-        job_hash = self.hash_text(job_description)
-        key = f"ai_analysis:{resume_id}:{job_hash}"
-        cached = self.get(key)
+        cached = self.get_cached_ai_analyses([result_key]).get(result_key)
         if cached:
-            logger.info(f"Cache HIT for AI analysis: {key}")
-            return json.loads(cached)
-        logger.info(f"Cache MISS for AI analysis: {key}")
-        return None
+            logger.info(f"Cache HIT for AI analysis: {result_key}")
+        else:
+            logger.info(f"Cache MISS for AI analysis: {result_key}")
+        return cached
+    
+    def cache_ai_analyses(self, analyses: Dict[str, dict], expiry: int = 86400):
+        """Cache many AI analysis results, keyed by result key, in one round-trip"""
+        return self.set_objects({f"ai_analysis:{key}": value for key, value in analyses.items()}, expiry)
+    
+    def get_cached_ai_analyses(self, result_keys: Iterable[str]) -> Dict[str, dict]:
+        """Get cached AI analyses for many result keys; misses are left out"""
+        result_keys = list(result_keys)
+        found = self.get_objects([f"ai_analysis:{key}" for key in result_keys])
+        return {key: found[f"ai_analysis:{key}"] for key in result_keys if f"ai_analysis:{key}" in found}
     
     def cache_active_resume(self, user_id: str, resume_data: dict, expiry: int = 3600):
         """Cache active resume (1 hour expiry)"""
-        key = f"active_resume:{user_id}"
-        return self.set(key, json.dumps(resume_data), expiry)
+        return self.cache_active_resumes({user_id: resume_data}, expiry)
     
     def get_cached_active_resume(self, user_id: str) -> Optional[dict]:
         """Get cached active resume"""
-        key = f"active_resume:{user_id}"
-        cached = self.get(key)
+        cached = self.get_cached_active_resumes([user_id]).get(user_id)
         if cached:
             logger.info(f"Cache HIT for active resume: {user_id}")
-            return json.loads(cached)
-        logger.info(f"Cache MISS for active resume: {user_id}")
-        return None
+        else:
+            logger.info(f"Cache MISS for active resume: {user_id}")
+        return cached
+    
+    def cache_active_resumes(self, resumes: Dict[str, dict], expiry: int = 3600):
+        """Cache active resumes for many users in one round-trip"""
+        return self.set_objects({f"active_resume:{user_id}": value for user_id, value in resumes.items()}, expiry)
+    
+    def get_cached_active_resumes(self, user_ids: Iterable[str]) -> Dict[str, dict]:
+        """Get cached active resumes for many users; misses are left out"""
+        user_ids = list(user_ids)
+        found = self.get_objects([f"active_resume:{user_id}" for user_id in user_ids])
+        return {user_id: found[f"active_resume:{user_id}"] for user_id in user_ids if f"active_resume:{user_id}" in found}
+    
+    def cache_extracted_resume(self, file_hash: str, extracted: dict, expiry: int = 604800):
+        """Cache text and skills extracted from a PDF, keyed by file content hash (7 day expiry)"""
+        return self.set_object(f"resume_extract:{file_hash}", extracted, expiry)
+    
+    def get_cached_extracted_resume(self, file_hash: str) -> Optional[dict]:
+        """Get cached PDF extraction"""
+        cached = self.get_object(f"resume_extract:{file_hash}")
+        if cached:
+            logger.info(f"Cache HIT for resume extraction: {file_hash}")
+        return cached
+    
+    def cache_job_pages(self, pages: Dict[str, dict], expiry: int = 604800):
+        """Cache fetched job posting pages (text plus ETag/Last-Modified validators) keyed by URL"""
+        return self.set_objects({f"job_page:{self.hash_text(url)}": page for url, page in pages.items()}, expiry)
+    
+    def get_cached_job_pages(self, urls: Iterable[str]) -> Dict[str, dict]:
+        """Get cached job posting pages for many URLs; misses are left out"""
+        keys = {url: f"job_page:{self.hash_text(url)}" for url in urls}
+        found = self.get_objects(list(keys.values()))
+        return {url: found[key] for url, key in keys.items() if key in found}
     
     def invalidate_user_resume_cache(self, user_id: str):
         """Invalidate cached resume when user uploads new one"""
@@ -101,5 +273,104 @@ class RedisService:
         self.delete(key)
         logger.info(f"Invalidated resume cache for user: {user_id}")
 
+    def schedule_due(self, queue: str, members: Dict[str, float]) -> bool:
+        """Add or reschedule members in a due-time sorted set in one round-trip (repeated calls coalesce)"""
+        if not self.client:
+            return False
+        try:
+            self.client.zadd(queue, members)
+            return True
+        except Exception as e:
+            logger.error(f"Redis ZADD error: {e}")
+            return False
+    
+    def pop_due(self, queue: str, now: float, limit: int = 100) -> list:
+        """Atomically pop members whose due time has passed"""
+        if not self.client:
+            return []
+        try:
+            return self.client.eval(POP_DUE_SCRIPT, 1, queue, now, limit)
+        except Exception as e:
+            logger.error(f"Redis pop due error: {e}")
+            return []
+    
+    def get_user_version(self, user_id: str) -> Optional[str]:
+        """
+        Current data version for a user, used to namespace cached responses.
+        Initialised from the clock so a lost key never revives old cache entries.
+        """
+        if not self.client:
+            return None
+        key = f"user_data_version:{user_id}"
+        try:
+            # Initialise-if-missing and read in one round-trip
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, int(time.time() * 1000), nx=True)
+            pipe.get(key)
+            return pipe.execute()[1]
+        except Exception as e:
+            logger.error(f"Redis user version error: {e}")
+            return None
+    
+    def bump_user_version(self, user_id: str):
+        """
+        Invalidate every cached response for a user after a write, and pin their
+        reads to the primary database for READ_YOUR_WRITES_SECONDS.
+        """
+        if not self.client:
+            return
+        key = f"user_data_version:{user_id}"
+        try:
+            if not self.client.set(key, int(time.time() * 1000), nx=True):
+                self.client.incr(key)
+            self.client.set(f"recent_write:{user_id}", 1, ex=settings.READ_YOUR_WRITES_SECONDS)
+        except Exception as e:
+            logger.error(f"Redis user version error: {e}")
+    
+    def has_recent_write(self, user_id: str) -> bool:
+        """Whether the user wrote recently enough that a replica may not show it yet"""
+        if not self.client:
+            # Without the marker we cannot tell, so stay on the safe side
+            return True
+        try:
+            return bool(self.client.exists(f"recent_write:{user_id}"))
+        except Exception as e:
+            logger.error(f"Redis recent write error: {e}")
+            return True
+    
+    def cache_response(self, cache_key: str, entry: dict, expiry: int = 300):
+        """Cache a serialized API response with its validators (5 minute expiry)"""
+        return self.set(f"response_cache:{cache_key}", json.dumps(entry), expiry)
+    
+    def get_cached_response(self, cache_key: str) -> Optional[dict]:
+        """Get a cached API response"""
+        cached = self.get(f"response_cache:{cache_key}")
+        return json.loads(cached) if cached else None
+    
+    def take_token(self, key: str, rate: float, capacity: int, cost: int = 1) -> Optional[tuple]:
+        """
+        Atomically take tokens from a bucket refilled at `rate` per second.
+        Returns (allowed, tokens_left, retry_after_seconds), or None when Redis is unavailable.
+        """
+        if not self.client:
+            return None
+        try:
+            allowed, tokens, retry_after = self.client.eval(
+                TOKEN_BUCKET_SCRIPT, 1, f"rate_limit:{key}", rate, capacity, time.time(), cost
+            )
+            return bool(allowed), float(tokens), float(retry_after)
+        except Exception as e:
+            logger.error(f"Redis rate limit error: {e}")
+            return None
+    
+    def set_analysis_backlog(self, depth: int, expiry: int = 30):
+        """Publish the analysis worker backlog (expires if the worker stops reporting)"""
+        return self.set("analysis_backlog", str(depth), expiry)
+    
+    def get_analysis_backlog(self) -> Optional[int]:
+        """Last reported analysis worker backlog"""
+        depth = self.get("analysis_backlog")
+        return int(depth) if depth is not None else None
+
 # Singleton instance
 redis_service = RedisService()
\ No newline at end of file
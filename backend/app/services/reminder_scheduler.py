@@ -0,0 +1,173 @@
+import logging
+from datetime import datetime, time, timedelta
+from typing import Optional
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.interaction import Interaction, InteractionType
+from app.models.reminder import Reminder, ReminderKind, ReminderStatus
+from app.services.application_archiver import CLOSED_STATUSES
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Interactions after which a follow-up email is expected
+INTERVIEW_TYPES = [
+    InteractionType.phone_screen,
+    InteractionType.technical_interview,
+    InteractionType.behavioral_interview,
+]
+
+# Flip one batch of due reminders. Walks the partial index over pending rows in due_at order,
+# so the cost is the number of due reminders, not the size of the table. SKIP LOCKED lets
+# several workers share the queue. Soft-deleted applications wait for the purge instead.
+FIRE_DUE_SQL = text("""
+    UPDATE reminders SET status = 'due', fired_at = now() AT TIME ZONE 'utc', updated_at = now() AT TIME ZONE 'utc'
+    WHERE id IN (
+        SELECT id FROM reminders
+        WHERE status = 'pending' AND due_at <= now() AT TIME ZONE 'utc'
+            AND NOT EXISTS (
+                SELECT 1 FROM applications
+                WHERE applications.id = reminders.application_id AND applications.deleted_at IS NOT NULL
+            )
+        ORDER BY due_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING user_id
+""")
+
+class ReminderScheduler:
+    """
+    Keeps one reminder per (application, kind) in the `reminders` queue table and fires them
+    when due. Scheduling happens in the caller's transaction, next to the change that causes it.
+    """
+
+    def __init__(self, batch_size: int = None):
+        self.batch_size = batch_size or settings.REMINDER_BATCH_SIZE
+
+    def stale_after(self, application_status: ApplicationStatus) -> Optional[timedelta]:
+        """How long an application may sit in a status before it needs a nudge (None: never)"""
+        days = {
+            ApplicationStatus.applied: settings.REMINDER_APPLIED_STALE_DAYS,
+            ApplicationStatus.screening: settings.REMINDER_SCREENING_STALE_DAYS,
+        }.get(application_status)
+        return timedelta(days=days) if days is not None else None
+
+    def _clear(self, db: Session, application_id, kind: ReminderKind = None):
+        query = db.query(Reminder).filter(Reminder.application_id == application_id)
+        if kind is not None:
+            query = query.filter(Reminder.kind == kind)
+        query.delete(synchronize_session=False)
+
+    def _arm(self, db: Session, application: Application, kind: ReminderKind, due_at: datetime, new_application: bool = False):
+        """Create or re-arm the application's reminder of a kind (re-arming also undoes a dismissal)"""
+        if new_application:
+            # Nothing can race an application that isn't committed yet: a plain add keeps bulk inserts one flush
+            db.add(Reminder(
+                user_id=application.user_id,
+                application_id=application.id,
+                kind=kind,
+                status=ReminderStatus.pending,
+                due_at=due_at
+            ))
+            return
+
+        # One statement, so concurrent requests re-arming the same reminder can't both insert it
+        now = datetime.utcnow()
+        db.execute(
+            insert(Reminder)
+            .values(
+                user_id=application.user_id,
+                application_id=application.id,
+                kind=kind,
+                status=ReminderStatus.pending,
+                due_at=due_at
+            )
+            .on_conflict_do_update(
+                index_elements=["application_id", "kind"],  # uq_reminders_application_id_kind
+                set_={"status": ReminderStatus.pending, "due_at": due_at, "fired_at": None, "updated_at": now}
+            )
+        )
+
+    def on_status_change(self, db: Session, application: Application, from_status: ApplicationStatus | None):
+        """Reschedule the application's reminders for its new status"""
+        if application.status in CLOSED_STATUSES:
+            # Nothing left to follow up on
+            self._clear(db, application.id)
+            return
+
+        stale_after = self.stale_after(application.status)
+        if stale_after is None:
+            self._clear(db, application.id, ReminderKind.stale_application)
+            return
+
+        self._arm(
+            db, application, ReminderKind.stale_application,
+            datetime.utcnow() + stale_after,
+            new_application=from_status is None
+        )
+
+    def on_interaction(self, db: Session, application: Application, interaction: Interaction):
+        """
+        Schedule a follow-up after the latest interview; a follow-up email dated on or after
+        the latest interview clears it (the same rule as the migration backfill)
+        """
+        if interaction.interaction_type not in INTERVIEW_TYPES + [InteractionType.follow_up_email]:
+            return
+        if application.status in CLOSED_STATUSES:
+            # Nothing left to follow up on (on_status_change already cleared its reminders)
+            return
+
+        # Interactions stored before this one (it isn't flushed yet)
+        last_interview, last_follow_up = db.query(
+            func.max(Interaction.interaction_date).filter(Interaction.interaction_type.in_(INTERVIEW_TYPES)),
+            func.max(Interaction.interaction_date).filter(Interaction.interaction_type == InteractionType.follow_up_email)
+        ).filter(Interaction.application_id == application.id).one()
+
+        if interaction.interaction_type == InteractionType.follow_up_email:
+            if last_interview is not None and interaction.interaction_date >= last_interview:
+                self._clear(db, application.id, ReminderKind.follow_up)
+            return
+
+        # An older interview logged late changes nothing; a newer one needs its own follow-up
+        if last_interview is not None and interaction.interaction_date < last_interview:
+            return
+        if last_follow_up is not None and last_follow_up >= interaction.interaction_date:
+            return
+        due_at = datetime.combine(interaction.interaction_date, time()) + timedelta(days=settings.REMINDER_FOLLOW_UP_DAYS)
+        self._arm(db, application, ReminderKind.follow_up, due_at)
+
+    def fire_due(self, db: Session) -> int:
+        """Mark up to batch_size due reminders as due and commit; returns how many fired"""
+        user_ids = db.execute(FIRE_DUE_SQL, {"batch_size": self.batch_size}).scalars().all()
+        db.commit()
+        for user_id in set(user_ids):
+            redis_service.bump_user_version(str(user_id))
+        return len(user_ids)
+
+    def run(self) -> int:
+        """Fire every due reminder, one committed batch at a time (worker entrypoint)"""
+        fired = 0
+        db = SessionLocal()
+        try:
+            while True:
+                batch = self.fire_due(db)
+                fired += batch
+                if batch < self.batch_size:
+                    break
+        except Exception as e:
+            logger.error(f"Firing reminders failed after {fired}: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        if fired:
+            logger.info(f"Fired {fired} reminders")
+        return fired
+
+# Singleton instance
+reminder_scheduler = ReminderScheduler()
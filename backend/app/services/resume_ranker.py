@@ -0,0 +1,22 @@
+from typing import List, Tuple
+from sqlalchemy.orm import Session
+from app.models.resume import Resume
+from app.services.match_engine import match_engine
+
+def rank_resumes(db: Session, user_id, job_description: str) -> List[Tuple[str, float]]:
+    """
+    Rank all of a user's resumes against a job description with the local match engine.
+    Returns (resume_id, fit_score) pairs, best first.
+    """
+    resumes = db.query(Resume.id, Resume.content).filter(
+        Resume.user_id == user_id,
+        Resume.deleted_at.is_(None)
+    ).all()
+    if not resumes:
+        return []
+
+    # Cosine similarity is symmetric, so the job description can play the "resume" role here
+    scores = match_engine.fit_scores(job_description, [resume.content for resume in resumes])
+    ranked = [(str(resume.id), score or 0.0) for resume, score in zip(resumes, scores)]
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked
@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.resume import Resume
+
+def get_active_resume(db: Session, user_id) -> Optional[Resume]:
+    """Fetch the active resume through the user's pointer (primary-key lookups only)"""
+    return db.query(Resume).join(
+        User, User.active_resume_id == Resume.id
+    ).filter(User.id == user_id).first()
+
+def activate_resume(db: Session, user_id, resume: Resume):
+    """
+    Make resume the user's active one within the caller's transaction.
+    Only the previously active row is touched, and the user row is locked so
+    concurrent switches for the same user serialize.
+    """
+    user = db.query(User).filter(User.id == user_id).with_for_update().one()
+
+    if user.active_resume_id and user.active_resume_id != resume.id:
+        db.query(Resume).filter(Resume.id == user.active_resume_id).update({"is_active": False})
+        # Deactivate before activating so the partial unique index is never violated
+        db.flush()
+
+    resume.is_active = True
+    if resume not in db:
+        db.add(resume)
+    db.flush()
+    user.active_resume_id = resume.id
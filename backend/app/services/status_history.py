@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+from app.models.application import Application, ApplicationStatus
+from app.models.application_status_event import ApplicationStatusEvent
+from app.services.reminder_scheduler import reminder_scheduler
+
+def record_status_change(db: Session, application: Application, from_status: ApplicationStatus | None):
+    """
+    Append a status event for the application's current status and reschedule its reminders,
+    in the caller's transaction. No-op when the status did not actually change.
+    """
+    if from_status == application.status:
+        return
+    db.add(ApplicationStatusEvent(
+        user_id=application.user_id,
+        application_id=application.id,
+        from_status=from_status,
+        to_status=application.status
+    ))
+    reminder_scheduler.on_status_change(db, application, from_status)
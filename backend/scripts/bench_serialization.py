@@ -0,0 +1,65 @@
+"""
+Benchmark list serialization: the Pydantic/ORM path against the row-tuple + orjson path.
+
+Usage (from backend/):
+    python -m scripts.bench_serialization --rows 5000 --repeat 20
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List
+from pydantic import TypeAdapter
+from app.models.application import ApplicationStatus
+from app.schemas.application import ApplicationListResponse, APPLICATION_LIST_FIELDS
+from app.api.serialization import dump_rows
+
+class FakeApplication:
+    """Stand-in for an ORM row with the attributes the list response reads"""
+    def __init__(self, i: int):
+        self.id = uuid.uuid4()
+        self.company_name = f"Company {i}"
+        self.job_title = "Backend Engineer"
+        self.location = "Remote"
+        self.date_applied = date(2025, 1, 1) + timedelta(days=i % 365)
+        self.status = ApplicationStatus.applied
+        self.job_description = "Python Kafka Redis " * 200
+        self.updated_at = datetime(2025, 1, 1)
+
+def pydantic_path(objects) -> bytes:
+    adapter = TypeAdapter(List[ApplicationListResponse])
+    items = adapter.validate_python(objects, from_attributes=True)
+    return json.dumps(adapter.dump_python(items, mode="json")).encode()
+
+def orjson_path(rows) -> bytes:
+    return dump_rows(rows, APPLICATION_LIST_FIELDS)
+
+def timeit(fn, arg, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    objects = [FakeApplication(i) for i in range(args.rows)]
+    rows = [tuple(getattr(o, field) for field in APPLICATION_LIST_FIELDS) for o in objects]
+
+    # Same payload either way (the list endpoint only adds fit_score when sorting by fit)
+    expected = [{k: v for k, v in item.items() if k != "fit_score"} for item in json.loads(pydantic_path(objects))]
+    assert expected == json.loads(orjson_path(rows))
+
+    slow = timeit(pydantic_path, objects, args.repeat)
+    fast = timeit(orjson_path, rows, args.repeat)
+    print(f"rows={args.rows}")
+    print(f"pydantic + json : {slow * 1000:8.2f} ms  ({args.rows / slow:,.0f} rows/s)")
+    print(f"rows + orjson   : {fast * 1000:8.2f} ms  ({args.rows / fast:,.0f} rows/s)")
+    print(f"speedup         : {slow / fast:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Test configuration: the app runs against TEST_DATABASE_URL (a scratch Postgres database),
+or a temporary SQLite file when it is not set. Routes that need Postgres-only SQL are
+skipped on SQLite. Query statistics run in strict mode, so a route that goes over its
+@query_budget fails its test with QueryBudgetExceeded.
+"""
+import os
+import tempfile
+
+_sqlite_path = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{_sqlite_path}")
+os.environ["QUERY_STATS_ENABLED"] = "true"
+os.environ["QUERY_BUDGET_STRICT"] = "true"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
+os.environ.setdefault("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import BigInteger
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from app.core.database import Base, SessionLocal, engine
+from app.core.security import create_access_token
+from app.models import User
+
+# SQLite stand-ins for the Postgres column types
+@compiles(UUID, "sqlite")
+def _uuid(type_, compiler, **kw):
+    return "CHAR(32)"
+
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _json(type_, compiler, **kw):
+    return "TEXT"
+
+@compiles(BigInteger, "sqlite")
+def _big_integer(type_, compiler, **kw):
+    return "INTEGER"  # SQLite only auto-increments INTEGER PRIMARY KEY
+
+POSTGRES = engine.dialect.name == "postgresql"
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    # change_log defaults to a Postgres function; nothing tested on SQLite writes to it
+    tables = [table for name, table in Base.metadata.tables.items() if POSTGRES or name != "change_log"]
+    if not POSTGRES:
+        # Partial indexes (one active resume, pending reminders) keep their WHERE clause
+        for table in tables:
+            for index in table.indexes:
+                index.dialect_options["sqlite"]["where"] = index.dialect_options["postgresql"]["where"]
+    Base.metadata.create_all(engine, tables=tables)
+    yield
+    Base.metadata.drop_all(engine, tables=tables)
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), email=f"{uuid.uuid4().hex}@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+@pytest.fixture
+def client(user):
+    from app.main import app
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': user.email})}"
+    return client
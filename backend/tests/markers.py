@@ -0,0 +1,4 @@
+import pytest
+from app.core.database import engine
+
+requires_postgres = pytest.mark.skipif(engine.dialect.name != "postgresql", reason="needs TEST_DATABASE_URL (Postgres-only SQL)")
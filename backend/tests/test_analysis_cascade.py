@@ -0,0 +1,9 @@
+from app.core.config import settings
+from app.services.analysis_cascade import analysis_cascade
+
+def test_low_similarity_needs_confidence_to_skip_the_llm():
+    unrelated = {"similarity": settings.CASCADE_LOCAL_MIN_SIMILARITY / 2, "match_score": 40}
+
+    assert analysis_cascade._local_is_decisive({**unrelated, "confidence": settings.CASCADE_LOCAL_MIN_CONFIDENCE})
+    # Too few recognisable skills to trust the vocabulary overlap either way
+    assert not analysis_cascade._local_is_decisive({**unrelated, "confidence": settings.CASCADE_LOCAL_MIN_CONFIDENCE / 2})
@@ -0,0 +1,135 @@
+"""Job page fetching against a local stub server"""
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from app.core.config import settings
+from app.services.job_page_fetcher import JobPageFetcher, UnsafeURL, _PublicAddressBackend
+
+DESCRIPTION = "<p>We are hiring a backend engineer.</p><ul>" + "<li>Python, Kafka and Redis in production</li>" * 10 + "</ul>"
+PAGE = f"""<html><head><script type="application/ld+json">
+{json.dumps({"@context": "https://schema.org", "@type": "JobPosting", "title": "Backend Engineer", "description": DESCRIPTION})}
+</script></head><body><nav>Home | Jobs</nav><h1>Backend Engineer</h1></body></html>""".encode()
+ETAG = '"posting-v1"'
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves PAGE with an ETag (304 when it matches); /moved redirects to `localhost`"""
+    in_flight = 0
+    max_in_flight = 0
+    conditional_requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(0.05)
+            if self.path == "/moved":
+                self.send_response(302)
+                self.send_header("Location", f"http://localhost:{self.server.server_port}/jobs/1")
+                self.end_headers()
+                return
+            cls.conditional_requests.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(PAGE)))
+            self.end_headers()
+            self.wfile.write(PAGE)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_url(monkeypatch):
+    monkeypatch.setattr(settings, "ENRICHMENT_ALLOW_PRIVATE_HOSTS", True)  # the stub listens on localhost
+    StubHandler.max_in_flight = 0
+    StubHandler.conditional_requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+def fetch(*calls):
+    """Run fetcher calls (fetcher -> coroutine) in order on one fetcher; return their results"""
+    async def run():
+        fetcher = JobPageFetcher()
+        try:
+            return [await call(fetcher) for call in calls]
+        finally:
+            await fetcher.aclose()
+    return asyncio.run(run())
+
+def test_extracts_json_ld_description(stub_url):
+    [page] = fetch(lambda fetcher: fetcher.fetch(f"{stub_url}/jobs/1"))
+
+    assert "backend engineer" in page["text"]
+    assert "Home | Jobs" not in page["text"]
+    assert page["etag"] == ETAG
+
+def test_revalidates_with_etag(stub_url):
+    page, revalidated = fetch(
+        lambda fetcher: fetcher.fetch(f"{stub_url}/jobs/1"),
+        lambda fetcher: fetcher.fetch(f"{stub_url}/jobs/1", {"text": "cached", "etag": ETAG, "last_modified": None}),
+    )
+
+    assert page["text"]
+    assert revalidated["text"] == "cached"
+
+def test_redirect_to_another_host_drops_validators(stub_url):
+    [page] = fetch(lambda fetcher: fetcher.fetch(f"{stub_url}/moved", {"text": "cached", "etag": ETAG, "last_modified": None}))
+
+    assert page["text"] != "cached"
+    assert StubHandler.conditional_requests == [None]
+
+def test_limits_concurrency_per_host(stub_url):
+    urls = [f"{stub_url}/jobs/{i}" for i in range(12)]
+    [pages] = fetch(lambda fetcher: fetcher.fetch_many(urls))
+
+    assert all(pages.values())
+    assert StubHandler.max_in_flight <= settings.ENRICHMENT_PER_DOMAIN_CONCURRENCY
+
+def test_refuses_private_addresses(stub_url, monkeypatch):
+    monkeypatch.setattr(settings, "ENRICHMENT_ALLOW_PRIVATE_HOSTS", False)
+
+    with pytest.raises(UnsafeURL):
+        fetch(lambda fetcher: fetcher.fetch(f"{stub_url}/jobs/1"))
+    assert StubHandler.conditional_requests == []
+
+@pytest.mark.parametrize("address, allowed", [("93.184.216.34", True), ("10.0.0.5", False)])
+def test_connects_to_the_checked_address(monkeypatch, address, allowed):
+    """The address that passed the check is the one connected to; the host is not resolved again"""
+    resolved, connected = [], []
+
+    async def getaddrinfo(host, port, **kwargs):
+        resolved.append(host)
+        return [(None, None, None, "", (address, port))]
+
+    class Backend:
+        async def connect_tcp(self, host, port, *args):
+            connected.append(host)
+
+    async def connect():
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+        await _PublicAddressBackend(Backend()).connect_tcp("jobs.example.com", 443)
+
+    if allowed:
+        asyncio.run(connect())
+        assert connected == [address]
+    else:
+        with pytest.raises(UnsafeURL):
+            asyncio.run(connect())
+        assert connected == []
+    assert resolved == ["jobs.example.com"]
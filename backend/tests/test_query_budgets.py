@@ -0,0 +1,109 @@
+"""Every @query_budget route stays within its budget (QUERY_BUDGET_STRICT is on, see conftest)"""
+import uuid
+from datetime import date, datetime, timedelta
+import pytest
+from fastapi.routing import APIRoute
+from app.models import (
+    AIAnalysis, AnalysisStatus, Application, ApplicationStatus, ApplicationStatusEvent,
+    Interaction, InteractionType, Reminder, ReminderKind, ReminderStatus, Resume
+)
+from tests.markers import requires_postgres
+
+@pytest.fixture
+def application(db, user):
+    """An application analyzed against two resumes, with an interaction, a due reminder and its status history"""
+    resumes = [Resume(user_id=user.id, content="Python, SQL"), Resume(user_id=user.id, content="Python, SQL, FastAPI", is_active=True)]
+    db.add_all(resumes)
+    db.flush()
+    user.active_resume_id = resumes[-1].id
+
+    application = Application(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        company_name="Acme",
+        job_title="Backend Engineer",
+        job_description="Python and SQL",
+        date_applied=date.today() - timedelta(days=10),
+        status=ApplicationStatus.screening,
+        best_resume_id=resumes[-1].id,
+        best_resume_score=80
+    )
+    db.add(application)
+    db.flush()
+    for resume, score in zip(resumes, (70, 80)):
+        db.add(AIAnalysis(
+            application_id=application.id,
+            resume_id=resume.id,
+            match_score=score,
+            matching_skills={"skills": ["Python"]},
+            missing_skills={"skills": ["Go"]},
+            analysis_status=AnalysisStatus.completed
+        ))
+    db.add(Interaction(application_id=application.id, interaction_type=InteractionType.phone_screen, interaction_date=date.today()))
+    db.add(Reminder(
+        user_id=user.id,
+        application_id=application.id,
+        kind=ReminderKind.stale_application,
+        status=ReminderStatus.due,
+        due_at=datetime.utcnow() - timedelta(hours=1)
+    ))
+    for from_status, to_status in ((None, ApplicationStatus.applied), (ApplicationStatus.applied, ApplicationStatus.screening)):
+        db.add(ApplicationStatusEvent(user_id=user.id, application_id=application.id, from_status=from_status, to_status=to_status))
+    db.commit()
+    return application
+
+# (method, path, expected budget); {id} is the application fixture
+BUDGETED_ROUTES = [
+    ("GET", "/api/v1/auth/me", 2),
+    ("GET", "/api/v1/applications", 4),
+    ("GET", "/api/v1/applications?sort=fit", 4),
+    ("GET", "/api/v1/applications/{id}", 4),
+    ("GET", "/api/v1/applications/{id}/analysis", 4),
+    ("GET", "/api/v1/applications/{id}/analyses", 4),
+    ("GET", "/api/v1/resumes", 3),
+    ("GET", "/api/v1/resumes/active", 3),
+    ("GET", "/api/v1/reminders", 3),
+    ("GET", "/api/v1/reminders?include_upcoming=true", 3),
+    pytest.param("GET", "/api/v1/analytics/summary", 6, marks=requires_postgres),
+    pytest.param("GET", "/api/v1/analytics/funnel", 3, marks=requires_postgres),
+    pytest.param("GET", "/api/v1/analytics/conversion", 3, marks=requires_postgres),
+    pytest.param("GET", "/api/v1/analytics/time-in-stage", 3, marks=requires_postgres),
+    pytest.param("GET", "/api/v1/sync", 10, marks=requires_postgres),
+]
+
+@pytest.mark.parametrize("method, path, budget", BUDGETED_ROUTES)
+def test_route_stays_within_budget(client, application, method, path, budget):
+    response = client.request(method, path.format(id=application.id))
+
+    assert response.status_code == 200, response.text
+    assert int(response.headers["X-Query-Count"]) <= budget
+
+@requires_postgres
+def test_bulk_create_stays_within_budget(client):
+    items = [
+        {"client_id": str(i), "company_name": "Acme", "job_title": f"Engineer {i}", "job_url": f"https://jobs.example.com/{i}", "date_applied": "2026-02-01"}
+        for i in range(25)
+    ]
+    client.post("/api/v1/applications/bulk", json={"items": items})
+    # The retry of a saved batch returns the existing applications
+    response = client.post("/api/v1/applications/bulk", json={"items": items})
+
+    assert response.status_code == 200, response.text
+    assert int(response.headers["X-Query-Count"]) <= 8
+
+def test_declared_budgets_match_the_tests():
+    """A new or changed @query_budget needs its entry above"""
+    from app.main import app
+
+    declared = {
+        (method, route.path): route.endpoint.query_budget
+        for route in app.routes
+        if isinstance(route, APIRoute) and hasattr(route.endpoint, "query_budget")
+        for method in route.methods
+    }
+    tested = {("POST", "/api/v1/applications/bulk"): 8}
+    for entry in BUDGETED_ROUTES:
+        method, path, budget = entry.values if hasattr(entry, "values") else entry
+        tested[(method, path.split("?")[0].replace("{id}", "{application_id}"))] = budget
+
+    assert tested == declared
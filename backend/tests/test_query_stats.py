@@ -0,0 +1,16 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from app.core.database import engine
+from app.core.query_stats import instrument_queries, track_queries
+
+def test_failed_statement_leaves_no_start_time():
+    instrument_queries()
+    with engine.connect() as conn, track_queries() as stats:
+        with pytest.raises(DBAPIError):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        conn.rollback()
+        conn.execute(text("SELECT 1"))
+
+        assert conn.info["query_started_at"] == []
+        assert stats.count == 1
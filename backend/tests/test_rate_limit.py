@@ -0,0 +1,28 @@
+import uuid
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from app.api.rate_limit import ROUTE_BULK, charge_items, classify
+from app.core.config import settings
+from app.core.security import create_access_token
+
+def bulk_request(email: str) -> Request:
+    token = create_access_token({"sub": email})
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/applications/bulk",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234),
+    })
+
+def test_bulk_create_is_charged_per_item(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    request = bulk_request(f"{uuid.uuid4().hex}@example.com")
+
+    assert classify("POST", "/api/v1/applications/bulk") == ROUTE_BULK
+    charge_items(request, settings.RATE_LIMIT_BULK_ITEMS_BURST)
+    with pytest.raises(HTTPException) as rejected:
+        charge_items(request, 1)
+    assert rejected.value.status_code == 429
+    assert int(rejected.value.headers["Retry-After"]) >= 1
@@ -0,0 +1,41 @@
+import uuid
+from datetime import date, datetime, timedelta
+from app.core.config import settings
+from app.models import AIAnalysis, AnalysisStatus, Application, ApplicationStatus, Resume
+from app.services.reanalysis_planner import reanalysis_planner
+
+def test_plans_missing_failed_and_stuck_pairs(db, user):
+    resume = Resume(user_id=user.id, content="Python", is_active=True)
+    db.add(resume)
+    db.flush()
+
+    stale = datetime.utcnow() - timedelta(seconds=settings.REANALYSIS_PENDING_STALE_SECONDS + 60)
+    analyses = {
+        "missing": None,
+        "failed": (AnalysisStatus.failed, datetime.utcnow()),
+        "stuck": (AnalysisStatus.pending, stale),
+        "pending": (AnalysisStatus.pending, datetime.utcnow()),
+        "completed": (AnalysisStatus.completed, stale),
+    }
+    ids = {}
+    for name, analysis in analyses.items():
+        application = Application(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            company_name=name,
+            job_title="Engineer",
+            job_description="Python",
+            date_applied=date(2026, 1, 5),
+            status=ApplicationStatus.applied
+        )
+        db.add(application)
+        db.flush()
+        ids[str(application.id)] = name
+        if analysis:
+            status, created_at = analysis
+            db.add(AIAnalysis(application_id=application.id, resume_id=resume.id, analysis_status=status, created_at=created_at))
+    db.commit()
+
+    planned = reanalysis_planner.plan(db, user.id, resume.id)
+
+    assert sorted(ids[application_id] for application_id in planned) == ["failed", "missing", "stuck"]
@@ -0,0 +1,45 @@
+import uuid
+from datetime import date
+import pytest
+from app.models import Application, ApplicationStatus, Reminder, ReminderKind
+
+@pytest.fixture
+def make_application(db, user):
+    def make(status: ApplicationStatus) -> Application:
+        application = Application(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            company_name="Acme",
+            job_title="Backend Engineer",
+            date_applied=date(2026, 1, 5),
+            status=status
+        )
+        db.add(application)
+        db.commit()
+        return application
+    return make
+
+def log_interview(client, application):
+    response = client.post("/api/v1/interactions", json={
+        "application_id": str(application.id),
+        "interaction_type": "phone_screen",
+        "interaction_date": "2026-02-01"
+    })
+    assert response.status_code == 201, response.text
+
+@pytest.mark.parametrize("status", [ApplicationStatus.rejected, ApplicationStatus.withdrawn])
+def test_interview_on_closed_application_schedules_nothing(client, db, make_application, status):
+    application = make_application(status)
+
+    log_interview(client, application)
+
+    assert db.query(Reminder).filter(Reminder.application_id == application.id).count() == 0
+
+def test_interview_schedules_follow_up(client, db, make_application):
+    application = make_application(ApplicationStatus.interviewing)
+
+    log_interview(client, application)
+
+    reminder = db.query(Reminder).filter(Reminder.application_id == application.id).one()
+    assert reminder.kind == ReminderKind.follow_up
+    assert reminder.due_at.date() == date(2026, 2, 4)
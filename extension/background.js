@@ -1,6 +1,197 @@
 // background.js
 
-// Listen for messages from content script
+const API_URL = 'http://localhost:8000/api/v1';
+
+// Must not exceed BULK_CREATE_MAX_ITEMS on the server
+const BATCH_SIZE = 25;
+const MAX_CAPTURED = 200;
+const MIN_RETRY_SECONDS = 30;
+const MAX_RETRY_SECONDS = 30 * 60;
+const FLUSH_ALARM = 'flushOutbox';
+
+// Same identity the server dedups on: the job URL, or company/title/date without one
+function postingKey(job) {
+  if (job.job_url) {
+    return job.job_url;
+  }
+  return [job.company_name, job.job_title, job.date_applied]
+    .map(value => (value || '').trim().toLowerCase())
+    .join('|');
+}
+
+let storageQueue = Promise.resolve();
+
+// Read-modify-write of storage keys, one at a time, so concurrent updates never overwrite each other
+function updateStorage(keys, update) {
+  const run = storageQueue.then(async () => {
+    const values = await chrome.storage.local.get(keys);
+    const changes = update(values);
+    await chrome.storage.local.set(changes);
+    return changes;
+  });
+  storageQueue = run.catch(() => {});
+  return run;
+}
+
+// Remember postings seen while browsing (detail and search result pages) so they can be saved together
+async function captureJobs(jobs) {
+  const { capturedJobs } = await updateStorage(['capturedJobs'], ({ capturedJobs = {} }) => {
+    const now = new Date().toISOString();
+    jobs.forEach(job => {
+      if (job.job_url) {
+        // A detail page has more than its search result card: keep the richer fields
+        capturedJobs[job.job_url] = { ...capturedJobs[job.job_url], ...job, capturedAt: now };
+      }
+    });
+
+    // Keep the most recently seen postings
+    const keys = Object.keys(capturedJobs);
+    if (keys.length > MAX_CAPTURED) {
+      keys
+        .sort((a, b) => capturedJobs[a].capturedAt.localeCompare(capturedJobs[b].capturedAt))
+        .slice(0, keys.length - MAX_CAPTURED)
+        .forEach(key => delete capturedJobs[key]);
+    }
+    return { capturedJobs };
+  });
+  notifyPopup({ action: 'capturedJobsChanged', count: Object.keys(capturedJobs).length });
+}
+
+// Add applications to the outbox (skipping ones already queued) and try to send them
+async function queueApplications(items) {
+  const { outbox } = await updateStorage(['outbox'], ({ outbox = [] }) => {
+    const queued = new Set(outbox.map(postingKey));
+    items.forEach(item => {
+      const key = postingKey(item);
+      if (!queued.has(key)) {
+        queued.add(key);
+        outbox.push({ ...item, client_id: crypto.randomUUID() });
+      }
+    });
+    return { outbox };
+  });
+  notifyPopup({ action: 'outboxChanged', pending: outbox.length });
+  flushOutbox();
+}
+
+// Items of a batch named by a 422 response (`loc` is ["body", "items", index, ...]), or null without per-item errors
+async function invalidItems(response, batch) {
+  let detail;
+  try {
+    detail = (await response.json()).detail;
+  } catch (error) {
+    return null;
+  }
+  if (!Array.isArray(detail)) {
+    return null;
+  }
+  const indexes = new Set(detail
+    .map(error => error.loc || [])
+    .filter(loc => loc[1] === 'items' && Number.isInteger(loc[2]))
+    .map(loc => loc[2]));
+  return indexes.size ? batch.filter((item, index) => indexes.has(index)) : null;
+}
+
+async function scheduleRetry(seconds) {
+  await chrome.alarms.create(FLUSH_ALARM, { delayInMinutes: Math.max(seconds, MIN_RETRY_SECONDS) / 60 });
+}
+
+let flushing = false;
+
+// Send the outbox to POST /applications/bulk in batches; keeps everything queued on failure
+async function flushOutbox() {
+  if (flushing) {
+    return;
+  }
+  flushing = true;
+
+  try {
+    const { token, retrySeconds } = await chrome.storage.local.get(['token', 'retrySeconds']);
+    if (!token) {
+      return;
+    }
+
+    while (true) {
+      const { outbox = [] } = await chrome.storage.local.get(['outbox']);
+      if (outbox.length === 0) {
+        await chrome.storage.local.remove('retrySeconds');
+        return;
+      }
+
+      const batch = outbox.slice(0, BATCH_SIZE);
+      let response;
+      try {
+        response = await fetch(`${API_URL}/applications/bulk`, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            'Authorization': `Bearer ${token}`
+          },
+          body: JSON.stringify({ items: batch.map(({ capturedAt, scraped, source, ...item }) => item) })
+        });
+      } catch (error) {
+        response = null;
+      }
+
+      // Logged out or token expired: wait for the next login
+      if (response && response.status === 401) {
+        return;
+      }
+
+      // Rate limited: the server says when to come back
+      if (response && response.status === 429) {
+        await scheduleRetry(Number(response.headers.get('Retry-After')) || MIN_RETRY_SECONDS);
+        return;
+      }
+
+      // Offline or server error: back off exponentially; items stay queued and are deduped on retry
+      if (!response || response.status >= 500) {
+        const delay = Math.min((retrySeconds || MIN_RETRY_SECONDS / 2) * 2, MAX_RETRY_SECONDS);
+        await chrome.storage.local.set({ retrySeconds: delay });
+        await scheduleRetry(delay);
+        return;
+      }
+
+      let sent = [];
+      let rejected = [];
+      if (response.ok) {
+        const data = await response.json();
+        const saved = new Set(data.results.map(result => result.client_id));
+        sent = batch.filter(item => saved.has(item.client_id));
+      } else {
+        // Validation error: set the invalid items aside (the rest go out again on the next pass),
+        // or the whole batch when the server didn't say which items, rather than blocking the queue
+        rejected = (await invalidItems(response, batch)) || batch;
+      }
+
+      // Re-read under the storage queue: items queued or captured while the request was in flight stay
+      const finished = new Set(sent.concat(rejected).map(item => item.client_id));
+      const { outbox: remaining } = await updateStorage(
+        ['outbox', 'capturedJobs', 'rejectedApplications'],
+        ({ outbox = [], capturedJobs = {}, rejectedApplications = [] }) => {
+          sent.forEach(item => { if (item.job_url) delete capturedJobs[item.job_url]; });
+          return {
+            outbox: outbox.filter(item => !finished.has(item.client_id)),
+            capturedJobs,
+            rejectedApplications: rejectedApplications.concat(rejected)
+          };
+        }
+      );
+      await chrome.storage.local.remove('retrySeconds');
+      notifyPopup({ action: 'outboxChanged', pending: remaining.length });
+    }
+  } finally {
+    flushing = false;
+  }
+}
+
+function notifyPopup(message) {
+  chrome.runtime.sendMessage(message).catch(() => {
+    // Popup might not be open, that's okay
+  });
+}
+
+// Listen for messages from content script and popup
 chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
   if (request.action === 'jobDataExtracted') {
     console.log('Job data received in background:', request.data);
@@ -13,17 +204,33 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
       console.log('Job data stored');
       
       // Notify popup if it's open
-      chrome.runtime.sendMessage({
+      notifyPopup({
         action: 'jobDataReady',
         data: request.data
-      }).catch(() => {
-        // Popup might not be open, that's okay
       });
     });
+    captureJobs([request.data]);
     
+    sendResponse({ success: true });
+  } else if (request.action === 'jobListExtracted') {
+    captureJobs(request.data);
+    sendResponse({ success: true });
+  } else if (request.action === 'queueApplications') {
+    queueApplications(request.items).then(() => sendResponse({ success: true }));
+  } else if (request.action === 'flushOutbox') {
+    flushOutbox();
     sendResponse({ success: true });
   }
   return true;
 });
 
-console.log('Job Tracker extension loaded');
\ No newline at end of file
+// Retry after a backoff or rate limit, and whenever the browser comes back online
+chrome.alarms.onAlarm.addListener((alarm) => {
+  if (alarm.name === FLUSH_ALARM) {
+    flushOutbox();
+  }
+});
+self.addEventListener('online', flushOutbox);
+chrome.runtime.onStartup.addListener(flushOutbox);
+
+console.log('Job Tracker extension loaded');
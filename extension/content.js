@@ -1,3 +1,9 @@
+// Canonical LinkedIn posting URL, e.g. https://www.linkedin.com/jobs/view/123/
+function canonicalJobUrl(url) {
+  const match = url.match(/\/jobs\/view\/(\d+)/) || url.match(/currentJobId=(\d+)/);
+  return match ? `https://www.linkedin.com/jobs/view/${match[1]}/` : url;
+}
+
 function extractLinkedInJobData() {
   try {
     // Wait for page to load
@@ -41,8 +47,8 @@ function extractLinkedInJobData() {
           }
         });
         
-        // Current URL
-        const jobUrl = window.location.href;
+        // Current URL, without tracking parameters so the same posting always dedups
+        const jobUrl = canonicalJobUrl(window.location.href);
         
         const jobData = {
           company_name: companyName,
@@ -74,11 +80,59 @@ function extractLinkedInJobData() {
   }
 }
 
+// Capture every posting card on search result and collection pages (no description there)
+function extractLinkedInJobList() {
+  const jobs = [];
+  document.querySelectorAll('[data-job-id], [data-occludable-job-id]').forEach(card => {
+    const jobId = card.getAttribute('data-job-id') || card.getAttribute('data-occludable-job-id');
+    const jobTitle = card.querySelector('.job-card-list__title, .job-card-container__link')?.innerText?.trim();
+    const companyName = card.querySelector('.job-card-container__primary-description, .artdeco-entity-lockup__subtitle')?.innerText?.trim();
+    if (!jobId || !jobTitle || !companyName) {
+      return;
+    }
+
+    jobs.push({
+      company_name: companyName,
+      job_title: jobTitle.split('\n')[0],
+      job_url: `https://www.linkedin.com/jobs/view/${jobId}/`,
+      location: card.querySelector('.job-card-container__metadata-item')?.innerText?.trim() || null,
+      scraped: true,
+      source: 'linkedin'
+    });
+  });
+
+  if (jobs.length > 0) {
+    console.log(`LinkedIn job list extracted: ${jobs.length} postings`);
+    chrome.runtime.sendMessage({
+      action: 'jobListExtracted',
+      data: jobs
+    });
+  }
+}
+
+function isJobListPage(url) {
+  return url.includes('/jobs/search') || url.includes('/jobs/collections');
+}
+
+// Result lists load lazily while scrolling: re-scan shortly after the page stops changing
+let listScanTimer = null;
+function scheduleListScan() {
+  clearTimeout(listScanTimer);
+  listScanTimer = setTimeout(extractLinkedInJobList, 1500);
+}
+
 // Run extraction when page loads
+function extractOnLoad() {
+  if (isJobListPage(location.href)) {
+    scheduleListScan();
+  }
+  extractLinkedInJobData();
+}
+
 if (document.readyState === 'loading') {
-  document.addEventListener('DOMContentLoaded', extractLinkedInJobData);
+  document.addEventListener('DOMContentLoaded', extractOnLoad);
 } else {
-  extractLinkedInJobData();
+  extractOnLoad();
 }
 
 // Listen for URL changes (LinkedIn is SPA)
@@ -91,4 +145,7 @@ new MutationObserver(() => {
       setTimeout(extractLinkedInJobData, 2000);
     }
   }
+  if (isJobListPage(url)) {
+    scheduleListScan();
+  }
 }).observe(document, { subtree: true, childList: true });
\ No newline at end of file
@@ -23,6 +23,10 @@ const resumeFilename = document.getElementById('resume-filename');
 // Job elements
 const saveJobBtn = document.getElementById('save-job-btn');
 const jobStatus = document.getElementById('job-status');
+const capturedJobs = document.getElementById('captured-jobs');
+const capturedCount = document.getElementById('captured-count');
+const saveCapturedBtn = document.getElementById('save-captured-btn');
+const queueStatus = document.getElementById('queue-status');
 
 // Check for scraped job data when popup opens
 chrome.storage.local.get(['scrapedJobData', 'scrapedAt'], (result) => {
@@ -51,6 +55,10 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
     jobStatus.style.color = 'green';
     
     sendResponse({ success: true });
+  } else if (request.action === 'capturedJobsChanged') {
+    showCapturedCount(request.count);
+  } else if (request.action === 'outboxChanged') {
+    showQueueStatus(request.pending);
   }
   return true;
 });
@@ -105,9 +113,15 @@ chrome.storage.local.get(['token', 'hasResume'], (result) => {
     if (result.hasResume) {
       showResumeUploaded(result.hasResume);
     }
+    syncReplica(result.token);
   }
 });
 
+chrome.storage.local.get(['capturedJobs', 'outbox'], (result) => {
+  showCapturedCount(Object.keys(result.capturedJobs || {}).length);
+  showQueueStatus((result.outbox || []).length);
+});
+
 // Login
 loginBtn.addEventListener('click', async () => {
   const email = emailInput.value;
@@ -128,6 +142,9 @@ loginBtn.addEventListener('click', async () => {
     chrome.storage.local.set({ token: data.access_token }, () => {
       showMainSection();
       checkForResume(data.access_token);
+      syncReplica(data.access_token);
+      // Send anything queued while logged out
+      chrome.runtime.sendMessage({ action: 'flushOutbox' });
     });
   } catch (error) {
     authError.textContent = 'Invalid email or password';
@@ -239,48 +256,53 @@ saveJobBtn.addEventListener('click', async () => {
     return;
   }
   
-  chrome.storage.local.get(['token'], async (result) => {
-    try {
-      jobStatus.textContent = 'Saving...';
-      jobStatus.style.color = 'blue';
-      
-      const response = await fetch(`${API_URL}/applications`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${result.token}`
-        },
-        body: JSON.stringify({
-          company_name: company,
-          job_title: jobTitle,
-          job_url: jobUrl || null,
-          job_description: jobDescription || null,
-          location: location || null,
-          salary_range: salary || null,
-          date_applied: dateApplied,
-          notes: null
-        })
-      });
-      
-      if (!response.ok) {
-        throw new Error('Save failed');
-      }
-      
-      jobStatus.textContent = 'Application saved! AI analysis in progress...';
-      jobStatus.style.color = 'green';
-      
-      // Clear form
-      document.getElementById('company').value = '';
-      document.getElementById('job-title').value = '';
-      document.getElementById('job-url').value = '';
-      document.getElementById('job-description').value = '';
-      document.getElementById('location').value = '';
-      document.getElementById('salary').value = '';
-    } catch (error) {
-      jobStatus.textContent = 'Failed to save. Try again.';
-      jobStatus.style.color = 'red';
-    }
+  // Queued in the background and sent in batches, so this works offline too
+  await chrome.runtime.sendMessage({
+    action: 'queueApplications',
+    items: [{
+      company_name: company,
+      job_title: jobTitle,
+      job_url: jobUrl || null,
+      job_description: jobDescription || null,
+      location: location || null,
+      salary_range: salary || null,
+      date_applied: dateApplied,
+      notes: null
+    }]
   });
+  
+  jobStatus.textContent = 'Application saved! AI analysis will follow once synced.';
+  jobStatus.style.color = 'green';
+  
+  // Clear form
+  document.getElementById('company').value = '';
+  document.getElementById('job-title').value = '';
+  document.getElementById('job-url').value = '';
+  document.getElementById('job-description').value = '';
+  document.getElementById('location').value = '';
+  document.getElementById('salary').value = '';
+});
+
+// Save every posting captured while browsing, applied today
+saveCapturedBtn.addEventListener('click', async () => {
+  const { capturedJobs: captured = {} } = await chrome.storage.local.get(['capturedJobs']);
+  const today = new Date().toISOString().split('T')[0];
+  const items = Object.values(captured).map(job => ({
+    company_name: job.company_name,
+    job_title: job.job_title,
+    job_url: job.job_url,
+    job_description: job.job_description || null,
+    location: job.location || null,
+    salary_range: job.salary_range || null,
+    date_applied: today,
+    notes: null
+  }));
+  
+  if (items.length > 0) {
+    await chrome.runtime.sendMessage({ action: 'queueApplications', items });
+    jobStatus.textContent = `${items.length} applications saved!`;
+    jobStatus.style.color = 'green';
+  }
 });
 
 // Helper functions
@@ -289,6 +311,15 @@ function showMainSection() {
   mainSection.style.display = 'block';
 }
 
+function showCapturedCount(count) {
+  capturedJobs.style.display = count > 0 ? 'block' : 'none';
+  capturedCount.textContent = `${count} postings captured while browsing`;
+}
+
+function showQueueStatus(pending) {
+  queueStatus.textContent = pending > 0 ? `${pending} waiting to sync` : '';
+}
+
 function showResumeUploaded(filename) {
   noResume.style.display = 'none';
   hasResume.style.display = 'block';
@@ -311,5 +342,66 @@ async function checkForResume(token) {
   }
 }
 
+// Keep a local copy of the user's data up to date with /sync: the first call returns
+// everything, later calls only what changed since the stored cursor
+const SYNC_FIELDS = ['applications', 'analyses', 'resumes', 'interactions'];
+
+async function syncReplica(token) {
+  const stored = await chrome.storage.local.get(['syncCursor', 'replica']);
+  let cursor = stored.syncCursor;
+  let replica = stored.replica || {};
+
+  try {
+    let hasMore = true;
+    while (hasMore) {
+      const url = cursor ? `${API_URL}/sync?since=${encodeURIComponent(cursor)}` : `${API_URL}/sync`;
+      const response = await fetch(url, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+
+      // Unusable cursor: start over with a full sync next time
+      if (response.status === 400) {
+        await chrome.storage.local.remove(['syncCursor', 'replica']);
+        return;
+      }
+      if (!response.ok) {
+        return;
+      }
+
+      const data = await response.json();
+      if (data.full) {
+        replica = {};
+      }
+      replica = applySyncChanges(replica, data);
+      cursor = data.cursor;
+      hasMore = data.has_more;
+    }
+
+    await chrome.storage.local.set({ syncCursor: cursor, replica });
+  } catch (error) {
+    // Offline: keep the last replica and retry on the next popup open
+  }
+}
+
+function applySyncChanges(replica, data) {
+  const next = {};
+  SYNC_FIELDS.forEach(field => {
+    next[field] = { ...(replica[field] || {}) };
+    data[field].forEach(item => { next[field][item.id] = item; });
+    data.deleted[field].forEach(id => { delete next[field][id]; });
+  });
+
+  // Children of a deleted application are not reported separately
+  const deletedApplications = new Set(data.deleted.applications);
+  ['analyses', 'interactions'].forEach(field => {
+    Object.values(next[field]).forEach(item => {
+      if (deletedApplications.has(item.application_id)) {
+        delete next[field][item.id];
+      }
+    });
+  });
+  return next;
+}
+
 // Set today's date as default
 document.getElementById('date-applied').valueAsDate = new Date();
\ No newline at end of file